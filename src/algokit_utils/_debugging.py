@@ -2,6 +2,7 @@ import base64
 import json
 import logging
 import typing
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
@@ -9,7 +10,9 @@ from pathlib import Path
 from algosdk.atomic_transaction_composer import (
     AtomicTransactionComposer,
     EmptySigner,
+    SimulateABIResult,
     SimulateAtomicTransactionResponse,
+    SimulateEvalOverrides,
 )
 from algosdk.encoding import checksum
 from algosdk.v2client.models import SimulateRequest, SimulateRequestTransactionGroup, SimulateTraceConfig
@@ -18,8 +21,11 @@ from algokit_utils._legacy_v2.common import Program
 from algokit_utils.models.application import CompiledTeal
 
 if typing.TYPE_CHECKING:
+    from algosdk.transaction import SuggestedParams
     from algosdk.v2client.algod import AlgodClient
 
+    from algokit_utils.clients.async_algod_client import AsyncAlgodClient
+
 logger = logging.getLogger(__name__)
 
 ALGOKIT_DIR = ".algokit"
@@ -240,15 +246,124 @@ def simulate_response(
 ) -> SimulateAtomicTransactionResponse:
     """Simulate atomic transaction group execution"""
 
+    simulate_request = _build_simulate_request(
+        atc,
+        allow_more_logs,
+        allow_empty_signatures,
+        allow_unnamed_resources,
+        extra_opcode_budget,
+        exec_trace_config,
+        simulation_round,
+    )
+
+    return atc.simulate(algod_client, simulate_request)
+
+
+def simulate_responses(
+    atcs: typing.Sequence[AtomicTransactionComposer],
+    algod_client: "AlgodClient",
+    allow_more_logs: bool | None = None,
+    allow_empty_signatures: bool | None = None,
+    allow_unnamed_resources: bool | None = None,
+    extra_opcode_budget: int | None = None,
+    exec_trace_config: SimulateTraceConfig | None = None,
+    simulation_round: int | None = None,
+    *,
+    max_groups_per_request: int = 1,
+    max_workers: int = 8,
+) -> list[SimulateAtomicTransactionResponse]:
+    """Simulate many independent atomic transaction groups.
+
+    Groups are packed into simulate requests of up to `max_groups_per_request` groups each, the requests are sent
+    concurrently and the response of each request is split back into one response per group.
+
+    :param atcs: The atomic transaction composers to simulate, each holding one group
+    :param algod_client: Algorand client instance
+    :param allow_more_logs: Flag to allow additional logs, defaults to None
+    :param allow_empty_signatures: Flag to allow empty signatures, defaults to None
+    :param allow_unnamed_resources: Flag to allow unnamed resources, defaults to None
+    :param extra_opcode_budget: Additional opcode budget, defaults to None
+    :param exec_trace_config: Execution trace configuration, defaults to None
+    :param simulation_round: Round number for simulation, defaults to None
+    :param max_groups_per_request: Maximum number of groups to send in a single simulate request, defaults to 1
+    :param max_workers: Maximum number of simulate requests to have in flight at once, defaults to 8
+    :return: The simulate response of each group, in the same order as `atcs`
+    """
+    if max_groups_per_request < 1:
+        raise ValueError("max_groups_per_request must be at least 1")
+    if not atcs:
+        return []
+
+    # Mirrors `atc.simulate`, which simulates with whatever signatures the group's signers produce
+    signed_groups = [SimulateRequestTransactionGroup(txns=atc.gather_signatures()) for atc in atcs]
+    batches = [
+        list(range(start, min(start + max_groups_per_request, len(atcs))))
+        for start in range(0, len(atcs), max_groups_per_request)
+    ]
+
+    def simulate_batch(batch: list[int]) -> list[SimulateAtomicTransactionResponse]:
+        simulate_request = _build_simulate_request_for_groups(
+            [signed_groups[i] for i in batch],
+            allow_more_logs,
+            allow_empty_signatures,
+            allow_unnamed_resources,
+            extra_opcode_budget,
+            exec_trace_config,
+            simulation_round,
+        )
+        simulation_result = typing.cast(dict[str, typing.Any], algod_client.simulate_transactions(simulate_request))
+        return [
+            _parse_simulate_response(
+                atcs[i], {**simulation_result, "txn-groups": [simulation_result["txn-groups"][group_index]]}
+            )
+            for group_index, i in enumerate(batch)
+        ]
+
+    if len(batches) == 1:
+        return simulate_batch(batches[0])
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(batches))) as executor:
+        return [response for responses in executor.map(simulate_batch, batches) for response in responses]
+
+
+def _build_simulate_request(
+    atc: AtomicTransactionComposer,
+    allow_more_logs: bool | None = None,
+    allow_empty_signatures: bool | None = None,
+    allow_unnamed_resources: bool | None = None,
+    extra_opcode_budget: int | None = None,
+    exec_trace_config: SimulateTraceConfig | None = None,
+    simulation_round: int | None = None,
+) -> SimulateRequest:
     unsigned_txn_groups = atc.build_group()
     empty_signer = EmptySigner()
     txn_list = [txn_group.txn for txn_group in unsigned_txn_groups]
     fake_signed_transactions = empty_signer.sign_transactions(txn_list, [])
-    txn_group = [SimulateRequestTransactionGroup(txns=fake_signed_transactions)]
+
+    return _build_simulate_request_for_groups(
+        [SimulateRequestTransactionGroup(txns=fake_signed_transactions)],
+        allow_more_logs,
+        allow_empty_signatures,
+        allow_unnamed_resources,
+        extra_opcode_budget,
+        exec_trace_config,
+        simulation_round,
+    )
+
+
+def _build_simulate_request_for_groups(
+    txn_groups: list[SimulateRequestTransactionGroup],
+    allow_more_logs: bool | None = None,
+    allow_empty_signatures: bool | None = None,
+    allow_unnamed_resources: bool | None = None,
+    extra_opcode_budget: int | None = None,
+    exec_trace_config: SimulateTraceConfig | None = None,
+    simulation_round: int | None = None,
+) -> SimulateRequest:
     trace_config = SimulateTraceConfig(enable=True, stack_change=True, scratch_change=True, state_change=True)
 
-    simulate_request = SimulateRequest(
-        txn_groups=txn_group,
+    return SimulateRequest(
+        txn_groups=txn_groups,
         allow_more_logs=allow_more_logs if allow_more_logs is not None else True,
         round=simulation_round,
         extra_opcode_budget=extra_opcode_budget if extra_opcode_budget is not None else 0,
@@ -257,10 +372,8 @@ def simulate_response(
         exec_trace_config=exec_trace_config if exec_trace_config is not None else trace_config,
     )
 
-    return atc.simulate(algod_client, simulate_request)
-
 
-def simulate_and_persist_response(
+def simulate_and_persist_response(  # noqa: PLR0913
     atc: AtomicTransactionComposer,
     project_root: Path,
     algod_client: "AlgodClient",
@@ -271,6 +384,7 @@ def simulate_and_persist_response(
     extra_opcode_budget: int | None = None,
     exec_trace_config: SimulateTraceConfig | None = None,
     simulation_round: int | None = None,
+    suggested_params: "SuggestedParams | None" = None,
 ) -> SimulateAtomicTransactionResponse:
     """Simulates atomic transactions and persists simulation response to a JSON file.
 
@@ -287,15 +401,10 @@ def simulate_and_persist_response(
     :param extra_opcode_budget: Additional opcode budget, defaults to None
     :param exec_trace_config: Execution trace configuration, defaults to None
     :param simulation_round: Round number for simulation, defa  ults to None
+    :param suggested_params: The suggested params to re-validate the transactions with, defaults to fetching them
     :return: Simulated response after persisting for AlgoKit AVM Debugger consumption
     """
-    atc_to_simulate = atc.clone()
-    sp = algod_client.suggested_params()
-
-    for txn_with_sign in atc_to_simulate.txn_list:
-        txn_with_sign.txn.first_valid_round = sp.first
-        txn_with_sign.txn.last_valid_round = sp.last
-        txn_with_sign.txn.genesis_hash = sp.gh
+    atc_to_simulate = _with_validity_from(atc, suggested_params or algod_client.suggested_params())
 
     response = simulate_response(
         atc_to_simulate,
@@ -307,6 +416,24 @@ def simulate_and_persist_response(
         exec_trace_config,
         simulation_round,
     )
+    _persist_simulate_response(response, project_root, buffer_size_mb)
+    return response
+
+
+def _with_validity_from(atc: AtomicTransactionComposer, sp: "SuggestedParams") -> AtomicTransactionComposer:
+    atc_to_simulate = atc.clone()
+
+    for txn_with_sign in atc_to_simulate.txn_list:
+        txn_with_sign.txn.first_valid_round = sp.first
+        txn_with_sign.txn.last_valid_round = sp.last
+        txn_with_sign.txn.genesis_hash = sp.gh
+
+    return atc_to_simulate
+
+
+def _persist_simulate_response(
+    response: SimulateAtomicTransactionResponse, project_root: Path, buffer_size_mb: float
+) -> None:
     txn_results = response.simulate_response["txn-groups"]
 
     txn_types = [
@@ -326,4 +453,110 @@ def simulate_and_persist_response(
     cleanup_old_trace_files(output_file.parent, buffer_size_mb)
     safe_response = prepare_simulate_response_for_avm_debugger(response.simulate_response)
     output_file.write_text(json.dumps(safe_response, indent=2))
+
+
+async def simulate_response_async(
+    atc: AtomicTransactionComposer,
+    algod_client: "AsyncAlgodClient",
+    allow_more_logs: bool | None = None,
+    allow_empty_signatures: bool | None = None,
+    allow_unnamed_resources: bool | None = None,
+    extra_opcode_budget: int | None = None,
+    exec_trace_config: SimulateTraceConfig | None = None,
+    simulation_round: int | None = None,
+) -> SimulateAtomicTransactionResponse:
+    """Simulate atomic transaction group execution without blocking the event loop"""
+
+    simulate_request = _build_simulate_request(
+        atc,
+        allow_more_logs,
+        allow_empty_signatures,
+        allow_unnamed_resources,
+        extra_opcode_budget,
+        exec_trace_config,
+        simulation_round,
+    )
+    simulation_result = typing.cast(dict[str, typing.Any], await algod_client.simulate_transactions(simulate_request))
+    return _parse_simulate_response(atc, simulation_result)
+
+
+async def simulate_and_persist_response_async(  # noqa: PLR0913
+    atc: AtomicTransactionComposer,
+    project_root: Path,
+    algod_client: "AsyncAlgodClient",
+    buffer_size_mb: float = 256,
+    allow_more_logs: bool | None = None,
+    allow_empty_signatures: bool | None = None,
+    allow_unnamed_resources: bool | None = None,
+    extra_opcode_budget: int | None = None,
+    exec_trace_config: SimulateTraceConfig | None = None,
+    simulation_round: int | None = None,
+    suggested_params: "SuggestedParams | None" = None,
+) -> SimulateAtomicTransactionResponse:
+    """Async variant of `simulate_and_persist_response`.
+
+    :param atc: AtomicTransactionComposer containing transactions to simulate and persist
+    :param project_root: Root directory path of the project
+    :param algod_client: Async algod client instance
+    :param buffer_size_mb: Size of trace buffer in megabytes, defaults to 256
+    :param allow_more_logs: Flag to allow additional logs, defaults to None
+    :param allow_empty_signatures: Flag to allow empty signatures, defaults to None
+    :param allow_unnamed_resources: Flag to allow unnamed resources, defaults to None
+    :param extra_opcode_budget: Additional opcode budget, defaults to None
+    :param exec_trace_config: Execution trace configuration, defaults to None
+    :param simulation_round: Round number for simulation, defaults to None
+    :param suggested_params: The suggested params to re-validate the transactions with, defaults to fetching them
+    :return: Simulated response after persisting for AlgoKit AVM Debugger consumption
+    """
+    atc_to_simulate = _with_validity_from(atc, suggested_params or await algod_client.suggested_params())
+
+    response = await simulate_response_async(
+        atc_to_simulate,
+        algod_client,
+        allow_more_logs,
+        allow_empty_signatures,
+        allow_unnamed_resources,
+        extra_opcode_budget,
+        exec_trace_config,
+        simulation_round,
+    )
+    _persist_simulate_response(response, project_root, buffer_size_mb)
     return response
+
+
+def _parse_simulate_response(
+    atc: AtomicTransactionComposer, simulation_result: dict[str, typing.Any]
+) -> SimulateAtomicTransactionResponse:
+    """Parse a raw simulate response for the (already built) group in the same way as `atc.simulate`"""
+    # Building the group computes the transaction IDs, or returns the already built group and its IDs
+    atc.build_group()
+    tx_ids = atc.tx_ids
+    txn_group: dict[str, typing.Any] = simulation_result["txn-groups"][0]
+    txn_results = [t["txn-result"] for t in txn_group["txn-results"]]
+
+    method_results = []
+    for method_index, method in atc.method_dict.items():
+        result = atc.parse_result(method, tx_ids[method_index], txn_results[method_index])
+        method_results.append(
+            SimulateABIResult(
+                tx_id=result.tx_id,
+                raw_value=result.raw_value,
+                return_value=result.return_value,
+                decode_error=result.decode_error,
+                tx_info=result.tx_info,
+                method=result.method,
+            )
+        )
+
+    return SimulateAtomicTransactionResponse(
+        version=simulation_result.get("version", 0),
+        failure_message=txn_group.get("failure-message", ""),
+        failed_at=txn_group.get("failed-at"),
+        simulate_response=simulation_result,
+        tx_ids=tx_ids,
+        results=method_results,
+        eval_overrides=SimulateEvalOverrides.from_simulation_result(simulation_result),
+        exec_trace_config=SimulateTraceConfig.undictify(simulation_result["exec-trace-config"])
+        if "exec-trace-config" in simulation_result
+        else None,
+    )
@@ -949,7 +949,10 @@ class AccountManager:
             get_suggested_params = _get_suggested_params
 
         return TransactionComposer(
-            algod=self._client_manager.algod, get_signer=self.get_signer, get_suggested_params=get_suggested_params
+            algod=self._client_manager.algod,
+            get_signer=self.get_signer,
+            get_suggested_params=get_suggested_params,
+            confirmation_tracker=self._client_manager.confirmation_tracker,
         )
 
     def _calculate_fund_amount(
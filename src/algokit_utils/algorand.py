@@ -1,5 +1,8 @@
+import asyncio
 import copy
 import time
+from collections.abc import Iterable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
 
 import typing_extensions
 from algosdk.atomic_transaction_composer import TransactionSigner
@@ -13,11 +16,20 @@ from algokit_utils.applications.app_deployer import AppDeployer
 from algokit_utils.applications.app_manager import AppManager
 from algokit_utils.assets.asset_manager import AssetManager
 from algokit_utils.clients.client_manager import AlgoSdkClients, ClientManager
+from algokit_utils.clients.http_transport import HttpTransportConfig
+from algokit_utils.clients.suggested_params_refresher import SuggestedParamsRefresher
 from algokit_utils.models.network import AlgoClientConfigs, AlgoClientNetworkConfig
+from algokit_utils.models.transaction import SendParams
 from algokit_utils.protocols.account import TransactionSignerAccountProtocol
+from algokit_utils.transactions.async_transaction_composer import AsyncTransactionComposer
+from algokit_utils.transactions.execution_info_cache import ExecutionInfoCache
+from algokit_utils.transactions.inner_fee_model import InnerFeeModel
+from algokit_utils.transactions.submit_retry import SubmitRetryPolicy
 from algokit_utils.transactions.transaction_composer import (
     ErrorTransformer,
+    SendAtomicTransactionComposerResults,
     TransactionComposer,
+    TxnParams,
 )
 from algokit_utils.transactions.transaction_creator import AlgorandClientTransactionCreator
 from algokit_utils.transactions.transaction_sender import AlgorandClientTransactionSender
@@ -30,8 +42,19 @@ __all__ = [
 class AlgorandClient:
     """A client that brokers easy access to Algorand functionality."""
 
-    def __init__(self, config: AlgoClientConfigs | AlgoSdkClients):
-        self._client_manager: ClientManager = ClientManager(clients_or_configs=config, algorand_client=self)
+    def __init__(
+        self,
+        config: AlgoClientConfigs | AlgoSdkClients,
+        *,
+        http_transport: HttpTransportConfig | None = None,
+        coalesce_reads: bool = False,
+    ):
+        self._client_manager: ClientManager = ClientManager(
+            clients_or_configs=config,
+            algorand_client=self,
+            http_transport=http_transport,
+            coalesce_reads=coalesce_reads,
+        )
         self._account_manager: AccountManager = AccountManager(self._client_manager)
         self._asset_manager: AssetManager = AssetManager(self._client_manager.algod, lambda: self.new_group())
         self._app_manager: AppManager = AppManager(self._client_manager.algod)
@@ -51,8 +74,12 @@ class AlgorandClient:
         self._cached_suggested_params: SuggestedParams | None = None
         self._cached_suggested_params_expiry: float | None = None
         self._cached_suggested_params_timeout: int = 3_000  # three seconds
+        self._suggested_params_refresher: SuggestedParamsRefresher | None = None
         self._default_validity_window: int | None = None
         self._error_transformers: set[ErrorTransformer] = set()
+        self._execution_info_cache: ExecutionInfoCache | None = None
+        self._submit_retry_policy: SubmitRetryPolicy | None = None
+        self._inner_fee_model: InnerFeeModel | None = None
 
     def set_default_validity_window(self, validity_window: int) -> typing_extensions.Self:
         """
@@ -112,6 +139,45 @@ class AlgorandClient:
         self._account_manager.set_default_signer(signer)
         return self
 
+    def set_execution_info_cache(self, cache: ExecutionInfoCache | None) -> typing_extensions.Self:
+        """
+        Sets a cache of the simulate responses used to populate app call resources and cover inner transaction fees,
+        so repeated sends of the same group shape can skip the simulate round trip.
+
+        :param cache: The cache to use, or None to simulate every send
+        :return: The `AlgorandClient` so method calls can be chained
+        :example:
+            >>> algorand = AlgorandClient.mainnet().set_execution_info_cache(ExecutionInfoCache(ttl=300))
+        """
+        self._execution_info_cache = cache
+        return self
+
+    def set_inner_fee_model(self, model: InnerFeeModel | None) -> typing_extensions.Self:
+        """
+        Sets a model of the inner transaction fees app calls need, learned from previous sends, so groups covering
+        inner transaction fees can skip the simulate round trip once the model is confident.
+
+        :param model: The model to use, or None to simulate every send that covers inner transaction fees
+        :return: The `AlgorandClient` so method calls can be chained
+        :example:
+            >>> algorand = AlgorandClient.mainnet().set_inner_fee_model(InnerFeeModel(min_observations=5))
+        """
+        self._inner_fee_model = model
+        return self
+
+    def set_submit_retry_policy(self, policy: SubmitRetryPolicy | None) -> typing_extensions.Self:
+        """
+        Sets how transient algod failures (e.g. 502s, timeouts and connection resets) are retried while submitting a
+        transaction group and waiting for it to be confirmed. Retries resubmit the same signed transactions.
+
+        :param policy: The retry policy to use, or None to not retry
+        :return: The `AlgorandClient` so method calls can be chained
+        :example:
+            >>> algorand = AlgorandClient.mainnet().set_submit_retry_policy(SubmitRetryPolicy(max_attempts=5))
+        """
+        self._submit_retry_policy = policy
+        return self
+
     def set_suggested_params_cache(
         self, suggested_params: SuggestedParams, until: float | None = None
     ) -> typing_extensions.Self:
@@ -128,6 +194,21 @@ class AlgorandClient:
         self._cached_suggested_params_expiry = until or time.time() + self._cached_suggested_params_timeout
         return self
 
+    def set_suggested_params_refresher(self, refresher: SuggestedParamsRefresher | None) -> typing_extensions.Self:
+        """
+        Sets a refresher that keeps suggested params current in the background, which then takes precedence over
+        the suggested params cache. Composers from `new_group` and `new_async_group` share its immutable snapshots
+        rather than copying them, so building and sending groups never waits on fetching suggested params.
+
+        :param refresher: The refresher to use, or None to fetch and cache suggested params on demand
+        :return: The `AlgorandClient` so method calls can be chained
+        :example:
+            >>> algorand = AlgorandClient.mainnet()
+            >>> algorand.set_suggested_params_refresher(SuggestedParamsRefresher(algorand.client.algod))
+        """
+        self._suggested_params_refresher = refresher
+        return self
+
     def set_suggested_params_cache_timeout(self, timeout: int) -> typing_extensions.Self:
         """
         Sets the timeout for caching suggested params.
@@ -147,15 +228,54 @@ class AlgorandClient:
         :example:
             >>> algorand = AlgorandClient.mainnet().get_suggested_params()
         """
+        if self._suggested_params_refresher:
+            return copy.copy(self._suggested_params_refresher.get())
+
+        # Suggested params only hold immutable values, so a shallow copy is as safe as a deep one
         if self._cached_suggested_params and (
             self._cached_suggested_params_expiry is None or self._cached_suggested_params_expiry > time.time()
         ):
-            return copy.deepcopy(self._cached_suggested_params)
+            return copy.copy(self._cached_suggested_params)
 
         self._cached_suggested_params = self._client_manager.algod.suggested_params()
         self._cached_suggested_params_expiry = time.time() + self._cached_suggested_params_timeout
 
-        return copy.deepcopy(self._cached_suggested_params)
+        return copy.copy(self._cached_suggested_params)
+
+    def _get_build_suggested_params(self) -> SuggestedParams:
+        # Composers only read the params they build with, so refreshed snapshots are shared rather than copied
+        if self._suggested_params_refresher:
+            return self._suggested_params_refresher.get()
+        return self.get_suggested_params()
+
+    async def get_suggested_params_async(self) -> SuggestedParams:
+        """
+        Get suggested params for a transaction without blocking the event loop
+        (either cached or from algod if the cache is stale or empty)
+
+        :example:
+            >>> params = await AlgorandClient.mainnet().get_suggested_params_async()
+        """
+        if self._suggested_params_refresher:
+            return copy.copy(await self._get_build_suggested_params_async())
+
+        if self._cached_suggested_params and (
+            self._cached_suggested_params_expiry is None or self._cached_suggested_params_expiry > time.time()
+        ):
+            return copy.copy(self._cached_suggested_params)
+
+        self._cached_suggested_params = await self._client_manager.async_algod.suggested_params()
+        self._cached_suggested_params_expiry = time.time() + self._cached_suggested_params_timeout
+
+        return copy.copy(self._cached_suggested_params)
+
+    async def _get_build_suggested_params_async(self) -> SuggestedParams:
+        refresher = self._suggested_params_refresher
+        if refresher:
+            # Only the background thread and this fallback fetch, so the event loop never blocks on algod
+            refresher.start()
+            return refresher.current or refresher.update(await self._client_manager.async_algod.suggested_params())
+        return await self.get_suggested_params_async()
 
     def register_error_transformer(self, transformer: ErrorTransformer) -> typing_extensions.Self:
         """Register a function that will be used to transform an error caught when simulating or executing
@@ -188,11 +308,132 @@ class AlgorandClient:
         return TransactionComposer(
             algod=self.client.algod,
             get_signer=lambda addr: self.account.get_signer(addr),
-            get_suggested_params=self.get_suggested_params,
+            get_suggested_params=self._get_build_suggested_params,
+            default_validity_window=self._default_validity_window,
+            error_transformers=list(self._error_transformers),
+            confirmation_tracker=self.client.confirmation_tracker,
+            execution_info_cache=self._execution_info_cache,
+            submit_retry_policy=self._submit_retry_policy,
+            inner_fee_model=self._inner_fee_model,
+        )
+
+    def new_async_group(self) -> AsyncTransactionComposer:
+        """
+        Start a new `AsyncTransactionComposer` transaction group, which sends and simulates on an asyncio event loop
+
+        :example:
+            >>> composer = AlgorandClient.mainnet().new_async_group()
+            >>> result = await composer.add_payment(payment).send_async()
+        """
+
+        return AsyncTransactionComposer(
+            algod=self.client.algod,
+            async_algod=self.client.async_algod,
+            get_signer=lambda addr: self.account.get_signer(addr),
+            get_suggested_params=self._get_build_suggested_params_async,
             default_validity_window=self._default_validity_window,
+            app_manager=self._app_manager,
             error_transformers=list(self._error_transformers),
+            execution_info_cache=self._execution_info_cache,
+            submit_retry_policy=self._submit_retry_policy,
+            inner_fee_model=self._inner_fee_model,
         )
 
+    def send_many(
+        self,
+        groups: Iterable[TransactionComposer | TxnParams],
+        params: SendParams | None = None,
+        *,
+        max_concurrency: int = 16,
+    ) -> list[SendAtomicTransactionComposerResults | Exception]:
+        """
+        Send many independent transaction groups concurrently from a bounded pool of threads.
+
+        Groups are taken from `groups` as threads become free, so a large (or lazily generated) iterable is never
+        built or held in memory all at once. Confirmation of every group is followed by the shared
+        `ConfirmationTracker`, so waiting doesn't cost a polling loop per group.
+
+        :param groups: The groups to send, each either a composer or the params of a single transaction
+        :param params: Parameters for sending every group
+        :param max_concurrency: Maximum number of groups being sent at once, defaults to 16
+        :return: The send results of each group, or the error it failed with, in the same order as `groups`
+        :example:
+            >>> results = algorand.send_many(PaymentParams(...) for receiver in receivers)
+            >>> failed = [r for r in results if isinstance(r, Exception)]
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        def send(group: TransactionComposer | TxnParams) -> SendAtomicTransactionComposerResults | Exception:
+            try:
+                return self._to_composer(group).send(params)
+            except Exception as e:
+                return e
+
+        results: dict[int, SendAtomicTransactionComposerResults | Exception] = {}
+        in_flight: dict[Future[SendAtomicTransactionComposerResults | Exception], int] = {}
+        with ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="algokit-send-many") as executor:
+            for index, group in enumerate(groups):
+                if len(in_flight) >= max_concurrency:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        results[in_flight.pop(future)] = future.result()
+                in_flight[executor.submit(send, group)] = index
+            for future in as_completed(in_flight):
+                results[in_flight[future]] = future.result()
+        return [results[index] for index in range(len(results))]
+
+    async def send_many_async(
+        self,
+        groups: Iterable[AsyncTransactionComposer | TxnParams],
+        params: SendParams | None = None,
+        *,
+        max_concurrency: int = 64,
+    ) -> list[SendAtomicTransactionComposerResults | Exception]:
+        """
+        Send many independent transaction groups concurrently on the running event loop.
+
+        Async variant of `send_many`, where each group is sent with `AsyncTransactionComposer.send_async`, so far
+        more groups can be in flight at once than there would be threads.
+
+        :param groups: The groups to send, each either an async composer or the params of a single transaction
+        :param params: Parameters for sending every group
+        :param max_concurrency: Maximum number of groups being sent at once, defaults to 64
+        :return: The send results of each group, or the error it failed with, in the same order as `groups`
+        :example:
+            >>> results = await algorand.send_many_async(PaymentParams(...) for receiver in receivers)
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        slots = asyncio.Semaphore(max_concurrency)
+
+        async def send(group: AsyncTransactionComposer | TxnParams) -> SendAtomicTransactionComposerResults | Exception:
+            try:
+                return await self._to_async_composer(group).send_async(params)
+            except Exception as e:
+                return e
+            finally:
+                slots.release()
+
+        tasks: list[asyncio.Task[SendAtomicTransactionComposerResults | Exception]] = []
+        for group in groups:
+            # Wait for a free slot before taking the next group, so the backlog stays in `groups`
+            await slots.acquire()
+            tasks.append(asyncio.ensure_future(send(group)))
+        return list(await asyncio.gather(*tasks))
+
+    def _to_composer(self, group: TransactionComposer | TxnParams) -> TransactionComposer:
+        if isinstance(group, TransactionComposer):
+            return group
+        return self.new_group()._add_txn_params(group)  # noqa: SLF001
+
+    def _to_async_composer(self, group: AsyncTransactionComposer | TxnParams) -> AsyncTransactionComposer:
+        if isinstance(group, AsyncTransactionComposer):
+            return group
+        composer = self.new_async_group()
+        composer._add_txn_params(group)  # noqa: SLF001
+        return composer
+
     @property
     def client(self) -> ClientManager:
         """
@@ -291,39 +532,47 @@ class AlgorandClient:
         )
 
     @staticmethod
-    def testnet() -> "AlgorandClient":
+    def testnet(*, http_transport: HttpTransportConfig | None = None) -> "AlgorandClient":
         """
         Returns an `AlgorandClient` pointing at TestNet using AlgoNode.
 
+        :param http_transport: Optional pooled HTTP transport configuration for the clients, e.g.
+            `HttpTransportConfig.algonode()` to stay within AlgoNode's rate limits, defaults to algosdk's transport
         :return: The `AlgorandClient`
 
         :example:
             >>> algorand = AlgorandClient.testnet()
+            >>> rate_limited = AlgorandClient.testnet(http_transport=HttpTransportConfig.algonode())
         """
         return AlgorandClient(
             AlgoClientConfigs(
                 algod_config=ClientManager.get_algonode_config("testnet", "algod"),
                 indexer_config=ClientManager.get_algonode_config("testnet", "indexer"),
                 kmd_config=None,
-            )
+            ),
+            http_transport=http_transport,
         )
 
     @staticmethod
-    def mainnet() -> "AlgorandClient":
+    def mainnet(*, http_transport: HttpTransportConfig | None = None) -> "AlgorandClient":
         """
         Returns an `AlgorandClient` pointing at MainNet using AlgoNode.
 
+        :param http_transport: Optional pooled HTTP transport configuration for the clients, e.g.
+            `HttpTransportConfig.algonode()` to stay within AlgoNode's rate limits, defaults to algosdk's transport
         :return: The `AlgorandClient`
 
         :example:
             >>> algorand = AlgorandClient.mainnet()
+            >>> rate_limited = AlgorandClient.mainnet(http_transport=HttpTransportConfig.algonode())
         """
         return AlgorandClient(
             AlgoClientConfigs(
                 algod_config=ClientManager.get_algonode_config("mainnet", "algod"),
                 indexer_config=ClientManager.get_algonode_config("mainnet", "indexer"),
                 kmd_config=None,
-            )
+            ),
+            http_transport=http_transport,
         )
 
     @staticmethod
@@ -361,21 +610,32 @@ class AlgorandClient:
 
     @staticmethod
     def from_config(
-        algod_config: AlgoClientNetworkConfig,
+        algod_config: AlgoClientNetworkConfig | list[AlgoClientNetworkConfig],
         indexer_config: AlgoClientNetworkConfig | None = None,
         kmd_config: AlgoClientNetworkConfig | None = None,
+        *,
+        http_transport: HttpTransportConfig | None = None,
+        coalesce_reads: bool = False,
     ) -> "AlgorandClient":
         """
         Returns an `AlgorandClient` from the given config.
 
-        :param algod_config: The config to use for the algod client
+        :param algod_config: The config to use for the algod client, or a config for each of several algod nodes to
+            route requests across with a `MultiEndpointAlgodClient`
         :param indexer_config: The config to use for the indexer client
         :param kmd_config: The config to use for the kmd client
+        :param http_transport: Optional pooled, keep-alive HTTP transport configuration for the clients, defaults to
+            algosdk's connection per request
+        :param coalesce_reads: Whether identical concurrent algod reads (e.g. `suggested_params` or `application_info`
+            from many threads) share a single request via a `CoalescingAlgodClient`, defaults to False
         :return: The `AlgorandClient`
 
         :example:
             >>> algorand = AlgorandClient.from_config(algod_config, indexer_config, kmd_config)
+            >>> pooled = AlgorandClient.from_config(algod_config, http_transport=HttpTransportConfig())
         """
         return AlgorandClient(
-            AlgoClientConfigs(algod_config=algod_config, indexer_config=indexer_config, kmd_config=kmd_config)
+            AlgoClientConfigs(algod_config=algod_config, indexer_config=indexer_config, kmd_config=kmd_config),
+            http_transport=http_transport,
+            coalesce_reads=coalesce_reads,
         )
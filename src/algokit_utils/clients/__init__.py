@@ -1,2 +1,9 @@
+from algokit_utils.clients.async_algod_client import *  # noqa: F403
 from algokit_utils.clients.client_manager import *  # noqa: F403
+from algokit_utils.clients.coalescing_algod_client import *  # noqa: F403
+from algokit_utils.clients.confirmation_tracker import *  # noqa: F403
 from algokit_utils.clients.dispenser_api_client import *  # noqa: F403
+from algokit_utils.clients.http_transport import *  # noqa: F403
+from algokit_utils.clients.multi_endpoint_algod_client import *  # noqa: F403
+from algokit_utils.clients.rate_limiter import *  # noqa: F403
+from algokit_utils.clients.suggested_params_refresher import *  # noqa: F403
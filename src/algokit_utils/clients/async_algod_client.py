@@ -0,0 +1,268 @@
+from __future__ import annotations
+
+import asyncio
+import base64
+import contextlib
+import json
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any, cast
+from urllib import parse
+
+import httpx
+from algosdk import constants, encoding, error, transaction
+from algosdk.v2client.algod import AlgodClient, AlgodResponseType
+
+from algokit_utils.clients.http_transport import _is_throttled
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    import typing_extensions
+    from algosdk.v2client.models import SimulateRequest
+
+    from algokit_utils.clients.rate_limiter import RateLimiter
+
+__all__ = [
+    "AsyncAlgodClient",
+]
+
+_API_VERSION_PATH_PREFIX = "/v2"
+
+
+class AsyncAlgodClient:
+    """Non-blocking algod client built on `httpx.AsyncClient`.
+
+    Covers the subset of the algod API that is needed to build, simulate, send and confirm transaction groups,
+    so a single event loop can keep many groups in flight without a thread per request. Requests, responses and
+    errors mirror `algosdk.v2client.algod.AlgodClient`.
+
+    `httpx.AsyncClient` connections are bound to the event loop they were opened on, so unless an `http_client` is
+    given, a separate one is created for each event loop the client is used on. This means the same instance can be
+    used across several `asyncio.run` calls. `close` closes the HTTP client of the running event loop, and HTTP
+    clients of event loops that have since closed are discarded.
+
+    When a `rate_limiter` is given, requests are paced and throttled requests retried in the same way as the pooled
+    HTTP transport, waiting on the event loop rather than blocking it.
+
+    :param algod_token: The algod API token
+    :param algod_address: The algod address e.g. `http://localhost:4001`
+    :param headers: Optional extra headers to send with every request
+    :param timeout: Request timeout in seconds, defaults to 30
+    :param http_client: Optional `httpx.AsyncClient` to issue requests with, which is only usable on the event loop it
+        was created on; one is created per event loop on first use otherwise
+    :param rate_limiter: Optional rate limiter to pace requests with and retry throttled requests, share it with the
+        synchronous clients so they share each endpoint's budget
+
+    :example:
+        >>> async with AsyncAlgodClient("a" * 64, "http://localhost:4001") as algod:
+        ...     params = await algod.suggested_params()
+    """
+
+    def __init__(
+        self,
+        algod_token: str,
+        algod_address: str,
+        headers: dict[str, str] | None = None,
+        *,
+        timeout: float = 30,
+        http_client: httpx.AsyncClient | None = None,
+        rate_limiter: RateLimiter | None = None,
+    ):
+        self.algod_token = algod_token
+        self.algod_address = algod_address
+        self.headers = headers
+        self._timeout = timeout
+        self._http_client = http_client
+        self._http_clients: dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+        self._rate_limiter = rate_limiter
+
+    @staticmethod
+    def from_algod_client(algod: AlgodClient, *, rate_limiter: RateLimiter | None = None) -> AsyncAlgodClient:
+        """Create an async client that talks to the same node as the given algosdk client.
+
+        A `MultiEndpointAlgodClient` (or a `CoalescingAlgodClient` wrapping one) gets an async client that routes
+        requests over the same nodes.
+
+        :param algod: The algosdk algod client to copy the address, token and headers from
+        :param rate_limiter: Optional rate limiter to pace requests with, e.g. the one the given client uses
+        :return: The async algod client
+        """
+        from algokit_utils.clients.coalescing_algod_client import CoalescingAlgodClient
+        from algokit_utils.clients.multi_endpoint_algod_client import MultiEndpointAlgodClient
+
+        if isinstance(algod, CoalescingAlgodClient):
+            algod = algod.algod
+        if isinstance(algod, MultiEndpointAlgodClient):
+            return algod.create_async_client(rate_limiter=rate_limiter)
+        return AsyncAlgodClient(
+            algod.algod_token, algod.algod_address, dict(algod.headers or {}), rate_limiter=rate_limiter
+        )
+
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """The underlying `httpx.AsyncClient` for the running event loop, created on first use.
+
+        :raises RuntimeError: If there's no running event loop and no `http_client` was given
+        """
+        if self._http_client is not None:
+            return self._http_client
+        loop = asyncio.get_running_loop()
+        http_client = self._http_clients.get(loop)
+        if http_client is None:
+            # Clients of closed loops can't be closed any more, so they're just dropped
+            self._http_clients = {k: v for k, v in self._http_clients.items() if not k.is_closed()}
+            http_client = self._http_clients[loop] = httpx.AsyncClient(timeout=self._timeout)
+        return http_client
+
+    async def close(self) -> None:
+        """Close the HTTP client this instance created for the running event loop, if any."""
+        http_client = self._http_clients.pop(asyncio.get_running_loop(), None)
+        if http_client is not None:
+            await http_client.aclose()
+
+    async def __aenter__(self) -> typing_extensions.Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    async def algod_request(
+        self,
+        method: str,
+        requrl: str,
+        params: dict[str, Any] | None = None,
+        data: bytes | None = None,
+        headers: dict[str, str] | None = None,
+        response_format: str | None = "json",
+    ) -> AlgodResponseType:
+        """Execute a request against algod.
+
+        :param method: The HTTP method
+        :param requrl: The API path e.g. `/status`
+        :param params: Optional query parameters
+        :param data: Optional request body
+        :param headers: Optional extra headers for this request
+        :param response_format: `json` to decode the response body, anything else returns the raw bytes
+        :raises AlgodHTTPError: If algod responds with an error status
+        :raises AlgodResponseError: If a JSON response can't be decoded
+        :return: The decoded JSON response or the raw response bytes
+        """
+        header = {"User-Agent": "py-algorand-sdk"}
+        if self.headers:
+            header.update(self.headers)
+        if headers:
+            header.update(headers)
+        if requrl not in constants.no_auth:
+            header.update({constants.algod_auth_header: self.algod_token})
+
+        if requrl not in constants.unversioned_paths:
+            requrl = _API_VERSION_PATH_PREFIX + requrl
+        if params:
+            requrl = requrl + "?" + parse.urlencode(params)
+
+        response = await self._request(method, self.algod_address + requrl, header, data)
+
+        if response.is_error:
+            message: Any = response.text
+            body: dict[str, Any] = {}
+            with contextlib.suppress(Exception):
+                body = response.json()
+                message = body["message"]
+            raise error.AlgodHTTPError(message, response.status_code, body.get("data"))
+
+        if response_format != "json":
+            return response.content
+        if not response.content:
+            return {}
+        try:
+            return cast(dict[str, Any], json.loads(response.content))
+        except Exception as e:
+            raise error.AlgodResponseError("Failed to parse JSON response from algod") from e
+
+    async def _request(self, method: str, url: str, headers: dict[str, str], data: bytes | None) -> httpx.Response:
+        if self._rate_limiter is None:
+            return await self.http_client.request(method, url, headers=headers, content=data)
+
+        attempt = 0
+        while True:
+            await self._rate_limiter.acquire_async(url)
+            response = await self.http_client.request(method, url, headers=headers, content=data)
+            if not _is_throttled(response) or attempt >= self._rate_limiter.max_retries:
+                return response
+            self._rate_limiter.throttle(url, attempt, response.headers.get("Retry-After"))
+            attempt += 1
+
+    async def status(self) -> AlgodResponseType:
+        """Return node status."""
+        return await self.algod_request("GET", "/status")
+
+    async def status_after_block(self, round_num: int) -> AlgodResponseType:
+        """Return node status immediately after the given round.
+
+        :param round_num: The round to wait for
+        :return: The node status
+        """
+        return await self.algod_request("GET", f"/status/wait-for-block-after/{round_num}")
+
+    async def suggested_params(self) -> transaction.SuggestedParams:
+        """Return suggested transaction parameters."""
+        res = cast(dict[str, Any], await self.algod_request("GET", "/transactions/params"))
+        return transaction.SuggestedParams(
+            res["fee"],
+            res["last-round"],
+            res["last-round"] + 1000,
+            res["genesis-hash"],
+            res["genesis-id"],
+            False,  # noqa: FBT003
+            res["consensus-version"],
+            res["min-fee"],
+        )
+
+    async def send_raw_transaction(self, txn: bytes | str) -> str:
+        """Broadcast base64 encoded signed transaction bytes to the network.
+
+        :param txn: The base64 encoded signed transaction(s)
+        :return: The transaction ID of the first transaction
+        """
+        resp = await self.algod_request(
+            "POST",
+            "/transactions",
+            data=base64.b64decode(txn),
+            headers={"Content-Type": "application/x-binary"},
+        )
+        return cast(str, cast(dict, resp)["txId"])
+
+    async def send_transactions(self, txns: Iterable[transaction.GenericSignedTransaction]) -> str:
+        """Broadcast a list of signed transactions to the network.
+
+        :param txns: The signed transactions
+        :return: The transaction ID of the first transaction
+        """
+        serialized = [base64.b64decode(encoding.msgpack_encode(txn)) for txn in txns]
+        return await self.send_raw_transaction(base64.b64encode(b"".join(serialized)))
+
+    async def pending_transaction_info(self, transaction_id: str) -> AlgodResponseType:
+        """Return transaction information for a pending transaction.
+
+        :param transaction_id: The transaction ID
+        :return: The pending transaction info
+        """
+        return await self.algod_request("GET", f"/transactions/pending/{transaction_id}", params={"format": "json"})
+
+    async def simulate_transactions(self, request: SimulateRequest) -> AlgodResponseType:
+        """Simulate transactions being sent to the network.
+
+        :param request: The simulate request
+        :return: The simulate response
+        """
+        return await self.algod_request(
+            "POST",
+            "/transactions/simulate",
+            data=base64.b64decode(encoding.msgpack_encode(request)),
+            headers={"Content-Type": "application/msgpack"},
+        )
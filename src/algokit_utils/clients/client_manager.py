@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Literal, TypeVar
+from typing import TYPE_CHECKING, Literal, TypeVar, cast
 from urllib import parse
 
 import algosdk
@@ -16,7 +16,17 @@ from algosdk.v2client.indexer import IndexerClient
 from algokit_utils._legacy_v2.application_specification import ApplicationSpecification
 from algokit_utils.applications.app_deployer import ApplicationLookup
 from algokit_utils.applications.app_spec.arc56 import Arc56Contract
+from algokit_utils.clients.async_algod_client import AsyncAlgodClient
+from algokit_utils.clients.coalescing_algod_client import CoalescingAlgodClient
+from algokit_utils.clients.confirmation_tracker import ConfirmationTracker
 from algokit_utils.clients.dispenser_api_client import TestNetDispenserApiClient
+from algokit_utils.clients.http_transport import (
+    HttpTransportConfig,
+    PooledAlgodClient,
+    PooledIndexerClient,
+    PooledKMDClient,
+)
+from algokit_utils.clients.multi_endpoint_algod_client import MultiEndpointAlgodClient
 from algokit_utils.models.network import AlgoClientConfigs, AlgoClientNetworkConfig
 from algokit_utils.protocols.typed_clients import TypedAppClientProtocol, TypedAppFactoryProtocol
 
@@ -24,6 +34,7 @@ if TYPE_CHECKING:
     from algokit_utils.algorand import AlgorandClient
     from algokit_utils.applications.app_client import AppClient, AppClientCompilationParams
     from algokit_utils.applications.app_factory import AppFactory
+    from algokit_utils.clients.rate_limiter import RateLimiter
 
 __all__ = [
     "AlgoSdkClients",
@@ -93,6 +104,10 @@ class ClientManager:
 
     :param clients_or_configs: Either client instances or client configurations
     :param algorand_client: AlgorandClient instance
+    :param http_transport: Optional pooled, keep-alive HTTP transport configuration for clients created from
+        configurations, defaults to algosdk's connection per request; its rate limiter also paces `async_algod`
+    :param coalesce_reads: Whether an algod client created from configuration shares one request between identical
+        concurrent reads, defaults to False
 
     :example:
         >>> # Algod only
@@ -106,16 +121,27 @@ class ClientManager:
         ...     ClientManager.get_indexer_config_from_environment())
     """
 
-    def __init__(self, clients_or_configs: AlgoClientConfigs | AlgoSdkClients, algorand_client: AlgorandClient):
+    def __init__(
+        self,
+        clients_or_configs: AlgoClientConfigs | AlgoSdkClients,
+        algorand_client: AlgorandClient,
+        *,
+        http_transport: HttpTransportConfig | None = None,
+        coalesce_reads: bool = False,
+    ):
+        self._rate_limiter: RateLimiter | None = None
         if isinstance(clients_or_configs, AlgoSdkClients):
             _clients = clients_or_configs
         elif isinstance(clients_or_configs, AlgoClientConfigs):
+            self._rate_limiter = http_transport.rate_limiter if http_transport else None
             _clients = AlgoSdkClients(
-                algod=ClientManager.get_algod_client(clients_or_configs.algod_config),
-                indexer=ClientManager.get_indexer_client(clients_or_configs.indexer_config)
+                algod=ClientManager.get_algod_client(
+                    clients_or_configs.algod_config, http_transport, coalesce_reads=coalesce_reads
+                ),
+                indexer=ClientManager.get_indexer_client(clients_or_configs.indexer_config, http_transport)
                 if clients_or_configs.indexer_config
                 else None,
-                kmd=ClientManager.get_kmd_client(clients_or_configs.kmd_config)
+                kmd=ClientManager.get_kmd_client(clients_or_configs.kmd_config, http_transport)
                 if clients_or_configs.kmd_config
                 else None,
             )
@@ -124,6 +150,8 @@ class ClientManager:
         self._kmd = _clients.kmd
         self._algorand = algorand_client
         self._suggested_params: SuggestedParams | None = None
+        self._async_algod: AsyncAlgodClient | None = None
+        self._confirmation_tracker: ConfirmationTracker | None = None
 
     @property
     def algod(self) -> AlgodClient:
@@ -133,6 +161,26 @@ class ClientManager:
         """
         return self._algod
 
+    @property
+    def async_algod(self) -> AsyncAlgodClient:
+        """Returns a non-blocking Algod API client pointing at the same node(s) as `algod`.
+
+        :return: Async algod client instance
+        """
+        if self._async_algod is None:
+            self._async_algod = AsyncAlgodClient.from_algod_client(self._algod, rate_limiter=self._rate_limiter)
+        return self._async_algod
+
+    @property
+    def confirmation_tracker(self) -> ConfirmationTracker:
+        """Returns the tracker that confirms transaction groups sent through `algod`.
+
+        :return: Confirmation tracker instance
+        """
+        if self._confirmation_tracker is None:
+            self._confirmation_tracker = ConfirmationTracker(self._algod)
+        return self._confirmation_tracker
+
     @property
     def indexer(self) -> IndexerClient:
         """Returns an algosdk Indexer API client.
@@ -371,19 +419,53 @@ class ClientManager:
         )
 
     @staticmethod
-    def get_algod_client(config: AlgoClientNetworkConfig) -> AlgodClient:
+    def get_algod_client(
+        config: AlgoClientNetworkConfig | list[AlgoClientNetworkConfig],
+        http_transport: HttpTransportConfig | None = None,
+        *,
+        coalesce_reads: bool = False,
+    ) -> AlgodClient:
         """Get an Algod client from config or environment.
 
-        :param config: Optional client configuration
+        :param config: Optional client configuration, or the configuration of each node for a
+            `MultiEndpointAlgodClient` that routes requests across them, with the first as the primary
+        :param http_transport: Optional pooled, keep-alive HTTP transport configuration, defaults to algosdk's
+            connection per request
+        :param coalesce_reads: Whether to return a `CoalescingAlgodClient` that shares one request between identical
+            concurrent reads, defaults to False
         :return: Algod client instance
         """
+        if coalesce_reads:
+            return CoalescingAlgodClient(ClientManager.get_algod_client(config, http_transport))
+        if isinstance(config, list):
+            return MultiEndpointAlgodClient([ClientManager.get_algod_client(c, http_transport) for c in config])
         headers = {"X-Algo-API-Token": config.token or ""}
+        if http_transport:
+            return PooledAlgodClient(config.token or "", config.full_url(), headers, transport=http_transport)
         return AlgodClient(
             algod_token=config.token or "",
             algod_address=config.full_url(),
             headers=headers,
         )
 
+    @staticmethod
+    def get_async_algod_client(
+        config: AlgoClientNetworkConfig, http_transport: HttpTransportConfig | None = None
+    ) -> AsyncAlgodClient:
+        """Get a non-blocking Algod client from config.
+
+        :param config: Client configuration
+        :param http_transport: Optional HTTP transport configuration whose rate limiter paces the client's requests
+        :return: Async algod client instance
+        """
+        headers = {"X-Algo-API-Token": config.token or ""}
+        return AsyncAlgodClient(
+            algod_token=config.token or "",
+            algod_address=config.full_url(),
+            headers=headers,
+            rate_limiter=http_transport.rate_limiter if http_transport else None,
+        )
+
     @staticmethod
     def get_algod_client_from_environment() -> AlgodClient:
         """Get an Algod client from environment variables.
@@ -393,12 +475,16 @@ class ClientManager:
         return ClientManager.get_algod_client(ClientManager.get_algod_config_from_environment())
 
     @staticmethod
-    def get_kmd_client(config: AlgoClientNetworkConfig) -> KMDClient:
+    def get_kmd_client(config: AlgoClientNetworkConfig, http_transport: HttpTransportConfig | None = None) -> KMDClient:
         """Get a KMD client from config or environment.
 
         :param config: Optional client configuration
+        :param http_transport: Optional pooled, keep-alive HTTP transport configuration, defaults to algosdk's
+            connection per request
         :return: KMD client instance
         """
+        if http_transport:
+            return PooledKMDClient(config.token or "", config.full_url(), transport=http_transport)
         return KMDClient(config.token, config.full_url())
 
     @staticmethod
@@ -410,13 +496,21 @@ class ClientManager:
         return ClientManager.get_kmd_client(ClientManager.get_kmd_config_from_environment())
 
     @staticmethod
-    def get_indexer_client(config: AlgoClientNetworkConfig) -> IndexerClient:
+    def get_indexer_client(
+        config: AlgoClientNetworkConfig, http_transport: HttpTransportConfig | None = None
+    ) -> IndexerClient:
         """Get an Indexer client from config or environment.
 
         :param config: Optional client configuration
+        :param http_transport: Optional pooled, keep-alive HTTP transport configuration, defaults to algosdk's
+            connection per request
         :return: Indexer client instance
         """
         headers = {"X-Indexer-API-Token": config.token}
+        if http_transport:
+            return PooledIndexerClient(
+                config.token or "", config.full_url(), cast(dict[str, str], headers), transport=http_transport
+            )
         return IndexerClient(
             indexer_token=config.token,
             indexer_address=config.full_url(),
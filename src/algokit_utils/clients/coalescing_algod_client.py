@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import copy
+import threading
+from concurrent.futures import Future
+from typing import Any
+from urllib import parse
+
+from algosdk.v2client.algod import AlgodClient, AlgodResponseType
+
+__all__ = [
+    "CoalescingAlgodClient",
+]
+
+
+class CoalescingAlgodClient(AlgodClient):
+    """An `algosdk.v2client.algod.AlgodClient` that shares one request between identical concurrent reads.
+
+    When several threads make the same GET request at the same time (e.g. `suggested_params`,
+    `application_info(app_id)` or `account_info(address)` as a cache expires), only the first is sent to algod and
+    the others wait for its response (or error), so a burst of identical reads costs the node a single request.
+    Each waiting caller gets its own copy of the response, so callers can't see each other's changes to it. Reads
+    that start after a response has arrived are sent again, so responses are never served stale. Requests other than
+    GETs, such as submissions and simulates, are always sent as is.
+
+    :param algod: The algod client to send requests with
+
+    :example:
+        >>> algorand = AlgorandClient.from_clients(CoalescingAlgodClient(algod))
+    """
+
+    def __init__(self, algod: AlgodClient):
+        super().__init__(algod.algod_token, algod.algod_address, algod.headers)
+        self._algod = algod
+        self._lock = threading.Lock()
+        self._in_flight: dict[tuple[str, str, tuple[tuple[str, str], ...], str | None], Future[AlgodResponseType]] = {}
+        self.coalesced = 0
+        """The number of reads that were answered by another caller's request"""
+
+    @property
+    def algod(self) -> AlgodClient:
+        """The algod client requests are sent with."""
+        return self._algod
+
+    def algod_request(
+        self,
+        method: str,
+        requrl: str,
+        params: Any = None,  # noqa: ANN401
+        data: bytes | None = None,
+        headers: dict[str, str] | None = None,
+        response_format: str | None = "json",
+        timeout: int | None = 30,
+    ) -> AlgodResponseType:
+        """Execute a request against algod, sharing the response of an identical GET that's already in flight.
+
+        :param method: The HTTP method
+        :param requrl: The API path e.g. `/status`
+        :param params: Optional query parameters
+        :param data: Optional request body
+        :param headers: Optional extra headers for this request
+        :param response_format: `json` to decode the response body, anything else returns the raw bytes
+        :param timeout: Request timeout in seconds, defaults to 30
+        :raises AlgodHTTPError: If algod responds with an error status
+        :return: The decoded JSON response or the raw response bytes
+        """
+        if method != "GET":
+            return self._algod.algod_request(method, requrl, params, data, headers, response_format, timeout)
+
+        key = (
+            requrl,
+            parse.urlencode(params or {}, doseq=True),
+            tuple(sorted((headers or {}).items())),
+            response_format,
+        )
+        with self._lock:
+            in_flight = self._in_flight.get(key)
+            if in_flight is None:
+                future: Future[AlgodResponseType] = Future()
+                self._in_flight[key] = future
+            else:
+                self.coalesced += 1
+        if in_flight is not None:
+            return copy.deepcopy(in_flight.result())
+
+        try:
+            response = self._algod.algod_request(method, requrl, params, data, headers, response_format, timeout)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(response)
+            return response
+        finally:
+            with self._lock:
+                del self._in_flight[key]
@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+import functools
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, cast
+
+from algosdk import error
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    import typing_extensions
+    from algosdk.v2client.algod import AlgodClient
+
+__all__ = [
+    "ConfirmationTracker",
+]
+
+_DEFAULT_MAX_ROUNDS_TO_WAIT = 1000
+# Groups that haven't appeared in a block are checked for pool errors (rejections) every this many rounds
+_POOL_CHECK_INTERVAL = 4
+# Block transaction IDs are fetched for at most this many rounds at once, groups are polled instead after longer gaps
+_MAX_BLOCKS_PER_POLL = 10
+_MAX_FOLLOW_ATTEMPTS = 10
+_MAX_RETRY_INTERVAL = 10
+
+
+@dataclass(kw_only=True, eq=False)
+class _TrackedGroup:
+    tx_ids: list[str]
+    max_rounds_to_wait: int
+    future: Future[list[dict[str, Any]]] = field(default_factory=Future)
+    start_round: int | None = None
+    checked_round: int | None = None
+
+
+class ConfirmationTracker:
+    """Follows the chain round by round and resolves confirmations for any number of submitted transaction groups.
+
+    Rather than each sender blocking in its own `wait_for_confirmation` loop, groups are registered with `track`
+    and a single background thread waits on `status_after_block`, then fetches the IDs of the transactions in each
+    new block with `get_block_txids` and matches every outstanding group against them. This means many independent
+    groups can be submitted back to back and confirmed together, limited by the node rather than by block time, for a
+    fixed number of requests per round plus one `pending_transaction_info` per transaction once it's confirmed.
+    The background thread only runs while there are groups being tracked.
+
+    Pending info is also checked when a group is first tracked (in case it was confirmed before then), every few
+    rounds while a group hasn't appeared in a block (to notice rejections), and for every group in rounds whose block
+    can't be fetched. Failures to follow the chain are retried with exponential backoff, starting at
+    `retry_interval` seconds, and only fail the tracked groups after 10 attempts in a row.
+
+    :param algod: The algod client to follow the chain with
+    :param max_workers: Maximum number of concurrent requests, defaults to 8
+    :param retry_interval: Seconds to wait before retrying a failed `status` or `status_after_block` request,
+        doubled after each failure, defaults to 0.5
+
+    :example:
+        >>> tracker = ConfirmationTracker(algod)
+        >>> futures = [tracker.track(atc.submit(algod)) for atc in atcs]
+        >>> confirmations = [future.result() for future in futures]
+    """
+
+    def __init__(self, algod: AlgodClient, *, max_workers: int = 8, retry_interval: float = 0.5):
+        self._algod = algod
+        self._max_workers = max_workers
+        self._retry_interval = retry_interval
+        self._lock = threading.Lock()
+        self._groups: list[_TrackedGroup] = []
+        self._thread: threading.Thread | None = None
+        self._executor: ThreadPoolExecutor | None = None
+
+    def track(self, tx_ids: list[str], max_rounds_to_wait: int | None = None) -> Future[list[dict[str, Any]]]:
+        """Start tracking a submitted transaction group.
+
+        :param tx_ids: The IDs of the transactions in the group, in group order
+        :param max_rounds_to_wait: Number of rounds to wait for confirmation before failing with
+            `ConfirmationTimeoutError`, defaults to 1000
+        :return: A future that resolves to the pending transaction info of every transaction in the group,
+            or fails with `TransactionRejectedError` / `ConfirmationTimeoutError`
+        """
+        if not tx_ids:
+            raise ValueError("Can't track an empty transaction group")
+        group = _TrackedGroup(tx_ids=list(tx_ids), max_rounds_to_wait=max_rounds_to_wait or _DEFAULT_MAX_ROUNDS_TO_WAIT)
+        with self._lock:
+            self._groups.append(group)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers, thread_name_prefix="algokit-confirmation"
+                )
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="algokit-confirmation-tracker", daemon=True)
+                self._thread.start()
+        return group.future
+
+    def wait(self, tx_ids: list[str], max_rounds_to_wait: int | None = None) -> list[dict[str, Any]]:
+        """Track a submitted transaction group and block until it's confirmed.
+
+        :param tx_ids: The IDs of the transactions in the group, in group order
+        :param max_rounds_to_wait: Number of rounds to wait for confirmation, defaults to 1000
+        :return: The pending transaction info of every transaction in the group
+        """
+        return self.track(tx_ids, max_rounds_to_wait).result()
+
+    @property
+    def pending_count(self) -> int:
+        """The number of groups currently waiting for confirmation."""
+        with self._lock:
+            return len(self._groups)
+
+    def close(self) -> None:
+        """Wait for every tracked group to resolve and release the worker pool."""
+        with self._lock:
+            thread = self._thread
+        if thread is not None:
+            thread.join()
+        with self._lock:
+            executor = self._executor if self._thread is None else None
+            if executor is not None:
+                self._executor = None
+        if executor is not None:
+            executor.shutdown()
+
+    def __enter__(self) -> typing_extensions.Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def _run(self) -> None:
+        try:
+            current_round = self._follow(self._algod.status)
+            block_tx_ids: set[str] | None = set()
+            while self._poll(current_round, block_tx_ids):
+                last_round = current_round
+                current_round = self._follow(functools.partial(self._algod.status_after_block, last_round))
+                block_tx_ids = self._get_block_tx_ids(range(last_round + 1, current_round + 1))
+        except Exception as e:
+            with self._lock:
+                groups, self._groups = self._groups, []
+                self._thread = None
+            for group in groups:
+                if not group.future.done():
+                    group.future.set_exception(e)
+
+    def _follow(self, get_status: Callable[[], Any]) -> int:
+        """Get the latest round from the given status request, retrying failures with exponential backoff."""
+        attempt = 1
+        while True:
+            try:
+                return cast(int, cast(dict, get_status())["last-round"])
+            except Exception:
+                if attempt >= _MAX_FOLLOW_ATTEMPTS:
+                    raise
+                time.sleep(min(self._retry_interval * 2 ** (attempt - 1), _MAX_RETRY_INTERVAL))
+                attempt += 1
+
+    def _get_block_tx_ids(self, rounds: range) -> set[str] | None:
+        """Get the IDs of the transactions in the given rounds, or None if they can't be fetched."""
+        if len(rounds) > _MAX_BLOCKS_PER_POLL:
+            return None
+        executor = self._get_executor()
+        try:
+            return {
+                tx_id
+                for block in executor.map(self._algod.get_block_txids, rounds)
+                for tx_id in cast(dict, block)["blockTxids"] or []
+            }
+        except Exception:
+            # e.g. a node that doesn't serve block transaction IDs, in which case every group is polled
+            return None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            executor = self._executor
+        assert executor is not None
+        return executor
+
+    def _poll(self, current_round: int, block_tx_ids: set[str] | None) -> bool:
+        """Check every tracked group against the given round, returning whether any are still outstanding.
+
+        :param current_round: The latest round
+        :param block_tx_ids: The IDs of the transactions in the blocks since the previous poll, or None if they
+            couldn't be fetched, in which case every group's pending info is checked
+        """
+        with self._lock:
+            groups = list(self._groups)
+        executor = self._get_executor()
+
+        to_check: list[_TrackedGroup] = []
+        for group in groups:
+            if group.start_round is None:
+                group.start_round = current_round
+            if (
+                group.checked_round is None
+                or block_tx_ids is None
+                or group.tx_ids[0] in block_tx_ids
+                or current_round - group.checked_round >= _POOL_CHECK_INTERVAL
+            ):
+                group.checked_round = current_round
+                to_check.append(group)
+
+        # The whole group is committed atomically, so checking the first transaction is enough
+        first_infos = [executor.submit(self._get_pending_info, group.tx_ids[0]) for group in to_check]
+        checked = dict(zip(to_check, first_infos, strict=True))
+        finished: list[_TrackedGroup] = []
+        for group in groups:
+            assert group.start_round is not None
+            first_info = checked.get(group)
+            try:
+                tx_info = first_info.result() if first_info is not None else None
+            except Exception as e:
+                # Only this group's lookup failed, so the other groups carry on
+                group.future.set_exception(e)
+                finished.append(group)
+                continue
+            if tx_info and tx_info.get("pool-error"):
+                group.future.set_exception(
+                    error.TransactionRejectedError(f"Transaction rejected: {tx_info['pool-error']}")
+                )
+            elif tx_info and tx_info.get("confirmed-round"):
+                self._resolve(executor, group, tx_info)
+            elif current_round >= group.start_round + group.max_rounds_to_wait:
+                group.future.set_exception(
+                    error.ConfirmationTimeoutError(f"Wait for transaction id {group.tx_ids[0]} timed out")
+                )
+            else:
+                continue
+            finished.append(group)
+
+        with self._lock:
+            self._groups = [group for group in self._groups if group not in finished]
+            if self._groups:
+                return True
+            self._thread = None
+            return False
+
+    def _resolve(self, executor: ThreadPoolExecutor, group: _TrackedGroup, first_info: dict[str, Any]) -> None:
+        try:
+            remaining_infos = executor.map(self._algod.pending_transaction_info, group.tx_ids[1:])
+            group.future.set_result([first_info, *(cast(dict[str, Any], info) for info in remaining_infos)])
+        except Exception as e:
+            group.future.set_exception(e)
+
+    def _get_pending_info(self, tx_id: str) -> dict[str, Any] | None:
+        try:
+            return cast(dict[str, Any], self._algod.pending_transaction_info(tx_id))
+        except error.AlgodHTTPError:
+            # Mirrors `wait_for_confirmation`, pending info can 404 if the request lands on a different node behind
+            # a load balancer, so try again next round
+            return None
@@ -0,0 +1,266 @@
+from __future__ import annotations
+
+import random
+import threading
+import time
+import urllib.error
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, cast
+
+import httpx
+from algosdk import error
+from algosdk.v2client.algod import AlgodClient, AlgodResponseType
+
+from algokit_utils.clients.async_algod_client import AsyncAlgodClient
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from algokit_utils.clients.rate_limiter import RateLimiter
+
+__all__ = [
+    "MultiEndpointAlgodClient",
+]
+
+_SERVER_ERROR_STATUS = 500
+# Reads that are answered the same by any caught up node; everything else follows the transaction pool of the
+# primary, e.g. a transaction sent to one node may not be pending on another yet
+_READ_POST_PATHS = ("/transactions/simulate", "/teal/compile")
+_PRIMARY_GET_PATHS = ("/transactions/pending", "/status/wait-for-block-after")
+
+
+@dataclass(kw_only=True)
+class _Endpoint:
+    client: AlgodClient
+    latency: float | None = None
+    ejected_until: float = 0
+
+
+class MultiEndpointAlgodClient(AlgodClient):
+    """An `algosdk.v2client.algod.AlgodClient` that spreads requests over several algod nodes of the same network.
+
+    Reads (e.g. `account_info`, `application_info`, `suggested_params` and `simulate`) are routed to the healthy
+    node with the lower observed latency out of two picked at random, so load is spread across nodes while favouring
+    faster ones. Submissions, pending transaction lookups and waiting for blocks go to the first (primary) node, so
+    a sent transaction is looked up where it's pending, and fail over to the other nodes in endpoint order.
+
+    A node that fails with a connection error, timeout or server error is ejected and the request is retried on the
+    next node. Ejected nodes are tried again once `eject_seconds` have passed, or sooner if every node is ejected.
+    Errors for the request itself (e.g. a rejected transaction) are raised without failing over. Submissions only
+    fail over when they couldn't be sent to the node (e.g. the connection was refused), since a submission that
+    timed out or failed with a server error may still have been accepted.
+
+    :param endpoints: A client for each algod node, the first is the primary
+    :param eject_seconds: How long a failed node is left out of routing before it's tried again, defaults to 30
+    :param latency_smoothing: The weight given to each new latency observation, between 0 and 1, defaults to 0.3
+
+    :example:
+        >>> algod = MultiEndpointAlgodClient([AlgodClient(token, url) for url in urls])
+    """
+
+    def __init__(
+        self,
+        endpoints: Sequence[AlgodClient],
+        *,
+        eject_seconds: float = 30,
+        latency_smoothing: float = 0.3,
+    ):
+        if not endpoints:
+            raise ValueError("At least one algod endpoint is required")
+        if not 0 < latency_smoothing <= 1:
+            raise ValueError("latency_smoothing must be greater than 0 and at most 1")
+        primary = endpoints[0]
+        super().__init__(primary.algod_token, primary.algod_address, primary.headers)
+        self._endpoints = [_Endpoint(client=client) for client in endpoints]
+        self._eject_seconds = eject_seconds
+        self._latency_smoothing = latency_smoothing
+        self._lock = threading.Lock()
+        self._random = random.Random()
+
+    @property
+    def endpoints(self) -> list[AlgodClient]:
+        """The client for each algod node, the first is the primary."""
+        return [endpoint.client for endpoint in self._endpoints]
+
+    @property
+    def healthy_endpoints(self) -> list[AlgodClient]:
+        """The clients for the algod nodes that aren't currently ejected."""
+        now = time.monotonic()
+        with self._lock:
+            return [endpoint.client for endpoint in self._endpoints if endpoint.ejected_until <= now]
+
+    def algod_request(
+        self,
+        method: str,
+        requrl: str,
+        params: Any = None,  # noqa: ANN401
+        data: bytes | None = None,
+        headers: dict[str, str] | None = None,
+        response_format: str | None = "json",
+        timeout: int | None = 30,
+    ) -> AlgodResponseType:
+        """Execute a request against the algod node it's routed to, failing over to the other nodes.
+
+        :param method: The HTTP method
+        :param requrl: The API path e.g. `/status`
+        :param params: Optional query parameters
+        :param data: Optional request body
+        :param headers: Optional extra headers for this request
+        :param response_format: `json` to decode the response body, anything else returns the raw bytes
+        :param timeout: Request timeout in seconds, defaults to 30
+        :raises AlgodHTTPError: If algod responds with an error status
+        :return: The decoded JSON response or the raw response bytes
+        """
+        is_read = _is_read(method, requrl)
+        last_error: Exception | None = None
+        for endpoint in self._get_request_order(is_read=is_read):
+            start = time.monotonic()
+            try:
+                response = endpoint.client.algod_request(
+                    method, requrl, params, data, headers, response_format, timeout
+                )
+            except Exception as e:
+                if not self._should_fail_over(endpoint, e, method=method, is_read=is_read):
+                    raise
+                last_error = e
+                continue
+            self._mark_healthy(endpoint, time.monotonic() - start, is_read=is_read)
+            return response
+        raise cast(Exception, last_error)
+
+    def create_async_client(self, *, rate_limiter: RateLimiter | None = None) -> AsyncAlgodClient:
+        """Create an async client that routes requests over the same nodes, sharing their health and latency.
+
+        :param rate_limiter: Optional rate limiter to pace requests to each node with
+        :return: The async algod client
+        """
+        return _AsyncMultiEndpointAlgodClient(self, rate_limiter=rate_limiter)
+
+    def _get_request_order(self, *, is_read: bool) -> list[_Endpoint]:
+        return self._get_read_order() if is_read else self._get_primary_order()
+
+    def _should_fail_over(self, endpoint: _Endpoint, e: Exception, *, method: str, is_read: bool) -> bool:
+        if not _is_node_failure(e):
+            return False
+        self._eject(endpoint)
+        # Sending a submission again to another node could see it rejected as already in the ledger
+        return is_read or method != "POST" or _is_unsent(e)
+
+    def _get_read_order(self) -> list[_Endpoint]:
+        healthy, ejected = self._partition()
+        if len(healthy) > 1:
+            # Power of two choices: the faster of two random nodes spreads load without herding on the fastest
+            first, second = self._random.sample(healthy, 2)
+            chosen = first if _latency(first) <= _latency(second) else second
+            rest = sorted((endpoint for endpoint in healthy if endpoint is not chosen), key=_latency)
+            healthy = [chosen, *rest]
+        return healthy + ejected
+
+    def _get_primary_order(self) -> list[_Endpoint]:
+        healthy, ejected = self._partition()
+        return healthy + ejected
+
+    def _partition(self) -> tuple[list[_Endpoint], list[_Endpoint]]:
+        now = time.monotonic()
+        with self._lock:
+            healthy = [endpoint for endpoint in self._endpoints if endpoint.ejected_until <= now]
+            ejected = sorted(
+                (endpoint for endpoint in self._endpoints if endpoint.ejected_until > now),
+                key=lambda endpoint: endpoint.ejected_until,
+            )
+        return healthy, ejected
+
+    def _eject(self, endpoint: _Endpoint) -> None:
+        with self._lock:
+            endpoint.ejected_until = time.monotonic() + self._eject_seconds
+
+    def _mark_healthy(self, endpoint: _Endpoint, latency: float, *, is_read: bool) -> None:
+        with self._lock:
+            endpoint.ejected_until = 0
+            # Long polls and submissions don't reflect how quickly a node answers reads
+            if not is_read:
+                return
+            if endpoint.latency is None:
+                endpoint.latency = latency
+            else:
+                endpoint.latency += self._latency_smoothing * (latency - endpoint.latency)
+
+
+class _AsyncMultiEndpointAlgodClient(AsyncAlgodClient):
+    """An `AsyncAlgodClient` that routes requests like the `MultiEndpointAlgodClient` it's created from."""
+
+    def __init__(self, algod: MultiEndpointAlgodClient, *, rate_limiter: RateLimiter | None):
+        super().__init__(algod.algod_token, algod.algod_address, dict(algod.headers or {}), rate_limiter=rate_limiter)
+        self._algod = algod
+        self._clients = {
+            id(endpoint): AsyncAlgodClient.from_algod_client(endpoint.client, rate_limiter=rate_limiter)
+            for endpoint in algod._endpoints  # noqa: SLF001
+        }
+
+    async def close(self) -> None:
+        """Close the HTTP clients this instance created for the running event loop, if any."""
+        for client in self._clients.values():
+            await client.close()
+
+    async def algod_request(
+        self,
+        method: str,
+        requrl: str,
+        params: dict[str, Any] | None = None,
+        data: bytes | None = None,
+        headers: dict[str, str] | None = None,
+        response_format: str | None = "json",
+    ) -> AlgodResponseType:
+        """Execute a request against the algod node it's routed to, failing over to the other nodes.
+
+        :param method: The HTTP method
+        :param requrl: The API path e.g. `/status`
+        :param params: Optional query parameters
+        :param data: Optional request body
+        :param headers: Optional extra headers for this request
+        :param response_format: `json` to decode the response body, anything else returns the raw bytes
+        :raises AlgodHTTPError: If algod responds with an error status
+        :return: The decoded JSON response or the raw response bytes
+        """
+        algod = self._algod
+        is_read = _is_read(method, requrl)
+        last_error: Exception | None = None
+        for endpoint in algod._get_request_order(is_read=is_read):  # noqa: SLF001
+            start = time.monotonic()
+            try:
+                response = await self._clients[id(endpoint)].algod_request(
+                    method, requrl, params, data, headers, response_format
+                )
+            except Exception as e:
+                if not algod._should_fail_over(endpoint, e, method=method, is_read=is_read):  # noqa: SLF001
+                    raise
+                last_error = e
+                continue
+            algod._mark_healthy(endpoint, time.monotonic() - start, is_read=is_read)  # noqa: SLF001
+            return response
+        raise cast(Exception, last_error)
+
+
+def _latency(endpoint: _Endpoint) -> float:
+    # Nodes without observations yet are tried first so they get one
+    return endpoint.latency or 0
+
+
+def _is_read(method: str, requrl: str) -> bool:
+    if method == "GET":
+        return not requrl.startswith(_PRIMARY_GET_PATHS)
+    return requrl.startswith(_READ_POST_PATHS)
+
+
+def _is_node_failure(e: Exception) -> bool:
+    if isinstance(e, error.AlgodHTTPError):
+        return (e.code or 0) >= _SERVER_ERROR_STATUS
+    return isinstance(e, OSError | httpx.TransportError)
+
+
+def _is_unsent(e: Exception) -> bool:
+    """Whether the request failed before it reached the node, so it's safe to send to another one."""
+    # urllib only raises URLError for failures while connecting and sending, not while awaiting the response
+    if isinstance(e, urllib.error.URLError):
+        return not isinstance(e, urllib.error.HTTPError)
+    return isinstance(e, httpx.ConnectError | httpx.ConnectTimeout)
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import asyncio
+import email.utils
+import threading
+import time
+from datetime import datetime, timezone
+from urllib import parse
+
+__all__ = [
+    "RateLimiter",
+]
+
+_MIN_RATE_FRACTION = 0.1
+
+
+class _TokenBucket:
+    def __init__(self, rate: float, burst: float, recovery_seconds: float):
+        self._max_rate = rate
+        self._burst = burst
+        self._recovery_seconds = recovery_seconds
+        self._lock = threading.Lock()
+        self._tokens = burst
+        self._refilled_at = time.monotonic()
+        self._paused_until = 0.0
+        self._throttled_rate = rate
+        self._throttled_at: float | None = None
+
+    def acquire(self) -> None:
+        while wait := self._take():
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        while wait := self._take():
+            await asyncio.sleep(wait)
+
+    def _take(self) -> float:
+        """Take a token, returning 0 if one was taken or how long to wait before trying again otherwise."""
+        with self._lock:
+            now = time.monotonic()
+            rate = self._rate(now)
+            self._tokens = min(self._burst, self._tokens + (now - self._refilled_at) * rate)
+            self._refilled_at = now
+            if now < self._paused_until:
+                return self._paused_until - now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0
+            return (1 - self._tokens) / rate
+
+    def throttle(self, pause: float) -> None:
+        with self._lock:
+            now = time.monotonic()
+            # Multiplicative decrease, the rate then recovers to the maximum over `recovery_seconds`
+            self._throttled_rate = max(self._rate(now) / 2, self._max_rate * _MIN_RATE_FRACTION)
+            self._throttled_at = now
+            self._tokens = 0
+            self._paused_until = max(self._paused_until, now + pause)
+
+    def _rate(self, now: float) -> float:
+        if self._throttled_at is None:
+            return self._max_rate
+        recovered = min(1, (now - self._throttled_at) / self._recovery_seconds) if self._recovery_seconds else 1
+        return self._throttled_rate + (self._max_rate - self._throttled_rate) * recovered
+
+
+class RateLimiter:
+    """A client-side rate limiter for hosted algod and indexer endpoints that throttle requests (e.g. AlgoNode).
+
+    Each endpoint (scheme, host and port) gets its own token bucket of `requests_per_second`, shared by every client
+    and thread that uses this limiter, so requests are spread out to stay within the endpoint's budget rather than
+    bursting into HTTP 429 responses. When the endpoint still responds with 429 (or 503 with a `Retry-After`
+    header), requests to it are paused for the `Retry-After` duration (or an exponential backoff if there isn't
+    one) and retried up to `max_retries` times. The endpoint's rate is also halved, then recovers to
+    `requests_per_second` over `recovery_seconds`, so jobs settle at the highest rate the endpoint sustains.
+
+    Pass it to clients via `HttpTransportConfig(rate_limiter=...)`, or to an `AsyncAlgodClient` via its `rate_limiter`
+    parameter.
+
+    :param requests_per_second: The maximum sustained request rate per endpoint
+    :param burst: The number of requests that can be made at once after a quiet period, defaults to
+        `requests_per_second`
+    :param max_retries: The number of times a throttled request is retried, defaults to 5
+    :param max_retry_after: The longest pause in seconds, however long `Retry-After` asks for, defaults to 60
+    :param recovery_seconds: Seconds for the rate to recover to `requests_per_second` after being throttled,
+        defaults to 30
+
+    :example:
+        >>> limiter = RateLimiter(requests_per_second=20)
+        >>> algorand = AlgorandClient.from_config(config, http_transport=HttpTransportConfig(rate_limiter=limiter))
+    """
+
+    def __init__(
+        self,
+        *,
+        requests_per_second: float,
+        burst: int | None = None,
+        max_retries: int = 5,
+        max_retry_after: float = 60,
+        recovery_seconds: float = 30,
+    ):
+        if requests_per_second <= 0:
+            raise ValueError("requests_per_second must be greater than 0")
+        if burst is not None and burst < 1:
+            raise ValueError("burst must be at least 1")
+        self._requests_per_second = requests_per_second
+        self._burst = burst or max(1, requests_per_second)
+        self._recovery_seconds = recovery_seconds
+        self._lock = threading.Lock()
+        self._buckets: dict[str, _TokenBucket] = {}
+        self.max_retries = max_retries
+        """The number of times a throttled request is retried"""
+        self.max_retry_after = max_retry_after
+        """The longest pause in seconds, however long `Retry-After` asks for"""
+        self.throttled = 0
+        """The number of throttled responses received"""
+
+    def acquire(self, url: str) -> None:
+        """Wait until a request can be made to the endpoint of the given URL within its budget.
+
+        :param url: The URL of the request
+        """
+        self._get_bucket(url).acquire()
+
+    async def acquire_async(self, url: str) -> None:
+        """Wait without blocking the event loop until a request can be made to the endpoint of the given URL.
+
+        :param url: The URL of the request
+        """
+        await self._get_bucket(url).acquire_async()
+
+    def throttle(self, url: str, attempt: int, retry_after: str | None = None) -> None:
+        """Record that the endpoint of the given URL throttled a request, pausing requests to it.
+
+        :param url: The URL of the throttled request
+        :param attempt: The number of times the request has been retried so far
+        :param retry_after: The value of the response's `Retry-After` header, if there was one
+        """
+        pause = _parse_retry_after(retry_after)
+        if pause is None:
+            pause = 0.5 * 2**attempt
+        with self._lock:
+            self.throttled += 1
+        self._get_bucket(url).throttle(min(pause, self.max_retry_after))
+
+    def _get_bucket(self, url: str) -> _TokenBucket:
+        parsed = parse.urlsplit(url)
+        endpoint = f"{parsed.scheme}://{parsed.netloc}"
+        with self._lock:
+            bucket = self._buckets.get(endpoint)
+            if bucket is None:
+                bucket = self._buckets[endpoint] = _TokenBucket(
+                    self._requests_per_second, self._burst, self._recovery_seconds
+                )
+            return bucket
+
+
+def _parse_retry_after(retry_after: str | None) -> float | None:
+    """Parse a `Retry-After` header, which is either a number of seconds or an HTTP date."""
+    if not retry_after:
+        return None
+    try:
+        return max(0, float(retry_after))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0, (retry_at - datetime.now(timezone.utc)).total_seconds())
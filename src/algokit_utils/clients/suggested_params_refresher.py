@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+from algosdk import transaction
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    import typing_extensions
+    from algosdk.v2client.algod import AlgodClient
+
+__all__ = [
+    "SuggestedParamsRefresher",
+]
+
+
+class _SuggestedParamsSnapshot(transaction.SuggestedParams):
+    """Suggested params shared between callers, which can't be changed in place.
+
+    Copying a snapshot (with `copy.copy` or `copy.deepcopy`) gives plain, mutable `SuggestedParams`.
+    """
+
+    # Kept out of `__dict__`, so `SuggestedParams(**snapshot.__dict__)` copies still work
+    __slots__ = ("_frozen",)
+    _frozen: bool
+
+    def __init__(self, suggested_params: transaction.SuggestedParams):
+        object.__setattr__(self, "_frozen", False)
+        super().__init__(**vars(suggested_params))  # type: ignore[no-untyped-call]
+        object.__setattr__(self, "_frozen", True)
+
+    def __setattr__(self, name: str, value: Any) -> None:  # noqa: ANN401
+        if self._frozen:
+            raise AttributeError("Suggested params snapshots are shared and can't be changed, copy them first")
+        super().__setattr__(name, value)
+
+    def __copy__(self) -> transaction.SuggestedParams:
+        return transaction.SuggestedParams(**vars(self))
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> transaction.SuggestedParams:
+        return self.__copy__()
+
+
+class SuggestedParamsRefresher:
+    """Keeps suggested params current in the background, so getting them never waits on algod.
+
+    A background thread follows the chain with `status_after_block` and fetches suggested params as each new block
+    arrives. `get` returns the latest params as an immutable snapshot that's shared between callers rather than
+    copied, since changing it in place raises `AttributeError`. Copy it with `copy.copy` to get params that can be
+    changed.
+
+    Params are only fetched on the calling thread when there's no snapshot yet, or when the background thread hasn't
+    been able to refresh them for `max_age` seconds (e.g. because algod is unreachable). The background thread starts
+    on first use of `get` or when `start` is called; call `close` (or use it as a context manager) to stop it.
+
+    :param algod: The algod client to follow the chain and fetch suggested params with
+    :param max_age: Seconds a snapshot is used for before it's fetched again on the calling thread, defaults to 10
+    :param retry_interval: Seconds to wait before following the chain again after an algod error, defaults to 1
+
+    :example:
+        >>> algorand.set_suggested_params_refresher(SuggestedParamsRefresher(algorand.client.algod))
+    """
+
+    def __init__(self, algod: AlgodClient, *, max_age: float = 10, retry_interval: float = 1):
+        self._algod = algod
+        self._max_age = max_age
+        self._retry_interval = retry_interval
+        self._lock = threading.Lock()
+        self._snapshot: _SuggestedParamsSnapshot | None = None
+        self._updated_at = 0.0
+        self._thread: threading.Thread | None = None
+        self._closed = threading.Event()
+
+    @property
+    def current(self) -> transaction.SuggestedParams | None:
+        """The latest snapshot, or None if there isn't one yet or it's older than `max_age`."""
+        with self._lock:
+            snapshot, updated_at = self._snapshot, self._updated_at
+        if snapshot is None or time.monotonic() - updated_at > self._max_age:
+            return None
+        return snapshot
+
+    def get(self) -> transaction.SuggestedParams:
+        """Get the latest suggested params, fetching them on the calling thread only if there's no current snapshot.
+
+        :return: The immutable suggested params snapshot
+        """
+        self.start()
+        return self.current or self.update(self._algod.suggested_params())
+
+    def update(self, suggested_params: transaction.SuggestedParams) -> transaction.SuggestedParams:
+        """Replace the current snapshot, e.g. with suggested params fetched by an async client.
+
+        :param suggested_params: The latest suggested params
+        :return: The immutable snapshot of the given params
+        """
+        snapshot = _SuggestedParamsSnapshot(suggested_params)
+        with self._lock:
+            # Params are only replaced with ones for the same or a later round, as updates can race
+            if self._snapshot is None or snapshot.first >= self._snapshot.first:
+                self._snapshot = snapshot
+                self._updated_at = time.monotonic()
+            return self._snapshot
+
+    def close(self) -> None:
+        """Stop refreshing suggested params in the background."""
+        self._closed.set()
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join()
+
+    def __enter__(self) -> typing_extensions.Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def start(self) -> None:
+        """Start refreshing suggested params in the background, if it hasn't started yet and isn't closed."""
+        with self._lock:
+            if self._thread is not None or self._closed.is_set():
+                return
+            self._thread = threading.Thread(target=self._run, name="algokit-suggested-params", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while not self._closed.is_set():
+            try:
+                with self._lock:
+                    current_round = self._snapshot.first if self._snapshot else None
+                if current_round is not None:
+                    self._algod.status_after_block(current_round)
+                if not self._closed.is_set():
+                    self.update(self._algod.suggested_params())
+            except Exception:
+                self._closed.wait(self._retry_interval)
@@ -2,6 +2,10 @@ import logging
 import os
 from collections.abc import Callable
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from algokit_utils.transactions.instrumentation import PhaseListener
 
 # Environment variable to override the project root
 ALGOKIT_PROJECT_ROOT = os.getenv("ALGOKIT_PROJECT_ROOT")
@@ -50,6 +54,7 @@ class UpdatableConfig:
         max_search_depth (int): The maximum depth to search for a specific file.
         populate_app_call_resources (bool): Whether to populate app call resources.
         logger (logging.Logger): The logger instance to use. Defaults to an AlgoKitLogger instance.
+        phase_listener (PhaseListener | None): A function that receives the timing of each send phase.
     """
 
     def __init__(self) -> None:
@@ -60,6 +65,7 @@ class UpdatableConfig:
         self._trace_buffer_size_mb: int | float = 256  # megabytes
         self._max_search_depth: int = 10
         self._populate_app_call_resources: bool = True
+        self._phase_listener: PhaseListener | None = None
         self._configure_project_root()
 
     def _configure_project_root(self) -> None:
@@ -104,6 +110,17 @@ class UpdatableConfig:
         """Indicates whether or not to populate app call resources."""
         return self._populate_app_call_resources
 
+    @property
+    def phase_listener(self) -> "PhaseListener | None":
+        """Returns the function that receives the timing of each phase of building and sending a group, if any."""
+        return self._phase_listener
+
+    def clear_phase_listener(self) -> None:
+        """
+        Removes the function set with `configure(phase_listener=...)`, so phases are no longer timed.
+        """
+        self._phase_listener = None
+
     def with_debug(self, func: Callable[[], str | None]) -> None:
         """
         Executes a function with debug mode temporarily enabled.
@@ -125,6 +142,7 @@ class UpdatableConfig:
         max_search_depth: int = 10,
         populate_app_call_resources: bool = True,
         logger: logging.Logger | None = None,
+        phase_listener: "PhaseListener | None" = None,
     ) -> None:
         """
         Configures various settings for the application.
@@ -136,10 +154,16 @@ class UpdatableConfig:
         :param max_search_depth: The maximum depth to search for a specific file. Defaults to 10.
         :param populate_app_call_resources: Whether to populate app call resources. Defaults to True.
         :param logger: A custom logger to use. Defaults to AlgoKitLogger instance.
+        :param phase_listener: A function that receives a `PhaseTiming` for each phase of building and sending a
+            transaction group (param fetch, build, simulate, sign, submit, confirmation wait and fetch).
+            Defaults to leaving the current listener in place, use `clear_phase_listener` to remove it.
         """
         if logger is not None:
             self._logger = logger
 
+        if phase_listener is not None:
+            self._phase_listener = phase_listener
+
         if debug is not None:
             self._debug = debug
             # Update logger's level so debug messages are processed only when debug is True.
@@ -24,6 +24,6 @@ class AlgoClientNetworkConfig:
 
 @dataclasses.dataclass
 class AlgoClientConfigs:
-    algod_config: AlgoClientNetworkConfig
+    algod_config: AlgoClientNetworkConfig | list[AlgoClientNetworkConfig]
     indexer_config: AlgoClientNetworkConfig | None
     kmd_config: AlgoClientNetworkConfig | None
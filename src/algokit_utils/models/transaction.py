@@ -46,15 +46,28 @@ TxnTypeT = TypeVar("TxnTypeT", bound=algosdk.transaction.Transaction)
 
 
 class TransactionWrapper:
-    """Wrapper around algosdk.transaction.Transaction with optional property validators"""
+    """Wrapper around algosdk.transaction.Transaction with optional property validators
 
-    def __init__(self, transaction: algosdk.transaction.Transaction) -> None:
+    :param transaction: The transaction to wrap
+    :param tx_id: The ID of the transaction if it's already known, defaults to computing it when first needed
+    """
+
+    def __init__(self, transaction: algosdk.transaction.Transaction, tx_id: str | None = None) -> None:
         self._raw = transaction
+        self._tx_id = tx_id
 
     @property
     def raw(self) -> algosdk.transaction.Transaction:
         return self._raw
 
+    @property
+    def tx_id(self) -> str:
+        """The ID of the transaction"""
+        if self._tx_id is None:
+            # Computing the ID encodes and hashes the transaction, so it's only done once
+            self._tx_id = self._raw.get_txid()
+        return self._tx_id
+
     @property
     def payment(self) -> algosdk.transaction.PaymentTxn:
         return self._return_if_type(
@@ -98,3 +111,4 @@ class SendParams(TypedDict, total=False):
     suppress_log: bool | None
     populate_app_call_resources: bool | None
     cover_app_call_inner_transaction_fees: bool | None
+    max_resubmits_on_expiry: int | None
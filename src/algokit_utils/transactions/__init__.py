@@ -1,3 +1,10 @@
+from algokit_utils.transactions.async_transaction_composer import *  # noqa: F403
+from algokit_utils.transactions.execution_info_cache import *  # noqa: F403
+from algokit_utils.transactions.inner_fee_model import *  # noqa: F403
+from algokit_utils.transactions.instrumentation import *  # noqa: F403
+from algokit_utils.transactions.parallel_signing import *  # noqa: F403
+from algokit_utils.transactions.signed_group_batch import *  # noqa: F403
+from algokit_utils.transactions.submit_retry import *  # noqa: F403
 from algokit_utils.transactions.transaction_composer import *  # noqa: F403
 from algokit_utils.transactions.transaction_creator import *  # noqa: F403
 from algokit_utils.transactions.transaction_sender import *  # noqa: F403
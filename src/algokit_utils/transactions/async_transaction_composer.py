@@ -0,0 +1,558 @@
+from __future__ import annotations
+
+import asyncio
+import base64
+import time
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, Any, NoReturn, cast
+
+from algosdk import error
+from algosdk.atomic_transaction_composer import (
+    AtomicTransactionComposer,
+    AtomicTransactionComposerStatus,
+    SimulateAtomicTransactionResponse,
+    TransactionSigner,
+)
+from algosdk.transaction import SuggestedParams
+from algosdk.v2client.models import SimulateRequestTransactionGroup
+
+from algokit_utils.config import config
+from algokit_utils.models.transaction import SendParams
+from algokit_utils.transactions.instrumentation import SendPhase, time_phase
+from algokit_utils.transactions.submit_retry import _encode_signed_group, _is_group_pending, _RetryAttempts
+from algokit_utils.transactions.transaction_composer import (
+    AdditionalAtcContext,
+    ErrorTransformer,
+    ExecutionInfo,
+    PendingTransactionGroup,
+    SendAtomicTransactionComposerResults,
+    TransactionComposer,
+    TransactionComposerBuildResult,
+    _apply_group_execution_info,
+    _build_debug_send_error,
+    _complete_group_execution_info,
+    _complete_group_send,
+    _covers_inner_fees_from_estimates,
+    _get_debug_simulate_persist_root,
+    _get_group_id,
+    _get_reusable_debug_simulate,
+    _GroupConfirmationWait,
+    _log_expired_resubmit,
+    _log_group_sent,
+    _log_send_error,
+    _log_sending_group,
+    _plan_group_execution_info,
+    _requires_group_preparation,
+    _wrap_transactions,
+)
+
+if TYPE_CHECKING:
+    from algosdk.v2client.algod import AlgodClient
+    from algosdk.v2client.models import SimulateTraceConfig
+
+    from algokit_utils.applications.app_manager import AppManager
+    from algokit_utils.clients.async_algod_client import AsyncAlgodClient
+    from algokit_utils.transactions.execution_info_cache import ExecutionInfoCache
+    from algokit_utils.transactions.inner_fee_model import InnerFeeModel
+    from algokit_utils.transactions.submit_retry import SubmitRetryPolicy
+
+__all__ = [
+    "AsyncTransactionComposer",
+    "prepare_group_for_sending_async",
+    "send_atomic_transaction_composer_async",
+]
+
+
+async def _get_group_execution_info_async(
+    atc: AtomicTransactionComposer,
+    algod: AsyncAlgodClient,
+    populate_app_call_resources: bool | None = None,
+    cover_app_call_inner_transaction_fees: bool | None = None,
+    additional_atc_context: AdditionalAtcContext | None = None,
+) -> ExecutionInfo:
+    execution_info = _plan_group_execution_info(
+        atc, populate_app_call_resources, cover_app_call_inner_transaction_fees, additional_atc_context
+    )
+    if isinstance(execution_info, ExecutionInfo):
+        return execution_info
+
+    empty_signer_atc = execution_info.empty_signer_atc
+    execution_info.request.txn_groups = [SimulateRequestTransactionGroup(txns=empty_signer_atc.gather_signatures())]
+    with time_phase(SendPhase.SIMULATE, len(empty_signer_atc.txn_list)):
+        simulate_response = cast(dict[str, Any], await algod.simulate_transactions(execution_info.request))
+
+    return _complete_group_execution_info(
+        atc,
+        execution_info,
+        simulate_response,
+        populate_app_call_resources,
+        cover_app_call_inner_transaction_fees,
+        additional_atc_context,
+    )
+
+
+async def prepare_group_for_sending_async(
+    atc: AtomicTransactionComposer,
+    algod: AsyncAlgodClient,
+    populate_app_call_resources: bool | None = None,
+    cover_app_call_inner_transaction_fees: bool | None = None,
+    additional_atc_context: AdditionalAtcContext | None = None,
+) -> AtomicTransactionComposer:
+    """Async variant of `prepare_group_for_sending`.
+
+    :param atc: The AtomicTransactionComposer containing transactions
+    :param algod: Async algod client for simulation
+    :param populate_app_call_resources: Whether to populate app call resources
+    :param cover_app_call_inner_transaction_fees: Whether to cover inner txn fees
+    :param additional_atc_context: Additional context for the AtomicTransactionComposer
+    :return: Modified AtomicTransactionComposer ready for sending
+    """
+    execution_info = await _get_group_execution_info_async(
+        atc,
+        algod,
+        populate_app_call_resources if populate_app_call_resources is not None else config.populate_app_call_resource,
+        cover_app_call_inner_transaction_fees,
+        additional_atc_context,
+    )
+    return _apply_group_execution_info(
+        atc, execution_info, cover_app_call_inner_transaction_fees, additional_atc_context
+    )
+
+
+async def _wait_for_confirmation_async(algod: AsyncAlgodClient, txid: str, wait_rounds: int) -> dict[str, Any]:
+    last_round = cast(int, cast(dict, await algod.status())["last-round"])
+    current_round = last_round + 1
+
+    while True:
+        if current_round > last_round + wait_rounds:
+            raise error.ConfirmationTimeoutError(f"Wait for transaction id {txid} timed out")
+
+        try:
+            tx_info = cast(dict[str, Any], await algod.pending_transaction_info(txid))
+
+            # The transaction has been rejected
+            if tx_info.get("pool-error"):
+                raise error.TransactionRejectedError("Transaction rejected: " + tx_info["pool-error"])
+
+            # The transaction has been confirmed
+            if tx_info.get("confirmed-round", 0) != 0:
+                return tx_info
+        except error.AlgodHTTPError:
+            # pending_transaction_info can return 404 until the transaction reaches the pool
+            pass
+
+        await algod.status_after_block(current_round)
+        current_round += 1
+
+
+async def _wait_for_group_confirmations_async(
+    algod: AsyncAlgodClient, tx_ids: list[str], wait_rounds: int, retry_policy: SubmitRetryPolicy | None
+) -> list[dict[str, Any]]:
+    """Async variant of `_wait_for_group_confirmations`, without a confirmation tracker."""
+    wait = _GroupConfirmationWait(tx_ids, wait_rounds, retry_policy)
+    while True:
+        try:
+            current_round = (
+                cast(int, cast(dict, await algod.status())["last-round"]) if wait.needs_current_round else None
+            )
+            rounds_to_wait = wait.get_rounds_to_wait(current_round)
+            with time_phase(SendPhase.CONFIRMATION_WAIT, len(tx_ids)):
+                first_confirmation = await _wait_for_confirmation_async(algod, tx_ids[0], rounds_to_wait)
+            remaining_tx_ids = tx_ids[1:]
+            if not remaining_tx_ids:
+                return [first_confirmation]
+            with time_phase(SendPhase.CONFIRMATION_FETCH, len(tx_ids), count=len(remaining_tx_ids)):
+                remaining_confirmations = await asyncio.gather(
+                    *(algod.pending_transaction_info(tx_id) for tx_id in remaining_tx_ids)
+                )
+            return [first_confirmation, *(cast(dict[str, Any], c) for c in remaining_confirmations)]
+        except Exception as e:
+            delay = wait.get_retry_delay(e)
+            if delay is None:
+                raise
+            await asyncio.sleep(delay)
+
+
+async def _send_raw_group_async(
+    algod: AsyncAlgodClient, encoded_group: bytes, first_tx_id: str, retry_policy: SubmitRetryPolicy | None
+) -> int:
+    """Async variant of `_send_raw_group`, returning the number of attempts it took."""
+    attempts = _RetryAttempts(retry_policy)
+    while True:
+        try:
+            await algod.send_raw_transaction(base64.b64encode(encoded_group))
+            return attempts.count
+        except Exception as e:
+            delay = attempts.get_retry_delay(e)
+            if delay is None:
+                raise
+            await asyncio.sleep(delay)
+            # The failure may have happened after the node accepted the group, in which case it mustn't be resent
+            if _is_group_pending(await _get_pending_transaction_info_async(algod, first_tx_id)):
+                return attempts.count
+
+
+async def _get_pending_transaction_info_async(algod: AsyncAlgodClient, tx_id: str) -> dict[str, Any] | None:
+    try:
+        return cast(dict[str, Any], await algod.pending_transaction_info(tx_id))
+    except Exception:
+        return None
+
+
+async def _raise_send_error_async(
+    error: Exception,
+    atc: AtomicTransactionComposer,
+    algod: AsyncAlgodClient,
+    suppress_log: bool | None,
+    suggested_params: SuggestedParams | None,
+    traced_simulate: SimulateAtomicTransactionResponse | None,
+) -> NoReturn:
+    """Async variant of `_raise_send_error`."""
+    from algokit_utils._debugging import simulate_and_persist_response_async, simulate_response_async
+
+    _log_send_error(error, suppress_log)
+
+    if config.debug:
+        simulate = _get_reusable_debug_simulate(error, atc, traced_simulate)
+        if simulate is None:
+            project_root = _get_debug_simulate_persist_root()
+            simulate = (
+                await simulate_and_persist_response_async(
+                    atc, project_root, algod, config.trace_buffer_size_mb, suggested_params=suggested_params
+                )
+                if project_root
+                else await simulate_response_async(atc, algod)
+            )
+
+        raise _build_debug_send_error(error, simulate) from error
+
+    raise error
+
+
+async def send_atomic_transaction_composer_async(
+    atc: AtomicTransactionComposer,
+    algod: AsyncAlgodClient,
+    *,
+    max_rounds_to_wait: int | None = 5,
+    skip_waiting: bool = False,
+    suppress_log: bool | None = None,
+    populate_app_call_resources: bool | None = None,
+    cover_app_call_inner_transaction_fees: bool | None = None,
+    additional_atc_context: AdditionalAtcContext | None = None,
+    error_transformer: Callable[[Exception], Exception] | None = None,
+) -> SendAtomicTransactionComposerResults:
+    """Async variant of `send_atomic_transaction_composer`.
+
+    Every algod round trip (resource population / fee coverage simulate, submission, confirmation polling and
+    confirmation retrieval) is awaited on the event loop, so many groups can be in flight at once.
+
+    With `skip_waiting` the results are returned as soon as the group has been accepted by algod, without
+    confirmations or ABI return values. Confirmation is awaited in a task on the event loop, and the results'
+    `pending` handle can be awaited for it.
+
+    :param atc: The AtomicTransactionComposer instance containing the transaction group to send
+    :param algod: The async algod client to use for sending the transactions
+    :param max_rounds_to_wait: Maximum number of rounds to wait for confirmation, defaults to 5
+    :param skip_waiting: If True, return as soon as the group is accepted by the node, defaults to False
+    :param suppress_log: If True, suppress logging, defaults to None
+    :param populate_app_call_resources: If True, populate app call resources, defaults to None
+    :param cover_app_call_inner_transaction_fees: If True, cover app call inner transaction fees, defaults to None
+    :param additional_atc_context: Additional context for the AtomicTransactionComposer
+    :param error_transformer: Optional function to transform an error raised while waiting on the `pending` handle
+    :return: Results from sending the transaction group
+    :raises Exception: If there is an error sending the transactions
+    """
+    from algokit_utils._debugging import simulate_and_persist_response_async
+
+    suggested_params = additional_atc_context.suggested_params if additional_atc_context else None
+    retry_policy = additional_atc_context.submit_retry_policy if additional_atc_context else None
+    traced_simulate: SimulateAtomicTransactionResponse | None = None
+
+    try:
+        transactions_with_signer = atc.build_group()
+
+        populate_app_call_resources = (
+            populate_app_call_resources
+            if populate_app_call_resources is not None
+            else config.populate_app_call_resource
+        )
+        learn_inner_fees = not skip_waiting and _covers_inner_fees_from_estimates(
+            atc, populate_app_call_resources, cover_app_call_inner_transaction_fees, additional_atc_context
+        )
+
+        if _requires_group_preparation(
+            transactions_with_signer, populate_app_call_resources, cover_app_call_inner_transaction_fees
+        ):
+            atc = await prepare_group_for_sending_async(
+                atc,
+                algod,
+                populate_app_call_resources,
+                cover_app_call_inner_transaction_fees,
+                additional_atc_context,
+            )
+
+        transactions_to_send = [t.txn for t in atc.build_group()]
+
+        group_id = _get_group_id(transactions_to_send)
+        _log_sending_group(transactions_to_send, atc.tx_ids, group_id, suppress_log)
+
+        if config.debug and config.trace_all and config.project_root:
+            traced_simulate = await simulate_and_persist_response_async(
+                atc,
+                config.project_root,
+                algod,
+                config.trace_buffer_size_mb,
+                suggested_params=suggested_params,
+            )
+
+        with time_phase(SendPhase.SIGN, len(transactions_to_send)):
+            signed_transactions = atc.gather_signatures()
+        with time_phase(SendPhase.SUBMIT, len(transactions_to_send)) as timer:
+            encoded_group = _encode_signed_group(signed_transactions)
+            timer.size_bytes = len(encoded_group)
+            timer.count = await _send_raw_group_async(algod, encoded_group, atc.tx_ids[0], retry_policy)
+        atc.status = AtomicTransactionComposerStatus.SUBMITTED
+
+        if skip_waiting:
+            _log_group_sent(transactions_to_send, atc.tx_ids, group_id, suppress_log)
+            transactions = _wrap_transactions(transactions_to_send, atc.tx_ids)
+            return SendAtomicTransactionComposerResults(
+                group_id=group_id or "",
+                confirmations=[],
+                tx_ids=list(atc.tx_ids),
+                transactions=transactions,
+                returns=[],
+                pending=PendingTransactionGroup(
+                    atc,
+                    asyncio.ensure_future(
+                        _wait_for_group_confirmations_async(algod, atc.tx_ids, max_rounds_to_wait or 5, retry_policy)
+                    ),
+                    group_id=group_id or "",
+                    transactions=transactions,
+                    error_transformer=error_transformer,
+                ),
+            )
+
+        confirmations = await _wait_for_group_confirmations_async(
+            algod, atc.tx_ids, max_rounds_to_wait or 5, retry_policy
+        )
+        return _complete_group_send(
+            atc,
+            transactions_to_send,
+            group_id,
+            confirmations,
+            include_confirmations=True,
+            learn_inner_fees=learn_inner_fees,
+            additional_atc_context=additional_atc_context,
+            suppress_log=suppress_log,
+        )
+
+    except Exception as e:
+        await _raise_send_error_async(e, atc, algod, suppress_log, suggested_params, traced_simulate)
+
+
+class AsyncTransactionComposer(TransactionComposer):
+    """A `TransactionComposer` that simulates and sends on an asyncio event loop.
+
+    Composition (the `add_*` methods) is identical to `TransactionComposer`; `build_async`, `send_async` and
+    `simulate_async` perform their algod round trips through a non-blocking `AsyncAlgodClient` so one event loop
+    can keep hundreds of groups in flight. The synchronous `build`, `send` and `simulate` methods remain available
+    and use the synchronous algod client.
+
+    Note: compiling TEAL for app create / update calls still goes through the (cached) synchronous `AppManager`.
+
+    :param algod: An instance of AlgodClient used for compiling TEAL and the synchronous methods
+    :param async_algod: The async algod client used to get suggested params, simulate and send
+    :param get_signer: A function that takes an address and returns a TransactionSigner for that address
+    :param get_suggested_params: Optional coroutine function to get suggested transaction parameters,
+        defaults to using `async_algod.suggested_params()`
+    :param default_validity_window: Optional default validity window for transactions in rounds, defaults to 10
+    :param app_manager: Optional AppManager instance for compiling TEAL programs, defaults to None
+    :param error_transformers: Optional list of error transformers to use when an error is caught in simulate or send
+    :param execution_info_cache: Optional cache of the simulate responses used to populate app call resources and
+        cover inner transaction fees, defaults to simulating every send
+    :param submit_retry_policy: Optional policy for retrying transient algod failures while submitting and confirming,
+        defaults to not retrying
+    :param inner_fee_model: Optional model of learned inner transaction fees, used to cover app call inner transaction
+        fees without simulating once it's confident, defaults to simulating every send
+
+    :example:
+        >>> composer = algorand.new_async_group()
+        >>> result = await composer.add_payment(params).send_async()
+    """
+
+    def __init__(
+        self,
+        algod: AlgodClient,
+        async_algod: AsyncAlgodClient,
+        get_signer: Callable[[str], TransactionSigner],
+        get_suggested_params: Callable[[], Awaitable[SuggestedParams]] | None = None,
+        default_validity_window: int | None = None,
+        app_manager: AppManager | None = None,
+        error_transformers: list[ErrorTransformer] | None = None,
+        execution_info_cache: ExecutionInfoCache | None = None,
+        submit_retry_policy: SubmitRetryPolicy | None = None,
+        inner_fee_model: InnerFeeModel | None = None,
+    ):
+        super().__init__(
+            algod=algod,
+            get_signer=get_signer,
+            default_validity_window=default_validity_window,
+            app_manager=app_manager,
+            error_transformers=error_transformers,
+            execution_info_cache=execution_info_cache,
+            submit_retry_policy=submit_retry_policy,
+            inner_fee_model=inner_fee_model,
+        )
+        self._async_algod = async_algod
+        self._get_suggested_params_async = get_suggested_params or self._async_algod.suggested_params
+
+    async def build_async(self) -> TransactionComposerBuildResult:
+        """Build the transaction group, fetching suggested params without blocking.
+
+        :return: The built transaction group result
+        """
+        if self._atc.get_status() == AtomicTransactionComposerStatus.BUILDING:
+            suggested_params = await self._get_build_suggested_params_async()
+            with time_phase(SendPhase.BUILD) as timer:
+                self._build(suggested_params)
+                timer.group_size = len(self._atc.txn_list)
+
+        return TransactionComposerBuildResult(
+            atc=self._atc,
+            transactions=self._atc.build_group(),
+            method_calls=self._atc.method_dict,
+        )
+
+    async def _get_build_suggested_params_async(self) -> SuggestedParams:
+        self._expire_build_suggested_params()
+        if self._build_suggested_params is None:
+            with time_phase(SendPhase.PARAM_FETCH):
+                self._build_suggested_params = await self._get_suggested_params_async()
+            self._build_suggested_params_fetched_at = time.monotonic()
+        return self._build_suggested_params
+
+    async def send_async(
+        self, params: SendParams | None = None, *, skip_waiting: bool = False
+    ) -> SendAtomicTransactionComposerResults:
+        """Send the transaction group to the network without blocking the event loop.
+
+        Expired groups are rebuilt and resubmitted in the same way as `send`, when `max_resubmits_on_expiry` is set,
+        as are groups rejected for a too small fee after covering inner transaction fees from the `InnerFeeModel`.
+
+        If `skip_waiting` is set the results are returned as soon as the group has been accepted by algod, without
+        confirmations or ABI return values, and their `pending` handle can be awaited for them. Expired groups can't
+        be resubmitted once the send has returned, so `max_resubmits_on_expiry` doesn't apply.
+
+        :param params: Parameters for the send operation
+        :param skip_waiting: If True, return as soon as the group is accepted by algod, defaults to False
+        :return: The transaction send results
+        :raises self._transform_error: If the transaction fails (may be transformed by error transformers)
+        """
+        if not params:
+            params = SendParams()
+
+        resubmits = 0
+        resimulated_fees = False
+        while True:
+            group = (await self.build_async()).transactions
+            sp = await self._get_build_suggested_params_async()
+            wait_rounds = params.get("max_rounds_to_wait")
+
+            if wait_rounds is None:
+                last_round = max(txn.txn.last_valid_round for txn in group)
+                wait_rounds = last_round - sp.first + 1
+
+            try:
+                result = await send_atomic_transaction_composer_async(
+                    self._atc,
+                    self._async_algod,
+                    max_rounds_to_wait=wait_rounds,
+                    skip_waiting=skip_waiting,
+                    suppress_log=params.get("suppress_log"),
+                    populate_app_call_resources=params.get("populate_app_call_resources"),
+                    cover_app_call_inner_transaction_fees=params.get("cover_app_call_inner_transaction_fees"),
+                    additional_atc_context=self._get_additional_atc_context(sp),
+                    error_transformer=self._transform_error,
+                )
+            except Exception as original_error:
+                if not resimulated_fees and self._forget_inner_fee_estimates(original_error, params):
+                    resimulated_fees = True
+                    self._reset_build()
+                    continue
+                if not await self._should_resubmit_expired_async(original_error, params, resubmits):
+                    raise self._transform_error(original_error) from original_error
+                resubmits += 1
+                _log_expired_resubmit(params, resubmits)
+                self._reset_build()
+                continue
+
+            self._invalidate_cached_execution_info()
+            return result
+
+    async def _should_resubmit_expired_async(self, send_error: Exception, params: SendParams, resubmits: int) -> bool:
+        expiry_error = self._get_resubmittable_expiry_error(send_error, params, resubmits)
+        if not isinstance(expiry_error, error.ConfirmationTimeoutError):
+            return expiry_error is not None
+        try:
+            return self._has_expired(cast(int, cast(dict, await self._async_algod.status())["last-round"]))
+        except Exception:
+            return False
+
+    async def simulate_async(
+        self,
+        allow_more_logs: bool | None = None,
+        allow_empty_signatures: bool | None = None,
+        allow_unnamed_resources: bool | None = None,
+        extra_opcode_budget: int | None = None,
+        exec_trace_config: SimulateTraceConfig | None = None,
+        simulation_round: int | None = None,
+        skip_signatures: bool | None = None,
+    ) -> SendAtomicTransactionComposerResults:
+        """Simulate transaction group execution without blocking the event loop.
+
+        :param allow_more_logs: Whether to allow more logs than the standard limit
+        :param allow_empty_signatures: Whether to allow transactions with empty signatures
+        :param allow_unnamed_resources: Whether to allow unnamed resources.
+        :param extra_opcode_budget: Additional opcode budget to allocate
+        :param exec_trace_config: Configuration for execution tracing
+        :param simulation_round: Round number to simulate at
+        :param skip_signatures: Whether to skip signature validation
+        :return: The simulation results
+        """
+        from algokit_utils._debugging import simulate_and_persist_response_async, simulate_response_async
+
+        if skip_signatures:
+            atc = self._build_unsigned_atc(self._build_transactions(await self._get_build_suggested_params_async()))
+            allow_empty_signatures = True
+        else:
+            atc = (await self.build_async()).atc
+
+        persisted = bool(config.debug and config.project_root and config.trace_all)
+        if persisted:
+            assert config.project_root is not None
+            response = await simulate_and_persist_response_async(
+                atc,
+                config.project_root,
+                self._async_algod,
+                config.trace_buffer_size_mb,
+                allow_more_logs,
+                allow_empty_signatures,
+                allow_unnamed_resources,
+                extra_opcode_budget,
+                exec_trace_config,
+                simulation_round,
+                suggested_params=self._build_suggested_params,
+            )
+        else:
+            response = await simulate_response_async(
+                atc,
+                self._async_algod,
+                allow_more_logs,
+                allow_empty_signatures,
+                allow_unnamed_resources,
+                extra_opcode_budget,
+                exec_trace_config,
+                simulation_round,
+            )
+        return self._build_simulate_results(atc, response, persisted=persisted)
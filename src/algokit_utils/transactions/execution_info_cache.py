@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import copy
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from algosdk import encoding, transaction
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+__all__ = [
+    "ExecutionInfoCache",
+]
+
+# Fields that change from send to send without changing what the group does when evaluated
+_VOLATILE_TRANSACTION_FIELDS = ("fv", "lv", "grp")
+
+
+@dataclass(kw_only=True, frozen=True)
+class _CacheEntry:
+    simulate_response: dict[str, Any]
+    app_ids: frozenset[int]
+    expires_at: float
+
+
+class ExecutionInfoCache:
+    """An opt-in cache of the simulate responses used to populate app call resources and cover inner transaction fees.
+
+    When `populate_app_call_resources` or `cover_app_call_inner_transaction_fees` is enabled every send simulates the
+    group first. For hot paths that send the same group shape over and over, this cache lets repeated sends reuse
+    a previous simulate response instead. Entries are keyed by a structural fingerprint of the group that ignores
+    validity rounds and the group ID, expire after `ttl` seconds and the least recently used entries are evicted
+    once `max_size` is reached.
+
+    The resources a group accesses can depend on chain state (e.g. box names read from global state), so only enable
+    this for calls whose resource usage is stable, and call `invalidate` when that state changes. Entries for an app
+    are invalidated automatically when the app is updated or deleted through a `TransactionComposer` using the cache.
+
+    :param max_size: The maximum number of groups to cache, defaults to 1024
+    :param ttl: The number of seconds an entry stays valid for, defaults to 60
+
+    :example:
+        >>> algorand = AlgorandClient.mainnet().set_execution_info_cache(ExecutionInfoCache(ttl=300))
+    """
+
+    def __init__(self, *, max_size: int = 1024, ttl: float = 60):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self._max_size = max_size
+        self._ttl = ttl
+        self._entries: OrderedDict[bytes, _CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        """The number of lookups that found a valid entry"""
+        self.misses = 0
+        """The number of lookups that didn't find a valid entry"""
+
+    @staticmethod
+    def fingerprint(transactions: Sequence[transaction.Transaction]) -> bytes:
+        """Get the structural fingerprint of a group of transactions.
+
+        :param transactions: The transactions in the group, in group order
+        :return: A digest that is the same for groups that only differ by validity rounds or group ID
+        """
+        digest = hashlib.sha256()
+        for txn in transactions:
+            fields = {k: v for k, v in txn.dictify().items() if k not in _VOLATILE_TRANSACTION_FIELDS}
+            digest.update(encoding.msgpack_encode(fields).encode())
+        return digest.digest()
+
+    def get(self, key: bytes) -> dict[str, Any] | None:
+        """Get a cached simulate response.
+
+        :param key: The group fingerprint
+        :return: A copy of the cached simulate response, or None if there isn't a valid entry
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.expires_at <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return copy.deepcopy(entry.simulate_response)
+
+    def set(
+        self, key: bytes, simulate_response: dict[str, Any], transactions: Sequence[transaction.Transaction]
+    ) -> None:
+        """Cache a simulate response.
+
+        :param key: The group fingerprint
+        :param simulate_response: The simulate response for the group
+        :param transactions: The transactions in the group, used to invalidate the entry by app ID
+        """
+        entry = _CacheEntry(
+            simulate_response=copy.deepcopy(simulate_response),
+            app_ids=frozenset(_get_app_ids(transactions)),
+            expires_at=time.monotonic() + self._ttl,
+        )
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, *, app_id: int | None = None) -> None:
+        """Remove cached entries.
+
+        :param app_id: Only remove entries for groups that call or reference this app, defaults to removing all entries
+        """
+        with self._lock:
+            if app_id is None:
+                self._entries.clear()
+                return
+            for key in [k for k, entry in self._entries.items() if app_id in entry.app_ids]:
+                del self._entries[key]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+def _get_app_ids(transactions: Sequence[transaction.Transaction]) -> set[int]:
+    app_ids: set[int] = set()
+    for txn in transactions:
+        if isinstance(txn, transaction.ApplicationCallTxn):
+            app_ids.add(txn.index)
+            app_ids.update(txn.foreign_apps or [])
+    return app_ids
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from algosdk import transaction
+
+__all__ = [
+    "InnerFeeModel",
+]
+
+_METHOD_SELECTOR_LENGTH = 4
+
+
+@dataclass(kw_only=True)
+class _Observation:
+    inner_fee_delta: int
+    min_txn_fee: int
+    count: int
+
+
+class InnerFeeModel:
+    """An opt-in model of the inner transaction fees app calls need, used to skip the fee coverage simulate.
+
+    When `cover_app_call_inner_transaction_fees` is enabled every send simulates the group to find out how much each
+    app call needs to pay for its inner transactions. Most methods issue the same inner transactions every time, so
+    this model learns the inner fee of each app ID and method selector from previous simulate responses and
+    confirmations. Once the same inner fee has been observed `min_observations` times in a row the model is confident,
+    and groups whose app calls are all confidently known have their fees set from the model (still within each
+    `max_fee`) without simulating.
+
+    Inner fees that depend on arguments or state can't be learned, since their observations keep changing. If a send
+    with estimated fees is rejected because a fee was too small, the estimates for the group are forgotten and it's
+    sent again with fees covered via simulate.
+
+    Estimates are only used when `populate_app_call_resources` is disabled, as populating resources needs a simulate
+    regardless.
+
+    :param min_observations: The number of identical consecutive observations needed to use an estimate,
+        defaults to 3
+    :param max_size: The maximum number of app ID and method selector pairs to keep, defaults to 1024
+
+    :example:
+        >>> algorand = AlgorandClient.mainnet().set_inner_fee_model(InnerFeeModel())
+    """
+
+    def __init__(self, *, min_observations: int = 3, max_size: int = 1024):
+        if min_observations < 1:
+            raise ValueError("min_observations must be at least 1")
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self._min_observations = min_observations
+        self._max_size = max_size
+        self._observations: OrderedDict[tuple[int, bytes], _Observation] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        """The number of lookups that found a confident estimate"""
+        self.misses = 0
+        """The number of lookups that didn't find a confident estimate"""
+
+    @staticmethod
+    def get_key(txn: transaction.ApplicationCallTxn) -> tuple[int, bytes] | None:
+        """Get the key an app call's inner fee is learned under.
+
+        :param txn: The app call transaction
+        :return: The app ID and method selector (empty for bare calls), or None for app creates, which have no app ID
+        """
+        if not txn.index:
+            return None
+        selector = txn.app_args[0][:_METHOD_SELECTOR_LENGTH] if txn.app_args else b""
+        return txn.index, bytes(selector)
+
+    def get(self, txn: transaction.ApplicationCallTxn, min_txn_fee: int) -> int | None:
+        """Get the learned inner fee of an app call.
+
+        :param txn: The app call transaction
+        :param min_txn_fee: The current minimum transaction fee in µALGO
+        :return: The µALGO needed to cover the app call's inner transactions, or None if there isn't a confident
+            estimate
+        """
+        key = self.get_key(txn)
+        with self._lock:
+            inner_fee_delta = self._lookup(key, min_txn_fee)
+            if inner_fee_delta is None:
+                self.misses += 1
+                return None
+            self._observations.move_to_end(key)  # type: ignore[arg-type]
+            self.hits += 1
+            return inner_fee_delta
+
+    def peek(self, txn: transaction.ApplicationCallTxn, min_txn_fee: int) -> int | None:
+        """Get the learned inner fee of an app call like `get`, without counting it as a hit or miss.
+
+        :param txn: The app call transaction
+        :param min_txn_fee: The current minimum transaction fee in µALGO
+        :return: The µALGO needed to cover the app call's inner transactions, or None if there isn't a confident
+            estimate
+        """
+        key = self.get_key(txn)
+        with self._lock:
+            return self._lookup(key, min_txn_fee)
+
+    def observe(self, txn: transaction.ApplicationCallTxn, inner_fee_delta: int, min_txn_fee: int) -> None:
+        """Record the inner fee an app call needed.
+
+        :param txn: The app call transaction
+        :param inner_fee_delta: The µALGO that was needed to cover the app call's inner transactions
+        :param min_txn_fee: The minimum transaction fee in µALGO the inner fee was worked out with
+        """
+        key = self.get_key(txn)
+        if key is None:
+            return
+        with self._lock:
+            observation = self._observations.get(key)
+            if (
+                observation is None
+                or observation.inner_fee_delta != inner_fee_delta
+                or observation.min_txn_fee != min_txn_fee
+            ):
+                self._observations[key] = _Observation(
+                    inner_fee_delta=inner_fee_delta, min_txn_fee=min_txn_fee, count=1
+                )
+            else:
+                observation.count += 1
+            self._observations.move_to_end(key)
+            while len(self._observations) > self._max_size:
+                self._observations.popitem(last=False)
+
+    def forget(self, txn: transaction.ApplicationCallTxn) -> bool:
+        """Forget what has been learned about an app call's inner fee, so it's covered via simulate again.
+
+        :param txn: The app call transaction
+        :return: True if there was a confident estimate for the app call
+        """
+        key = self.get_key(txn)
+        with self._lock:
+            observation = self._observations.pop(key, None) if key else None
+        return observation is not None and observation.count >= self._min_observations
+
+    def invalidate(self, *, app_id: int | None = None) -> None:
+        """Forget learned inner fees.
+
+        :param app_id: Only forget the inner fees of this app's methods, defaults to forgetting everything
+        """
+        with self._lock:
+            if app_id is None:
+                self._observations.clear()
+                return
+            for key in [k for k in self._observations if k[0] == app_id]:
+                del self._observations[key]
+
+    def _lookup(self, key: tuple[int, bytes] | None, min_txn_fee: int) -> int | None:
+        observation = self._observations.get(key) if key else None
+        if observation is None or observation.count < self._min_observations or observation.min_txn_fee != min_txn_fee:
+            return None
+        return observation.inner_fee_delta
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._observations)
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from enum import Enum
+from typing import TYPE_CHECKING
+
+from algokit_utils.config import config
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    import typing_extensions
+
+__all__ = [
+    "PhaseListener",
+    "PhaseTiming",
+    "SendPhase",
+]
+
+
+class SendPhase(str, Enum):
+    """A phase of building and sending a transaction group."""
+
+    PARAM_FETCH = "param_fetch"
+    """Fetching suggested params from algod"""
+    BUILD = "build"
+    """Building the transactions of the group"""
+    SIMULATE = "simulate"
+    """Simulating the group to populate app call resources and cover inner transaction fees"""
+    SIGN = "sign"
+    """Signing the transactions of the group"""
+    SUBMIT = "submit"
+    """Sending the signed group to algod"""
+    CONFIRMATION_WAIT = "confirmation_wait"
+    """Waiting for the group to be confirmed"""
+    CONFIRMATION_FETCH = "confirmation_fetch"
+    """Fetching the confirmations of the rest of the group once it's confirmed"""
+
+
+@dataclass(kw_only=True, frozen=True)
+class PhaseTiming:
+    """The timing of a single phase of building and sending a transaction group."""
+
+    phase: SendPhase
+    """The phase that was timed"""
+    duration: float
+    """How long the phase took, in seconds"""
+    group_size: int | None = None
+    """The number of transactions in the group, if known at this phase"""
+    size_bytes: int | None = None
+    """The number of bytes sent to algod, for phases that send the encoded group"""
+    count: int = 1
+    """The number of algod requests or operations the phase performed"""
+    failed: bool = False
+    """Whether the phase raised an error"""
+
+
+PhaseListener = Callable[[PhaseTiming], None]
+"""A function that receives the timing of each phase, set with `config.configure(phase_listener=...)`"""
+
+
+class _PhaseTimer:
+    """Times a phase and reports it to the configured phase listener, doing nothing when none is configured."""
+
+    __slots__ = ("_listener", "_phase", "_start", "count", "group_size", "size_bytes")
+
+    def __init__(self, phase: SendPhase, group_size: int | None = None, count: int = 1):
+        self.group_size = group_size
+        self.size_bytes: int | None = None
+        self.count = count
+        self._phase = phase
+        self._listener = config.phase_listener
+        self._start = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the phase is being reported, so callers can skip gathering extra details when it isn't."""
+        return self._listener is not None
+
+    def __enter__(self) -> typing_extensions.Self:
+        if self._listener is not None:
+            self._start = time.perf_counter()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if self._listener is None:
+            return
+        timing = PhaseTiming(
+            phase=self._phase,
+            duration=time.perf_counter() - self._start,
+            group_size=self.group_size,
+            size_bytes=self.size_bytes,
+            count=self.count,
+            failed=exc_type is not None,
+        )
+        try:
+            self._listener(timing)
+        except Exception as e:
+            # Instrumentation must never break sending
+            config.logger.warning(f"Phase listener failed for {self._phase.value}: {e}")
+
+
+def time_phase(phase: SendPhase, group_size: int | None = None, count: int = 1) -> _PhaseTimer:
+    """Time a phase of building and sending a transaction group, reporting it to the configured phase listener.
+
+    :param phase: The phase being timed
+    :param group_size: The number of transactions in the group, if known, defaults to None
+    :param count: The number of algod requests or operations the phase performs, defaults to 1
+    :return: A context manager that times the phase, whose `group_size`, `size_bytes` and `count` can be updated
+        before it exits
+    """
+    return _PhaseTimer(phase, group_size, count)
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import base64
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING
+
+import algosdk
+from algosdk import constants
+from algosdk.atomic_transaction_composer import AccountTransactionSigner, TransactionSigner
+from nacl.signing import SigningKey
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from types import TracebackType
+
+    import typing_extensions
+    from algosdk.atomic_transaction_composer import TransactionWithSigner
+
+__all__ = [
+    "ParallelSigner",
+]
+
+
+class ParallelSigner:
+    """Signs large batches of transaction groups, fanning ed25519 signing for key-based signers out over processes.
+
+    Transactions signed by an `AccountTransactionSigner` (e.g. from `SigningAccount.signer`) are batched per
+    private key and signed in a process pool, so signing tens of thousands of transactions uses every core rather
+    than one. Transactions with any other signer (multisig, logic signature, KMD or custom signers) are signed by
+    their own signer in the calling process, exactly as `AtomicTransactionComposer` would. Signers are used as is,
+    so the `TransactionSigner` protocol doesn't change.
+
+    The process pool is started on first use, with the `spawn` start method so it's safe to use alongside the
+    background threads of e.g. `ConfirmationTracker`; call `close` (or use it as a context manager) to shut it down.
+
+    :param max_workers: Maximum number of signing processes, defaults to the number of CPUs
+    :param chunk_size: Number of transactions sent to a process at a time, batches with no more than this many key
+        signed transactions are signed in the calling process, defaults to 512
+
+    :example:
+        >>> with ParallelSigner() as signer:
+        ...     groups = TransactionComposer.sign_many(composers, parallel_signer=signer)
+    """
+
+    def __init__(self, *, max_workers: int | None = None, chunk_size: int = 512):
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        self._max_workers = max_workers
+        self._chunk_size = chunk_size
+        self._executor: ProcessPoolExecutor | None = None
+
+    def sign_groups(
+        self, groups: Sequence[Sequence[TransactionWithSigner]]
+    ) -> list[list[algosdk.transaction.GenericSignedTransaction]]:
+        """Sign every transaction in the given groups with its signer.
+
+        :param groups: The transaction groups to sign, with their group IDs already assigned
+        :return: The signed transactions of each group, in the same order
+        """
+        signed: list[list[algosdk.transaction.GenericSignedTransaction | None]] = [[None] * len(g) for g in groups]
+
+        key_positions: dict[str, list[tuple[int, int]]] = {}
+        for group_index, group in enumerate(groups):
+            other_signer_indexes: dict[TransactionSigner, list[int]] = {}
+            for txn_index, txn_with_signer in enumerate(group):
+                # Subclasses may sign differently, so only the plain key signer is signed out of process
+                if type(txn_with_signer.signer) is AccountTransactionSigner:
+                    key_positions.setdefault(txn_with_signer.signer.private_key, []).append((group_index, txn_index))
+                else:
+                    other_signer_indexes.setdefault(txn_with_signer.signer, []).append(txn_index)
+
+            txns = [t.txn for t in group]
+            for signer, indexes in other_signer_indexes.items():
+                for txn_index, stxn in zip(indexes, signer.sign_transactions(txns, indexes), strict=True):
+                    signed[group_index][txn_index] = stxn
+
+        chunks = [
+            (private_key, positions[i : i + self._chunk_size])
+            for private_key, positions in key_positions.items()
+            for i in range(0, len(positions), self._chunk_size)
+        ]
+        if len(chunks) <= 1:
+            # A single chunk isn't worth the round trip to another process
+            signatures = [
+                _sign_encoded_transactions(private_key, _encode_transactions(groups, positions))
+                for private_key, positions in chunks
+            ]
+        else:
+            executor = self._get_executor()
+            futures = [
+                executor.submit(_sign_encoded_transactions, private_key, _encode_transactions(groups, positions))
+                for private_key, positions in chunks
+            ]
+            signatures = [future.result() for future in futures]
+
+        for (private_key, positions), chunk_signatures in zip(chunks, signatures, strict=True):
+            address = algosdk.account.address_from_private_key(private_key)
+            for (group_index, txn_index), signature in zip(positions, chunk_signatures, strict=True):
+                txn = groups[group_index][txn_index].txn
+                signed[group_index][txn_index] = algosdk.transaction.SignedTransaction(
+                    txn,
+                    base64.b64encode(signature).decode(),
+                    # Mirrors `Transaction.sign`, a rekeyed sender is signed for by its auth address
+                    address if txn.sender != address else None,
+                )
+
+        return [[_ensure_signed(stxn) for stxn in group] for group in signed]
+
+    def close(self) -> None:
+        """Shut down the signing processes."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self) -> typing_extensions.Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # Forking a process that's running background threads (e.g. the confirmation tracker) can deadlock the child
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._max_workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._executor
+
+
+def _encode_transactions(
+    groups: Sequence[Sequence[TransactionWithSigner]], positions: list[tuple[int, int]]
+) -> list[bytes]:
+    return [base64.b64decode(algosdk.encoding.msgpack_encode(groups[g][t].txn)) for g, t in positions]
+
+
+def _sign_encoded_transactions(private_key: str, encoded_transactions: list[bytes]) -> list[bytes]:
+    # Runs in the worker processes, mirrors `Transaction.raw_sign` without decoding the transactions again
+    signing_key = SigningKey(base64.b64decode(private_key)[: constants.key_len_bytes])
+    return [signing_key.sign(constants.txid_prefix + txn).signature for txn in encoded_transactions]
+
+
+def _ensure_signed(
+    stxn: algosdk.transaction.GenericSignedTransaction | None,
+) -> algosdk.transaction.GenericSignedTransaction:
+    if stxn is None:
+        raise algosdk.error.AtomicTransactionComposerError("missing signatures")
+    return stxn
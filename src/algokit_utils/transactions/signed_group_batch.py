@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import contextlib
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, cast
+
+import algosdk
+import msgpack  # type: ignore[import-untyped]
+
+from algokit_utils.transactions.submit_retry import _encode_signed_group, _send_raw_group
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+
+    from algosdk.v2client.algod import AlgodClient
+
+    from algokit_utils.transactions.submit_retry import SubmitRetryPolicy
+
+__all__ = [
+    "SignedGroup",
+    "SubmitSignedGroupsResult",
+    "read_signed_groups",
+    "submit_signed_groups",
+    "write_signed_groups",
+]
+
+_FORMAT = "algokit-signed-groups"
+_VERSION = 1
+# Roughly the block time, how often the current round is fetched again while submitting a batch
+_ROUND_REFRESH_SECONDS = 3
+
+
+@dataclass(kw_only=True, frozen=True)
+class SignedGroup:
+    """A signed transaction group, encoded exactly as it's submitted to algod."""
+
+    encoded: bytes
+    """The concatenated msgpack encoded signed transactions of the group"""
+    tx_id: str
+    """The ID of the first transaction in the group"""
+    last_valid_round: int
+    """The last round the whole group is valid for"""
+
+    @staticmethod
+    def from_signed_transactions(
+        signed_transactions: Sequence[algosdk.transaction.GenericSignedTransaction],
+    ) -> SignedGroup:
+        """Encode a signed transaction group.
+
+        :param signed_transactions: The signed transactions of the group, in group order
+        :return: The encoded signed group
+        """
+        if not signed_transactions:
+            raise ValueError("Can't encode an empty transaction group")
+        return SignedGroup(
+            encoded=_encode_signed_group(signed_transactions),
+            tx_id=signed_transactions[0].transaction.get_txid(),
+            last_valid_round=min(stxn.transaction.last_valid_round for stxn in signed_transactions),
+        )
+
+
+@dataclass(kw_only=True)
+class SubmitSignedGroupsResult:
+    """The outcome of submitting a batch of signed transaction groups with `submit_signed_groups`."""
+
+    submitted: list[str] = field(default_factory=list)
+    """The ID of the first transaction of each group accepted by algod, in batch order"""
+    expired: list[str] = field(default_factory=list)
+    """The ID of the first transaction of each group skipped because its validity window had passed"""
+    failed: dict[str, Exception] = field(default_factory=dict)
+    """The error for each group algod didn't accept, keyed by the ID of its first transaction"""
+
+
+def write_signed_groups(file: str | Path | IO[bytes], groups: Iterable[SignedGroup]) -> int:
+    """Write signed transaction groups to a compact msgpack batch, e.g. to submit them later from another process.
+
+    Groups are written as they're iterated, so large batches can be produced without holding them in memory.
+
+    :param file: The path of the batch file to create, or a binary file object to write to
+    :param groups: The signed groups to write
+    :return: The number of groups written
+
+    :example:
+        >>> write_signed_groups("batch.msgpack", (composer.sign() for composer in composers))
+    """
+    packer = msgpack.Packer()
+    count = 0
+    with _open(file, "wb") as f:
+        f.write(packer.pack({"format": _FORMAT, "version": _VERSION}))
+        for group in groups:
+            f.write(packer.pack((group.encoded, group.tx_id, group.last_valid_round)))
+            count += 1
+    return count
+
+
+def read_signed_groups(file: str | Path | IO[bytes]) -> Iterator[SignedGroup]:
+    """Stream the signed transaction groups in a batch written by `write_signed_groups`.
+
+    The signed transactions aren't decoded, each group is yielded as the encoded bytes that are submitted to algod.
+
+    :param file: The path of the batch file, or a binary file object to read from
+    :raises ValueError: If the file isn't a signed transaction group batch, or is from an unsupported version
+    :return: An iterator of the signed groups in batch order
+    """
+    with _open(file, "rb") as f:
+        unpacker = msgpack.Unpacker(f, raw=False)
+        header = next(unpacker, None)
+        if not isinstance(header, dict) or header.get("format") != _FORMAT:
+            raise ValueError("Not a signed transaction group batch")
+        if header.get("version") != _VERSION:
+            raise ValueError(f"Unsupported signed transaction group batch version: {header.get('version')}")
+        for encoded, tx_id, last_valid_round in unpacker:
+            yield SignedGroup(encoded=encoded, tx_id=tx_id, last_valid_round=last_valid_round)
+
+
+def submit_signed_groups(
+    algod: AlgodClient,
+    file: str | Path | IO[bytes],
+    *,
+    retry_policy: SubmitRetryPolicy | None = None,
+    stop_on_error: bool = True,
+) -> SubmitSignedGroupsResult:
+    """Submit every group in a signed transaction group batch, in order, without waiting for confirmation.
+
+    The batch is streamed and each group's encoded bytes are sent as is with `send_raw_transaction`, so submitting
+    needs next to no CPU. Groups whose validity window has already passed are skipped.
+
+    :param algod: The algod client to submit the groups with
+    :param file: The path of the batch file, or a binary file object to read from
+    :param retry_policy: Optional policy for retrying transient algod failures, defaults to not retrying
+    :param stop_on_error: Whether to raise the first submission error, rather than recording it and continuing,
+        defaults to True
+    :return: The IDs of the submitted, expired and failed groups
+
+    :example:
+        >>> result = submit_signed_groups(algorand.client.algod, "batch.msgpack")
+        >>> confirmations = [algorand.client.confirmation_tracker.track([tx_id]) for tx_id in result.submitted]
+    """
+    current_round = _get_last_round(algod)
+    round_checked_at = time.monotonic()
+    result = SubmitSignedGroupsResult()
+    for group in read_signed_groups(file):
+        if time.monotonic() - round_checked_at >= _ROUND_REFRESH_SECONDS:
+            # Long batches span many rounds, so the round groups are checked against is kept current
+            with contextlib.suppress(Exception):
+                current_round = _get_last_round(algod)
+            round_checked_at = time.monotonic()
+        # The next round to be proposed is the earliest the group can be confirmed in
+        if group.last_valid_round <= current_round:
+            result.expired.append(group.tx_id)
+            continue
+        try:
+            _send_raw_group(algod, group.encoded, group.tx_id, retry_policy)
+        except Exception as e:
+            if stop_on_error:
+                raise
+            result.failed[group.tx_id] = e
+            continue
+        result.submitted.append(group.tx_id)
+    return result
+
+
+def _get_last_round(algod: AlgodClient) -> int:
+    return cast(int, cast(dict[str, Any], algod.status())["last-round"])
+
+
+def _open(file: str | Path | IO[bytes], mode: str) -> contextlib.AbstractContextManager[IO[bytes]]:
+    if isinstance(file, str | Path):
+        return cast(IO[bytes], Path(file).open(mode))
+    # Leave file objects owned by the caller open
+    return contextlib.nullcontext(file)
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import base64
+import random
+import time
+import urllib.error
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, cast
+
+import algosdk
+import httpx
+from algosdk import error
+
+from algokit_utils.config import config
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from algosdk.v2client.algod import AlgodClient
+
+__all__ = [
+    "SubmitRetryPolicy",
+]
+
+
+@dataclass(kw_only=True, frozen=True)
+class SubmitRetryPolicy:
+    """How to retry transient algod failures while submitting a signed group and waiting for it to be confirmed.
+
+    Retries resubmit the exact same signed bytes, so the transaction IDs don't change and a group can never be
+    executed twice. Before each resubmission the pending transaction info of the group is checked, so a group that
+    reached the node before the failure isn't sent again.
+
+    :example:
+        >>> algorand = AlgorandClient.mainnet().set_submit_retry_policy(SubmitRetryPolicy(max_attempts=5))
+    """
+
+    max_attempts: int = 4
+    """The maximum number of attempts, including the first, defaults to 4"""
+    initial_delay: float = 0.25
+    """The delay before the first retry in seconds, defaults to 0.25"""
+    backoff_factor: float = 2
+    """The factor the delay is multiplied by after each retry, defaults to 2"""
+    max_delay: float = 5
+    """The maximum delay between attempts in seconds, defaults to 5"""
+    jitter: float = 0.1
+    """The fraction of each delay that's randomised to spread out concurrent retries, defaults to 0.1"""
+    retryable_status_codes: frozenset[int] = field(default_factory=lambda: frozenset({500, 502, 503, 504}))
+    """The algod HTTP status codes that are retried, defaults to 500, 502, 503 and 504"""
+
+    def __post_init__(self) -> None:
+        if self.max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+
+    def is_retryable(self, e: Exception) -> bool:
+        """Whether the given error is a transient failure that's safe to retry.
+
+        :param e: The error raised by algod or the HTTP transport
+        :return: True for connection errors, timeouts and the configured HTTP status codes
+        """
+        if isinstance(e, error.AlgodHTTPError):
+            return e.code in self.retryable_status_codes
+        # urllib wraps connection failures in URLError, httpx raises TransportError for the async client
+        return isinstance(e, urllib.error.URLError | ConnectionError | TimeoutError | httpx.TransportError)
+
+    def get_delay(self, attempt: int) -> float:
+        """Get the delay before the next attempt.
+
+        :param attempt: The number of the attempt that just failed, starting at 1
+        :return: The delay in seconds
+        """
+        delay = min(self.initial_delay * self.backoff_factor ** (attempt - 1), self.max_delay)
+        return delay * (1 + random.uniform(-self.jitter, self.jitter))
+
+
+def _encode_signed_group(signed_transactions: Iterable[algosdk.transaction.GenericSignedTransaction]) -> bytes:
+    return b"".join(base64.b64decode(algosdk.encoding.msgpack_encode(stxn)) for stxn in signed_transactions)
+
+
+def _send_raw_group(
+    algod: AlgodClient, encoded_group: bytes, first_tx_id: str, retry_policy: SubmitRetryPolicy | None
+) -> int:
+    """Send the encoded signed group, retrying transient failures, and return the number of attempts it took."""
+    attempts = _RetryAttempts(retry_policy)
+    while True:
+        try:
+            algod.send_raw_transaction(base64.b64encode(encoded_group))
+            return attempts.count
+        except Exception as e:
+            delay = attempts.get_retry_delay(e)
+            if delay is None:
+                raise
+            time.sleep(delay)
+            # The failure may have happened after the node accepted the group, in which case it mustn't be resent
+            if _is_group_pending(_get_pending_transaction_info(algod, first_tx_id)):
+                return attempts.count
+
+
+class _RetryAttempts:
+    """Counts the attempts at an algod call and decides whether a failed one is retried."""
+
+    def __init__(self, retry_policy: SubmitRetryPolicy | None):
+        self.retry_policy = retry_policy
+        self.count = 1
+
+    def get_retry_delay(self, e: Exception) -> float | None:
+        """Get the delay before the next attempt after the given failure, or None if it shouldn't be retried."""
+        delay = _get_retry_delay(self.retry_policy, e, self.count)
+        if delay is not None:
+            self.count += 1
+        return delay
+
+
+def _get_retry_delay(retry_policy: SubmitRetryPolicy | None, e: Exception, attempt: int) -> float | None:
+    """Get the delay before retrying after the given failed attempt, or None if it shouldn't be retried."""
+    if retry_policy is None or attempt >= retry_policy.max_attempts or not retry_policy.is_retryable(e):
+        return None
+    delay = retry_policy.get_delay(attempt)
+    config.logger.warning(
+        f"Transient algod failure, retrying in {delay:.2f}s (attempt {attempt + 1} of {retry_policy.max_attempts}): {e}"
+    )
+    return delay
+
+
+def _is_group_pending(tx_info: dict[str, Any] | None) -> bool:
+    return tx_info is not None and not tx_info.get("pool-error")
+
+
+def _get_pending_transaction_info(algod: AlgodClient, tx_id: str) -> dict[str, Any] | None:
+    # Either the node hasn't seen the transaction (404) or it's still unreachable; in both cases it needs to be sent
+    try:
+        return cast(dict[str, Any], algod.pending_transaction_info(tx_id))
+    except Exception:
+        return None
@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+import asyncio
 import base64
+import contextlib
 import json
 import re
-from collections.abc import Callable
-from copy import deepcopy
+import threading
+import time
+from collections.abc import Callable, Generator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from copy import copy, deepcopy
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, TypedDict, Union, cast
+from typing import TYPE_CHECKING, Any, NoReturn, TypedDict, Union, cast
 
 import algosdk
 import algosdk.atomic_transaction_composer
@@ -20,6 +25,7 @@ from algosdk.atomic_transaction_composer import (
 )
 from algosdk.transaction import OnComplete, SuggestedParams
 from algosdk.v2client.algod import AlgodClient
+from algosdk.v2client.models import SimulateTraceConfig
 from algosdk.v2client.models.simulate_request import SimulateRequest
 from typing_extensions import deprecated
 
@@ -30,11 +36,24 @@ from algokit_utils.config import config
 from algokit_utils.models.state import BoxIdentifier, BoxReference
 from algokit_utils.models.transaction import SendParams, TransactionWrapper
 from algokit_utils.protocols.account import TransactionSignerAccountProtocol
+from algokit_utils.transactions.execution_info_cache import ExecutionInfoCache
+from algokit_utils.transactions.inner_fee_model import InnerFeeModel
+from algokit_utils.transactions.instrumentation import SendPhase, time_phase
+from algokit_utils.transactions.parallel_signing import ParallelSigner
+from algokit_utils.transactions.signed_group_batch import SignedGroup
+from algokit_utils.transactions.submit_retry import (
+    SubmitRetryPolicy,
+    _encode_signed_group,
+    _RetryAttempts,
+    _send_raw_group,
+)
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from algosdk.abi import Method
-    from algosdk.v2client.models import SimulateTraceConfig
 
+    from algokit_utils.clients.confirmation_tracker import ConfirmationTracker
     from algokit_utils.models.amount import AlgoAmount
     from algokit_utils.models.transaction import Arc2TransactionNote
 
@@ -65,9 +84,11 @@ __all__ = [
     "BuiltTransactions",
     "ErrorTransformer",
     "MethodCallParams",
+    "MethodCallTemplate",
     "OfflineKeyRegistrationParams",
     "OnlineKeyRegistrationParams",
     "PaymentParams",
+    "PendingTransactionGroup",
     "SendAtomicTransactionComposerResults",
     "TransactionComposer",
     "TransactionComposerBuildResult",
@@ -76,12 +97,14 @@ __all__ = [
     "populate_app_call_resources",
     "prepare_group_for_sending",
     "send_atomic_transaction_composer",
+    "submit_atomic_transaction_composer",
 ]
 
 
 MAX_TRANSACTION_GROUP_SIZE = 16
 MAX_APP_CALL_FOREIGN_REFERENCES = 8
 MAX_APP_CALL_ACCOUNT_REFERENCES = 4
+MAX_APP_CALL_ARGS = 16
 
 
 class InvalidErrorTransformerValueError(Exception):
@@ -137,6 +160,12 @@ class AdditionalAtcContext:
     """The maximum fees for each transaction, defaults to None"""
     suggested_params: SuggestedParams | None = None
     """The suggested parameters for the transaction, defaults to None"""
+    execution_info_cache: ExecutionInfoCache | None = None
+    """Cache of simulate responses used to resolve execution info, defaults to None"""
+    submit_retry_policy: SubmitRetryPolicy | None = None
+    """How to retry transient algod failures while submitting and confirming, defaults to not retrying"""
+    inner_fee_model: InnerFeeModel | None = None
+    """Learned inner transaction fees used to cover app call fees without simulating, defaults to None"""
 
 
 @dataclass(kw_only=True, frozen=True)
@@ -511,6 +540,117 @@ TxnParams = Union[  # noqa: UP007
 ]
 
 
+class MethodCallTemplate:
+    """A precompiled call to an ABI method of an existing app, for adding many calls that only differ by their args.
+
+    Resolving the ABI method, its selector and argument types, box references and signer happens once when the
+    template is created. Each call added with `TransactionComposer.add_method_call_template` then only encodes its
+    arguments and is built with the composer's suggested params, skipping the per-call method resolution and
+    intermediate `AtomicTransactionComposer` that `add_app_call_method_call` goes through.
+
+    Only methods whose arguments are all ABI values are supported. Methods that take reference or transaction
+    arguments need `add_app_call_method_call`.
+
+    :param params: The method call to precompile, any `args` are ignored
+    :raises ValueError: If the method takes a reference or transaction argument
+
+    :example:
+        >>> template = MethodCallTemplate(AppCallMethodCallParams(sender=sender, app_id=app_id, method=method))
+        >>> composer = algorand.new_group()
+        >>> for order in orders:
+        ...     composer.add_method_call_template(template, [order.price, order.quantity])
+    """
+
+    def __init__(self, params: AppCallMethodCallParams):
+        # `method` is typed as an algosdk Method, but ARC-56 methods are accepted too
+        raw_method: algosdk.abi.Method | Arc56Method = params.method
+        method = raw_method.to_abi_method() if isinstance(raw_method, Arc56Method) else raw_method
+        arg_types: list[algosdk.abi.ABIType] = []
+        for arg in method.args:
+            if not isinstance(arg.type, algosdk.abi.ABIType):
+                raise ValueError(
+                    f"Method call templates only support ABI value arguments, but {method.name} takes a {arg.type} "
+                    "argument"
+                )
+            arg_types.append(arg.type)
+        # Mirrors `AtomicTransactionComposer.add_method_call`, which packs any arguments past the 14th into a tuple
+        if len(arg_types) > MAX_APP_CALL_ARGS - 1:
+            arg_types = [
+                *arg_types[: MAX_APP_CALL_ARGS - 2],
+                algosdk.abi.TupleType(arg_types[MAX_APP_CALL_ARGS - 2 :]),
+            ]
+
+        self.params = params
+        """The precompiled method call parameters"""
+        self.method = method
+        """The ABI method that is called"""
+        self.signer = (
+            params.signer.signer if isinstance(params.signer, TransactionSignerAccountProtocol) else params.signer
+        )
+        """The signer for the calls, if set on the parameters"""
+        self._selector = method.get_selector()
+        self._arg_count = len(method.args)
+        self._arg_types = arg_types
+        self._on_complete = params.on_complete or OnComplete.NoOpOC
+        self._boxes = (
+            [AppManager.get_box_reference(ref) for ref in params.box_references] if params.box_references else None
+        )
+
+    def encode_args(self, args: Sequence[Any]) -> list[bytes]:
+        """Encode the arguments of a call into app args.
+
+        :param args: The ABI method arguments
+        :return: The app args of the call, starting with the method selector
+        :raises ValueError: If the wrong number of arguments is given
+        """
+        if len(args) != self._arg_count:
+            raise ValueError(f"{self.method.name} takes {self._arg_count} arguments, but {len(args)} were given")
+        if len(self._arg_types) < self._arg_count:
+            packed_from = len(self._arg_types) - 1
+            args = [*args[:packed_from], list(args[packed_from:])]
+        return [self._selector, *(arg_type.encode(arg) for arg_type, arg in zip(self._arg_types, args, strict=True))]
+
+    def build_transaction(
+        self,
+        app_args: list[bytes],
+        suggested_params: algosdk.transaction.SuggestedParams,
+        *,
+        note: bytes | None = None,
+        lease: bytes | None = None,
+        rekey_to: str | None = None,
+    ) -> algosdk.transaction.ApplicationCallTxn:
+        """Build the app call transaction for a call.
+
+        :param app_args: The encoded app args of the call, from `encode_args`
+        :param suggested_params: The suggested params to build the transaction with, used as is
+        :param note: The transaction note, defaults to None
+        :param lease: The encoded transaction lease, defaults to None
+        :param rekey_to: The address to rekey the sender to, defaults to None
+        :return: The app call transaction
+        """
+        # Foreign arrays are copied since resource population adds to them in place
+        return algosdk.transaction.ApplicationCallTxn(
+            sender=self.params.sender,
+            sp=suggested_params,
+            index=self.params.app_id,
+            on_complete=self._on_complete,
+            app_args=app_args,
+            accounts=list(self.params.account_references) if self.params.account_references else None,
+            foreign_apps=list(self.params.app_references) if self.params.app_references else None,
+            foreign_assets=list(self.params.asset_references) if self.params.asset_references else None,
+            boxes=self._boxes,
+            note=note,
+            lease=lease,
+            rekey_to=rekey_to,
+        )
+
+
+@dataclass(frozen=True, kw_only=True)
+class _MethodCallTemplateCall:
+    template: MethodCallTemplate
+    app_args: list[bytes]
+
+
 @dataclass(frozen=True, kw_only=True)
 class TransactionContext:
     """Contextual information for a transaction."""
@@ -587,6 +727,111 @@ class SendAtomicTransactionComposerResults:
     """The ABI return values from any ABI method calls"""
     simulate_response: dict[str, Any] | None = None
     """The simulation response if simulation was performed, defaults to None"""
+    pending: PendingTransactionGroup | None = None
+    """A handle to wait for confirmation with if the group was sent with `skip_waiting`, defaults to None"""
+
+
+class PendingTransactionGroup:
+    """A transaction group that has been submitted to the network, but may not be confirmed yet.
+
+    Call `result()` to block until it's confirmed, or await the handle from async code. When confirmation is awaited
+    in a task on an event loop, only awaiting works on that loop's thread, as blocking it would stop the task.
+
+    :param atc: The submitted AtomicTransactionComposer, used to parse ABI return values
+    :param confirmations: A future, or an asyncio task, that resolves to the pending transaction info of each
+        transaction in the group
+    :param group_id: The group ID if this was a transaction group
+    :param transactions: The transactions that were sent
+    :param error_transformer: Optional function to transform an error raised while waiting for confirmation
+    """
+
+    def __init__(
+        self,
+        atc: AtomicTransactionComposer,
+        confirmations: Future[list[dict[str, Any]]] | asyncio.Future[list[dict[str, Any]]],
+        *,
+        group_id: str,
+        transactions: list[TransactionWrapper],
+        error_transformer: Callable[[Exception], Exception] | None = None,
+    ):
+        self._atc = atc
+        self._confirmations = confirmations
+        if isinstance(confirmations, asyncio.Future):
+            # Like a thread's future, a group that's never waited for shouldn't log its error as never retrieved
+            confirmations.add_done_callback(lambda task: task.cancelled() or task.exception())
+        self._error_transformer = error_transformer
+        self.group_id = group_id
+        """The group ID if this was a transaction group"""
+        self.tx_ids = list(atc.tx_ids)
+        """The transaction IDs that were sent"""
+        self.transactions = transactions
+        """The transactions that were sent"""
+
+    def done(self) -> bool:
+        """Whether the group has been confirmed or has failed."""
+        return self._confirmations.done()
+
+    def result(self, timeout: float | None = None) -> SendAtomicTransactionComposerResults:
+        """Wait for the group to be confirmed and return the send results.
+
+        :param timeout: Maximum number of seconds to wait, defaults to waiting until the group is confirmed or its
+            `max_rounds_to_wait` elapses
+        :raises TimeoutError: If `timeout` elapses before the group is resolved
+        :raises RuntimeError: If confirmation is awaited in a task on the event loop of the calling thread
+        :raises Exception: If the group was rejected or wasn't confirmed in time
+        :return: The transaction send results
+        """
+        if isinstance(self._confirmations, asyncio.Future):
+            error = self._get_task_exception(self._confirmations, timeout)
+        else:
+            error = self._confirmations.exception(timeout)
+        if isinstance(error, Exception):
+            if self._error_transformer:
+                raise self._error_transformer(error) from error
+            raise error
+        confirmations = self._confirmations.result()
+
+        self._atc.status = algosdk.atomic_transaction_composer.AtomicTransactionComposerStatus.COMMITTED
+        return SendAtomicTransactionComposerResults(
+            group_id=self.group_id,
+            confirmations=cast(list[algosdk.v2client.algod.AlgodResponseType], confirmations),
+            tx_ids=self.tx_ids,
+            transactions=self.transactions,
+            returns=_parse_abi_returns(self._atc, confirmations),
+        )
+
+    def __await__(self) -> Generator[Any, None, SendAtomicTransactionComposerResults]:
+        return self._result_async().__await__()
+
+    async def _result_async(self) -> SendAtomicTransactionComposerResults:
+        # Wait without blocking the event loop, `result()` then returns or raises straight away
+        confirmations = self._confirmations
+        if not isinstance(confirmations, asyncio.Future):
+            with contextlib.suppress(Exception):
+                await asyncio.wrap_future(confirmations)
+        elif confirmations.get_loop() is asyncio.get_running_loop():
+            await asyncio.wait([confirmations])
+        else:
+            await asyncio.wrap_future(
+                asyncio.run_coroutine_threadsafe(asyncio.wait([confirmations]), confirmations.get_loop())
+            )
+        return self.result()
+
+    @staticmethod
+    def _get_task_exception(task: asyncio.Future[list[dict[str, Any]]], timeout: float | None) -> BaseException | None:
+        if not task.done():
+            loop = task.get_loop()
+            try:
+                running_loop: asyncio.AbstractEventLoop | None = asyncio.get_running_loop()
+            except RuntimeError:
+                running_loop = None
+            if running_loop is loop:
+                raise RuntimeError(
+                    "Can't block on a transaction group confirmed by a task on the running event loop, "
+                    "await the pending handle instead"
+                )
+            asyncio.run_coroutine_threadsafe(asyncio.wait([task]), loop).result(timeout)
+        return task.exception()
 
 
 class UnnamedResourcesAccessed:
@@ -627,6 +872,17 @@ class ExecutionInfo:
     """The execution info for each transaction"""
 
 
+class _ExecutionInfoSimulateError(ValueError):
+    """Raised when the group fails in the simulate used to resolve its execution info.
+
+    Keeps the simulate response, so a failed send can be explained without simulating the group again.
+    """
+
+    def __init__(self, message: str, simulate_response: dict[str, Any]):
+        super().__init__(message)
+        self.simulate_response = simulate_response
+
+
 @dataclass
 class _TransactionWithPriority:
     txn: algosdk.transaction.Transaction
@@ -636,9 +892,33 @@ class _TransactionWithPriority:
 
 
 MAX_LEASE_LENGTH = 32
+# The trace config used for the simulates that explain failed sends in debug mode
+_DEBUG_TRACE_CONFIG = SimulateTraceConfig(enable=True, stack_change=True, scratch_change=True, state_change=True)
+# Messages algod rejects a group with when a transaction, or an inner transaction, didn't pay enough fee
+_FEE_ERROR_MESSAGES = ("fee too small", "below threshold", "less than the minimum")
+_CONFIRMATION_FETCH_MAX_WORKERS = 8
+# Submitted groups without a confirmation tracker are waited for on a shared pool, further waits queue behind these
+_CONFIRMATION_WAIT_MAX_WORKERS = 32
+# About a round, after which transactions that haven't been built into the group yet are built with fresh params
+_BUILD_SUGGESTED_PARAMS_MAX_AGE = 3
+_confirmation_fetch_executor: ThreadPoolExecutor | None = None
+_confirmation_fetch_executor_lock = threading.Lock()
+_confirmation_wait_executor: ThreadPoolExecutor | None = None
 NULL_SIGNER: TransactionSigner = algosdk.atomic_transaction_composer.EmptySigner()
 
 
+class _DeferredSigner(algosdk.atomic_transaction_composer.EmptySigner):
+    """Stands in for the signer of `address` in built transactions, until they're added to a group to be signed.
+
+    This means transactions can be built (e.g. for `build_transactions` or simulating without signatures) before the
+    sender's signer is known, and are only built once however they're used.
+    """
+
+    def __init__(self, address: str):
+        super().__init__()
+        self.address = address
+
+
 def _encode_lease(lease: str | bytes | None) -> bytes | None:
     if lease is None:
         return None
@@ -667,13 +947,207 @@ def _encode_lease(lease: str | bytes | None) -> bytes | None:
         raise TypeError(f"Unknown lease type received of {type(lease)}")
 
 
-def _get_group_execution_info(  # noqa: C901
+def _get_group_execution_info(
     atc: AtomicTransactionComposer,
     algod: AlgodClient,
     populate_app_call_resources: bool | None = None,
     cover_app_call_inner_transaction_fees: bool | None = None,
     additional_atc_context: AdditionalAtcContext | None = None,
 ) -> ExecutionInfo:
+    execution_info = _plan_group_execution_info(
+        atc, populate_app_call_resources, cover_app_call_inner_transaction_fees, additional_atc_context
+    )
+    if isinstance(execution_info, ExecutionInfo):
+        return execution_info
+
+    # Simulate transactions
+    with time_phase(SendPhase.SIMULATE, len(execution_info.empty_signer_atc.txn_list)):
+        result = execution_info.empty_signer_atc.simulate(algod, execution_info.request)
+
+    return _complete_group_execution_info(
+        atc,
+        execution_info,
+        result.simulate_response,
+        populate_app_call_resources,
+        cover_app_call_inner_transaction_fees,
+        additional_atc_context,
+    )
+
+
+@dataclass
+class _GroupExecutionInfoSimulate:
+    """The simulate needed to resolve the execution info of a group."""
+
+    empty_signer_atc: AtomicTransactionComposer
+    request: SimulateRequest
+    cache_key: bytes | None
+
+
+def _plan_group_execution_info(
+    atc: AtomicTransactionComposer,
+    populate_app_call_resources: bool | None,
+    cover_app_call_inner_transaction_fees: bool | None,
+    additional_atc_context: AdditionalAtcContext | None,
+) -> ExecutionInfo | _GroupExecutionInfoSimulate:
+    """Resolve the execution info of a group from estimates or the cache, or get the simulate that resolves it."""
+    estimated_execution_info = _estimate_group_execution_info(
+        atc, populate_app_call_resources, cover_app_call_inner_transaction_fees, additional_atc_context
+    )
+    if estimated_execution_info is not None:
+        return estimated_execution_info
+
+    empty_signer_atc, simulate_request = _build_group_execution_info_request(
+        atc, cover_app_call_inner_transaction_fees, additional_atc_context
+    )
+
+    cache_key, simulate_response = _get_cached_group_execution_info(empty_signer_atc, additional_atc_context)
+    if simulate_response is not None:
+        return _parse_group_execution_info(
+            atc,
+            simulate_response,
+            populate_app_call_resources,
+            cover_app_call_inner_transaction_fees,
+            additional_atc_context,
+        )
+    return _GroupExecutionInfoSimulate(empty_signer_atc, simulate_request, cache_key)
+
+
+def _complete_group_execution_info(
+    atc: AtomicTransactionComposer,
+    simulate: _GroupExecutionInfoSimulate,
+    simulate_response: dict[str, Any],
+    populate_app_call_resources: bool | None,
+    cover_app_call_inner_transaction_fees: bool | None,
+    additional_atc_context: AdditionalAtcContext | None,
+) -> ExecutionInfo:
+    """Parse the response of the simulate from `_plan_group_execution_info`, caching and learning from it."""
+    execution_info = _parse_group_execution_info(
+        atc,
+        simulate_response,
+        populate_app_call_resources,
+        cover_app_call_inner_transaction_fees,
+        additional_atc_context,
+    )
+    _cache_group_execution_info(
+        simulate.empty_signer_atc, additional_atc_context, simulate.cache_key, simulate_response
+    )
+    if cover_app_call_inner_transaction_fees:
+        _learn_inner_fees(
+            [t.txn for t in atc.build_group()],
+            [r.get("txn-result") for r in simulate_response["txn-groups"][0]["txn-results"]],
+            additional_atc_context,
+        )
+    return execution_info
+
+
+def _estimate_group_execution_info(
+    atc: AtomicTransactionComposer,
+    populate_app_call_resources: bool | None,
+    cover_app_call_inner_transaction_fees: bool | None,
+    additional_atc_context: AdditionalAtcContext | None,
+    *,
+    peek: bool = False,
+) -> ExecutionInfo | None:
+    """Work out the fee each transaction needs from learned inner fees, if every app call in the group has one.
+
+    With `peek` the learned inner fees are looked up without counting towards the model's hits and misses.
+    """
+    inner_fee_model = additional_atc_context.inner_fee_model if additional_atc_context else None
+    suggested_params = additional_atc_context.suggested_params if additional_atc_context else None
+    max_fees = (additional_atc_context.max_fees if additional_atc_context else None) or {}
+    if (
+        inner_fee_model is None
+        or suggested_params is None
+        or populate_app_call_resources
+        or not cover_app_call_inner_transaction_fees
+    ):
+        return None
+
+    per_byte_txn_fee = suggested_params.fee
+    min_txn_fee = int(suggested_params.min_fee)
+    txns: list[ExecutionInfoTxn] = []
+    for i, txn_with_signer in enumerate(atc.build_group()):
+        txn = txn_with_signer.txn
+        required_fee_delta = _calculate_parent_fee_delta(
+            txn, per_byte_txn_fee=per_byte_txn_fee, min_txn_fee=min_txn_fee
+        )
+        if isinstance(txn, algosdk.transaction.ApplicationCallTxn):
+            # Missing max fees are reported by the simulate path
+            get_inner_fee = inner_fee_model.peek if peek else inner_fee_model.get
+            inner_fee_delta = get_inner_fee(txn, min_txn_fee) if i in max_fees else None
+            if inner_fee_delta is None:
+                return None
+            required_fee_delta += inner_fee_delta
+        txns.append(ExecutionInfoTxn(required_fee_delta=required_fee_delta))
+
+    return ExecutionInfo(txns=txns)
+
+
+def _covers_inner_fees_from_estimates(
+    atc: AtomicTransactionComposer,
+    populate_app_call_resources: bool | None,
+    cover_app_call_inner_transaction_fees: bool | None,
+    additional_atc_context: AdditionalAtcContext | None,
+) -> bool:
+    """Whether the group's inner fees will be covered from learned estimates rather than a simulate.
+
+    Groups covered via simulate are learned from that simulate, so only groups covered from estimates are learned
+    from their confirmations, keeping it to one observation per send.
+    """
+    if populate_app_call_resources is None:
+        populate_app_call_resources = config.populate_app_call_resource
+    return (
+        _estimate_group_execution_info(
+            atc, populate_app_call_resources, cover_app_call_inner_transaction_fees, additional_atc_context, peek=True
+        )
+        is not None
+    )
+
+
+def _learn_inner_fees(
+    transactions: Sequence[algosdk.transaction.Transaction],
+    txn_results: Sequence[dict[str, Any] | None],
+    additional_atc_context: AdditionalAtcContext | None,
+) -> None:
+    """Record the inner fees of the app calls in a simulated or confirmed group whose fees were covered."""
+    inner_fee_model = additional_atc_context.inner_fee_model if additional_atc_context else None
+    suggested_params = additional_atc_context.suggested_params if additional_atc_context else None
+    if inner_fee_model is None or suggested_params is None:
+        return
+    min_txn_fee = int(suggested_params.min_fee)
+    for txn, txn_result in zip(transactions, txn_results, strict=False):
+        if isinstance(txn, algosdk.transaction.ApplicationCallTxn) and txn_result is not None:
+            inner_fee_model.observe(
+                txn, _calculate_inner_fee_delta(txn_result.get("inner-txns", []), min_txn_fee), min_txn_fee
+            )
+
+
+def _get_cached_group_execution_info(
+    empty_signer_atc: AtomicTransactionComposer, additional_atc_context: AdditionalAtcContext | None
+) -> tuple[bytes | None, dict[str, Any] | None]:
+    cache = additional_atc_context.execution_info_cache if additional_atc_context else None
+    if cache is None:
+        return None, None
+    cache_key = ExecutionInfoCache.fingerprint([t.txn for t in empty_signer_atc.txn_list])
+    return cache_key, cache.get(cache_key)
+
+
+def _cache_group_execution_info(
+    empty_signer_atc: AtomicTransactionComposer,
+    additional_atc_context: AdditionalAtcContext | None,
+    cache_key: bytes | None,
+    simulate_response: dict[str, Any],
+) -> None:
+    cache = additional_atc_context.execution_info_cache if additional_atc_context else None
+    if cache is not None and cache_key is not None:
+        cache.set(cache_key, simulate_response, [t.txn for t in empty_signer_atc.txn_list])
+
+
+def _build_group_execution_info_request(
+    atc: AtomicTransactionComposer,
+    cover_app_call_inner_transaction_fees: bool | None = None,
+    additional_atc_context: AdditionalAtcContext | None = None,
+) -> tuple[AtomicTransactionComposer, SimulateRequest]:
     # Create simulation request
     suggested_params = additional_atc_context.suggested_params if additional_atc_context else None
     max_fees = additional_atc_context.max_fees if additional_atc_context else None
@@ -682,6 +1156,8 @@ def _get_group_execution_info(  # noqa: C901
         txn_groups=[],
         allow_unnamed_resources=True,
         allow_empty_signatures=True,
+        # In debug mode a failed send is explained with a traced simulate, which this one can then stand in for
+        exec_trace_config=_DEBUG_TRACE_CONFIG if config.debug else None,
     )
 
     # Clone ATC with null signers
@@ -710,22 +1186,32 @@ def _get_group_execution_info(  # noqa: C901
             f"Required for transactions: {', '.join(str(i) for i in app_call_indexes_without_max_fees)}"
         )
 
-    # Simulate transactions
-    result = empty_signer_atc.simulate(algod, simulate_request)
+    return empty_signer_atc, simulate_request
+
 
-    group_response = result.simulate_response["txn-groups"][0]
+def _parse_group_execution_info(
+    atc: AtomicTransactionComposer,
+    simulate_response: dict[str, Any],
+    populate_app_call_resources: bool | None = None,
+    cover_app_call_inner_transaction_fees: bool | None = None,
+    additional_atc_context: AdditionalAtcContext | None = None,
+) -> ExecutionInfo:
+    suggested_params = additional_atc_context.suggested_params if additional_atc_context else None
+    group_response = simulate_response["txn-groups"][0]
 
     if group_response.get("failure-message"):
         msg = group_response["failure-message"]
         if cover_app_call_inner_transaction_fees and "too small" in msg:
-            raise ValueError(
+            raise _ExecutionInfoSimulateError(
                 "Fees were too small to resolve execution info via simulate. "
-                "You may need to increase an app call transaction maxFee."
+                "You may need to increase an app call transaction maxFee.",
+                simulate_response,
             )
         failed_at = group_response.get("failed-at", [0])[0]
-        raise ValueError(
+        raise _ExecutionInfoSimulateError(
             f"Error resolving execution info via simulate in transaction {failed_at}: "
-            f"{group_response['failure-message']}"
+            f"{group_response['failure-message']}",
+            simulate_response,
         )
 
     # Build execution info
@@ -766,67 +1252,114 @@ def _get_group_execution_info(  # noqa: C901
 def _calculate_required_fee_delta(
     txn: transaction.Transaction, txn_result: dict[str, Any], *, per_byte_txn_fee: int, min_txn_fee: int
 ) -> int:
-    # Calculate parent transaction fee
-    original_txn_size = txn.estimate_size()
-    assert isinstance(original_txn_size, int), "expected txn size to be an int"
-    parent_per_byte_fee = per_byte_txn_fee * (original_txn_size + 75)
-    parent_min_fee = max(parent_per_byte_fee, min_txn_fee)
-    original_txn_fee = txn.fee
-    assert isinstance(original_txn_fee, int), "expected original txn fee to be an int"
-    parent_fee_delta = parent_min_fee - original_txn_fee
+    parent_fee_delta = _calculate_parent_fee_delta(txn, per_byte_txn_fee=per_byte_txn_fee, min_txn_fee=min_txn_fee)
 
     if isinstance(txn, algosdk.transaction.ApplicationCallTxn):
-        # Calculate inner transaction fees recursively
-        def calculate_inner_fee_delta(inner_txns: list[dict], acc: int = 0) -> int:
-            for inner_txn in reversed(inner_txns):
-                current_fee_delta = (
-                    calculate_inner_fee_delta(inner_txn["inner-txns"], acc) if inner_txn.get("inner-txns") else acc
-                ) + (min_txn_fee - inner_txn["txn"]["txn"].get("fee", 0))
-                acc = max(0, current_fee_delta)
-            return acc
-
-        inner_fee_delta = calculate_inner_fee_delta(txn_result.get("inner-txns", []))
+        inner_fee_delta = _calculate_inner_fee_delta(txn_result.get("inner-txns", []), min_txn_fee)
         return inner_fee_delta + parent_fee_delta
     else:
         return parent_fee_delta
 
 
-def _find_available_transaction_index(
-    txns: list[TransactionWithSigner], reference_type: str, reference: str | dict[str, Any] | int
-) -> int:
-    """Find index of first transaction that can accommodate the new reference."""
+def _calculate_parent_fee_delta(txn: transaction.Transaction, *, per_byte_txn_fee: int, min_txn_fee: int) -> int:
+    original_txn_size = txn.estimate_size()
+    assert isinstance(original_txn_size, int), "expected txn size to be an int"
+    parent_per_byte_fee = per_byte_txn_fee * (original_txn_size + 75)
+    parent_min_fee = max(parent_per_byte_fee, min_txn_fee)
+    original_txn_fee = txn.fee
+    assert isinstance(original_txn_fee, int), "expected original txn fee to be an int"
+    return parent_min_fee - original_txn_fee
 
-    def check_transaction(txn: TransactionWithSigner) -> bool:
-        # Skip if not an application call transaction
-        if txn.txn.type != "appl":
-            return False
 
-        # Get current counts (using get() with default 0 for Pythonic null handling)
-        accounts = len(getattr(txn.txn, "accounts", []) or [])
-        assets = len(getattr(txn.txn, "foreign_assets", []) or [])
-        apps = len(getattr(txn.txn, "foreign_apps", []) or [])
-        boxes = len(getattr(txn.txn, "boxes", []) or [])
+def _calculate_inner_fee_delta(inner_txns: list[dict], min_txn_fee: int, acc: int = 0) -> int:
+    # Calculate inner transaction fees recursively
+    for inner_txn in reversed(inner_txns):
+        current_fee_delta = (
+            _calculate_inner_fee_delta(inner_txn["inner-txns"], min_txn_fee, acc)
+            if inner_txn.get("inner-txns")
+            else acc
+        ) + (min_txn_fee - inner_txn["txn"]["txn"].get("fee", 0))
+        acc = max(0, current_fee_delta)
+    return acc
 
-        # For account references, only check account limit
-        if reference_type == "account":
-            return accounts < MAX_APP_CALL_ACCOUNT_REFERENCES
 
-        # For asset holdings or local state, need space for both account and other reference
-        if reference_type in ("asset_holding", "app_local"):
-            return (
-                accounts + assets + apps + boxes < MAX_APP_CALL_FOREIGN_REFERENCES - 1
-                and accounts < MAX_APP_CALL_ACCOUNT_REFERENCES
-            )
+class _AppCallReferences:
+    """The references available to, and the reference slots used by, a single app call in a group."""
 
-        # For boxes with non-zero app ID, need space for box and app reference
-        if reference_type == "box" and reference and int(getattr(reference, "app", 0)) != 0:
-            return accounts + assets + apps + boxes < MAX_APP_CALL_FOREIGN_REFERENCES - 1
+    def __init__(self, txn: transaction.ApplicationCallTxn):
+        self.txn = txn
+        self.account_count = len(txn.accounts or [])
+        self.reference_count = (
+            self.account_count + len(txn.foreign_assets or []) + len(txn.foreign_apps or []) + len(txn.boxes or [])
+        )
+        self.apps: set[int] = set(txn.foreign_apps or [])
+        self.assets: set[int] = set(txn.foreign_assets or [])
+        # Any address that already appears in the transaction (sender, accounts, rekey etc.) or is the address of one
+        # of its foreign apps is available to it
+        self.addresses: set[str] = {logic.get_application_address(app_id) for app_id in self.apps}
+        for value in txn.__dict__.values():
+            if isinstance(value, str):
+                self.addresses.add(value)
+            elif isinstance(value, list | tuple):
+                self.addresses.update(v for v in value if isinstance(v, str))
+
+    def has_app(self, app_id: int) -> bool:
+        return app_id in self.apps or self.txn.index == app_id
+
+    def has_capacity(self, references: int = 1) -> bool:
+        return self.reference_count + references <= MAX_APP_CALL_FOREIGN_REFERENCES
+
+    def has_account_capacity(self) -> bool:
+        return self.account_count < MAX_APP_CALL_ACCOUNT_REFERENCES
+
+    def add_account(self, address: str) -> None:
+        self.txn.accounts = [*(self.txn.accounts or []), address]
+        self.account_count += 1
+        self.reference_count += 1
+        self.addresses.add(address)
+
+    def add_app(self, app_id: int) -> None:
+        self.txn.foreign_apps = [*(self.txn.foreign_apps or []), app_id]
+        self.reference_count += 1
+        self.apps.add(app_id)
+        self.addresses.add(logic.get_application_address(app_id))
+
+    def add_asset(self, asset_id: int) -> None:
+        self.txn.foreign_assets = [*(self.txn.foreign_assets or []), asset_id]
+        self.reference_count += 1
+        self.assets.add(asset_id)
+
+    def add_box(self, box_ref: tuple[int, bytes]) -> None:
+        box = BoxReference.translate_box_reference(box_ref, self.txn.foreign_apps or [], self.txn.index)
+        self.txn.boxes = [*(self.txn.boxes or []), box]  # type: ignore[list-item]
+        self.reference_count += 1
+
+
+class _GroupReferenceIndex:
+    """Incrementally maintained index of the references available in each app call of a group.
+
+    Used when populating group level resources so each placement is a set lookup per app call rather than a rescan
+    of every transaction's reference arrays.
+    """
 
-        # Default case - just check total references
-        return accounts + assets + apps + boxes < MAX_APP_CALL_FOREIGN_REFERENCES
+    def __init__(self, txns: list[TransactionWithSigner]):
+        self._app_calls = [_AppCallReferences(t.txn) for t in txns if isinstance(t.txn, transaction.ApplicationCallTxn)]
 
-    # Return first matching index or -1 if none found
-    return next((i for i, txn in enumerate(txns) if check_transaction(txn)), -1)
+    def find(self, predicate: Callable[[_AppCallReferences], bool]) -> _AppCallReferences | None:
+        """Find the first app call in the group, in group order, matching the predicate."""
+        return next((refs for refs in self._app_calls if predicate(refs)), None)
+
+    def find_available(self, reference_type: str, reference: str | dict[str, Any] | int) -> _AppCallReferences | None:
+        """Find the first app call that has enough free slots to take the given reference."""
+        if reference_type == "account":
+            return self.find(lambda refs: refs.has_capacity() and refs.has_account_capacity())
+        # Asset holdings and app locals need a slot for both the account and the asset / app
+        if reference_type in ("assetHolding", "appLocal"):
+            return self.find(lambda refs: refs.has_capacity(2) and refs.has_account_capacity())
+        # Boxes for a non-zero app need a slot for both the box and the app
+        if reference_type == "box" and int(cast(dict[str, Any], reference)["app"]) != 0:
+            return self.find(lambda refs: refs.has_capacity(2))
+        return self.find(lambda refs: refs.has_capacity())
 
 
 def calculate_extra_program_pages(approval: bytes | None, clear: bytes | None) -> int:
@@ -845,7 +1378,7 @@ def populate_app_call_resources(atc: AtomicTransactionComposer, algod: AlgodClie
     return prepare_group_for_sending(atc, algod, populate_app_call_resources=True)
 
 
-def prepare_group_for_sending(  # noqa: C901, PLR0912, PLR0915
+def prepare_group_for_sending(
     atc: AtomicTransactionComposer,
     algod: AlgodClient,
     populate_app_call_resources: bool | None = None,
@@ -871,6 +1404,17 @@ def prepare_group_for_sending(  # noqa: C901, PLR0912, PLR0915
         cover_app_call_inner_transaction_fees,
         additional_atc_context,
     )
+    return _apply_group_execution_info(
+        atc, execution_info, cover_app_call_inner_transaction_fees, additional_atc_context
+    )
+
+
+def _apply_group_execution_info(  # noqa: C901, PLR0912, PLR0915
+    atc: AtomicTransactionComposer,
+    execution_info: ExecutionInfo,
+    cover_app_call_inner_transaction_fees: bool | None = None,
+    additional_atc_context: AdditionalAtcContext | None = None,
+) -> AtomicTransactionComposer:
     max_fees = additional_atc_context.max_fees if additional_atc_context else None
 
     group = atc.build_group()
@@ -926,160 +1470,71 @@ def prepare_group_for_sending(  # noqa: C901, PLR0912, PLR0915
                     additional_fees[txn_obj.index] = txn_obj.fee_delta - surplus_fees
                     surplus_fees = 0
 
-    def populate_group_resource(  # noqa: PLR0915, PLR0912, C901
-        txns: list[TransactionWithSigner], reference: str | dict[str, Any] | int, ref_type: str
+    def populate_group_resource(  # noqa: C901, PLR0912
+        index: _GroupReferenceIndex, reference: str | dict[str, Any] | int, ref_type: str
     ) -> None:
         """Helper function to populate group-level resources."""
 
-        def is_appl_below_limit(t: TransactionWithSigner) -> bool:
-            if not isinstance(t.txn, transaction.ApplicationCallTxn):
-                return False
-
-            accounts = len(getattr(t.txn, "accounts", []) or [])
-            assets = len(getattr(t.txn, "foreign_assets", []) or [])
-            apps = len(getattr(t.txn, "foreign_apps", []) or [])
-            boxes = len(getattr(t.txn, "boxes", []) or [])
-
-            return accounts + assets + apps + boxes < MAX_APP_CALL_FOREIGN_REFERENCES
-
         # Handle asset holding and app local references first
         if ref_type in ("assetHolding", "appLocal"):
             ref_dict = cast(dict[str, Any], reference)
             account = ref_dict["account"]
 
             # First try to find transaction with account already available
-            txn_idx = next(
-                (
-                    i
-                    for i, t in enumerate(txns)
-                    if is_appl_below_limit(t)
-                    and isinstance(t.txn, transaction.ApplicationCallTxn)
-                    and (
-                        account in (getattr(t.txn, "accounts", []) or [])
-                        or account
-                        in (
-                            logic.get_application_address(app_id)
-                            for app_id in (getattr(t.txn, "foreign_apps", []) or [])
-                        )
-                        or any(str(account) in str(v) for v in t.txn.__dict__.values())
-                    )
-                ),
-                -1,
-            )
-
-            if txn_idx >= 0:
-                app_txn = cast(transaction.ApplicationCallTxn, txns[txn_idx].txn)
+            refs = index.find(lambda r: r.has_capacity() and account in r.addresses)
+            if refs:
                 if ref_type == "assetHolding":
-                    asset_id = ref_dict["asset"]
-                    app_txn.foreign_assets = [*list(getattr(app_txn, "foreign_assets", []) or []), asset_id]
+                    refs.add_asset(ref_dict["asset"])
                 else:
-                    app_id = ref_dict["app"]
-                    app_txn.foreign_apps = [*list(getattr(app_txn, "foreign_apps", []) or []), app_id]
+                    refs.add_app(ref_dict["app"])
                 return
 
             # Try to find transaction that already has the app/asset available
-            txn_idx = next(
-                (
-                    i
-                    for i, t in enumerate(txns)
-                    if is_appl_below_limit(t)
-                    and isinstance(t.txn, transaction.ApplicationCallTxn)
-                    and len(getattr(t.txn, "accounts", []) or []) < MAX_APP_CALL_ACCOUNT_REFERENCES
-                    and (
-                        (
-                            ref_type == "assetHolding"
-                            and ref_dict["asset"] in (getattr(t.txn, "foreign_assets", []) or [])
-                        )
-                        or (
-                            ref_type == "appLocal"
-                            and (
-                                ref_dict["app"] in (getattr(t.txn, "foreign_apps", []) or [])
-                                or t.txn.index == ref_dict["app"]
-                            )
-                        )
-                    )
-                ),
-                -1,
+            refs = index.find(
+                lambda r: r.has_capacity()
+                and r.has_account_capacity()
+                and (ref_dict["asset"] in r.assets if ref_type == "assetHolding" else r.has_app(ref_dict["app"]))
             )
-
-            if txn_idx >= 0:
-                app_txn = cast(transaction.ApplicationCallTxn, txns[txn_idx].txn)
-                accounts = list(getattr(app_txn, "accounts", []) or [])
-                accounts.append(account)
-                app_txn.accounts = accounts
+            if refs:
+                refs.add_account(account)
                 return
 
         # Handle box references
         if ref_type == "box":
-            box_ref = (reference["app"], base64.b64decode(reference["name"]))  # type: ignore[index]
+            box_dict = cast(dict[str, Any], reference)
+            box_ref = (int(box_dict["app"]), base64.b64decode(box_dict["name"]))
 
             # Try to find transaction that already has the app available
-            txn_idx = next(
-                (
-                    i
-                    for i, t in enumerate(txns)
-                    if is_appl_below_limit(t)
-                    and isinstance(t.txn, transaction.ApplicationCallTxn)
-                    and (box_ref[0] in (getattr(t.txn, "foreign_apps", []) or []) or t.txn.index == box_ref[0])
-                ),
-                -1,
-            )
-
-            if txn_idx >= 0:
-                app_txn = cast(transaction.ApplicationCallTxn, txns[txn_idx].txn)
-                boxes = list(getattr(app_txn, "boxes", []) or [])
-                boxes.append(BoxReference.translate_box_reference(box_ref, app_txn.foreign_apps or [], app_txn.index))  # type: ignore[arg-type]
-                app_txn.boxes = boxes
+            refs = index.find(lambda r: r.has_capacity() and r.has_app(box_ref[0]))
+            if refs:
+                refs.add_box(box_ref)
                 return
 
         # Find available transaction for the resource
-        txn_idx = _find_available_transaction_index(txns, ref_type, reference)
+        refs = index.find_available(ref_type, reference)
 
-        if txn_idx == -1:
+        if refs is None:
             raise ValueError("No more transactions below reference limit. Add another app call to the group.")
 
-        app_txn = cast(transaction.ApplicationCallTxn, txns[txn_idx].txn)
-
         if ref_type == "account":
-            accounts = list(getattr(app_txn, "accounts", []) or [])
-            accounts.append(cast(str, reference))
-            app_txn.accounts = accounts
+            refs.add_account(cast(str, reference))
         elif ref_type == "app":
-            app_id = int(cast(str | int, reference))
-            foreign_apps = list(getattr(app_txn, "foreign_apps", []) or [])
-            foreign_apps.append(app_id)
-            app_txn.foreign_apps = foreign_apps
+            refs.add_app(int(cast(str | int, reference)))
         elif ref_type == "box":
             # ensure app_id is added before calling translate_box_reference
-            app_id = box_ref[0]
-            if app_id != 0:
-                foreign_apps = list(getattr(app_txn, "foreign_apps", []) or [])
-                foreign_apps.append(app_id)
-                app_txn.foreign_apps = foreign_apps
-            boxes = list(getattr(app_txn, "boxes", []) or [])
-            boxes.append(BoxReference.translate_box_reference(box_ref, app_txn.foreign_apps or [], app_txn.index))  # type: ignore[arg-type]
-            app_txn.boxes = boxes
+            if box_ref[0] != 0:
+                refs.add_app(box_ref[0])
+            refs.add_box(box_ref)
         elif ref_type == "asset":
-            asset_id = int(cast(str | int, reference))
-            foreign_assets = list(getattr(app_txn, "foreign_assets", []) or [])
-            foreign_assets.append(asset_id)
-            app_txn.foreign_assets = foreign_assets
+            refs.add_asset(int(cast(str | int, reference)))
         elif ref_type == "assetHolding":
             ref_dict = cast(dict[str, Any], reference)
-            foreign_assets = list(getattr(app_txn, "foreign_assets", []) or [])
-            foreign_assets.append(ref_dict["asset"])
-            app_txn.foreign_assets = foreign_assets
-            accounts = list(getattr(app_txn, "accounts", []) or [])
-            accounts.append(ref_dict["account"])
-            app_txn.accounts = accounts
+            refs.add_asset(ref_dict["asset"])
+            refs.add_account(ref_dict["account"])
         elif ref_type == "appLocal":
             ref_dict = cast(dict[str, Any], reference)
-            foreign_apps = list(getattr(app_txn, "foreign_apps", []) or [])
-            foreign_apps.append(ref_dict["app"])
-            app_txn.foreign_apps = foreign_apps
-            accounts = list(getattr(app_txn, "accounts", []) or [])
-            accounts.append(ref_dict["account"])
-            app_txn.accounts = accounts
+            refs.add_app(ref_dict["app"])
+            refs.add_account(ref_dict["account"])
 
     # Process transaction-level resources
     for i, txn_info in enumerate(execution_info.txns or []):
@@ -1151,9 +1606,11 @@ def prepare_group_for_sending(  # noqa: C901, PLR0912, PLR0915
     # Process group-level resources
     group_resources = execution_info.group_unnamed_resources_accessed
     if group_resources:
+        reference_index = _GroupReferenceIndex(group)
+
         # Handle cross-reference resources first
         for app_local in group_resources.app_locals or []:
-            populate_group_resource(group, app_local, "appLocal")
+            populate_group_resource(reference_index, app_local, "appLocal")
             # Remove processed resources
             if group_resources.accounts:
                 group_resources.accounts = [acc for acc in group_resources.accounts if acc != app_local["account"]]
@@ -1161,7 +1618,7 @@ def prepare_group_for_sending(  # noqa: C901, PLR0912, PLR0915
                 group_resources.apps = [app for app in group_resources.apps if int(app) != int(app_local["app"])]
 
         for asset_holding in group_resources.asset_holdings or []:
-            populate_group_resource(group, asset_holding, "assetHolding")
+            populate_group_resource(reference_index, asset_holding, "assetHolding")
             # Remove processed resources
             if group_resources.accounts:
                 group_resources.accounts = [acc for acc in group_resources.accounts if acc != asset_holding["account"]]
@@ -1172,23 +1629,23 @@ def prepare_group_for_sending(  # noqa: C901, PLR0912, PLR0915
 
         # Handle remaining resources
         for account in group_resources.accounts or []:
-            populate_group_resource(group, account, "account")
+            populate_group_resource(reference_index, account, "account")
 
         for box in group_resources.boxes or []:
-            populate_group_resource(group, box, "box")
+            populate_group_resource(reference_index, box, "box")
             if group_resources.apps:
                 group_resources.apps = [app for app in group_resources.apps if int(app) != int(box["app"])]
 
         for asset in group_resources.assets or []:
-            populate_group_resource(group, asset, "asset")
+            populate_group_resource(reference_index, asset, "asset")
 
         for app in group_resources.apps or []:
-            populate_group_resource(group, app, "app")
+            populate_group_resource(reference_index, app, "app")
 
         # Handle extra box references
         extra_box_refs = group_resources.extra_box_refs or 0
         for _ in range(extra_box_refs):
-            populate_group_resource(group, {"app": 0, "name": ""}, "box")
+            populate_group_resource(reference_index, {"app": 0, "name": ""}, "box")
 
     # Create new ATC with updated transactions
     new_atc = AtomicTransactionComposer()
@@ -1197,10 +1654,451 @@ def prepare_group_for_sending(  # noqa: C901, PLR0912, PLR0915
         new_atc.add_transaction(txn_with_signer)
     new_atc.method_dict = deepcopy(atc.method_dict)
 
-    return new_atc
+    return new_atc
+
+
+def _requires_group_preparation(
+    transactions_with_signer: list[TransactionWithSigner],
+    populate_app_call_resources: bool | None,
+    cover_app_call_inner_transaction_fees: bool | None,
+) -> bool:
+    return bool(populate_app_call_resources or cover_app_call_inner_transaction_fees) and any(
+        isinstance(t.txn, algosdk.transaction.ApplicationCallTxn) for t in transactions_with_signer
+    )
+
+
+def _has_fixed_validity(txn: object) -> bool:
+    """Whether a queued transaction keeps the same validity window when the group is rebuilt."""
+    match txn:
+        case TransactionWithSigner() | AtomicTransactionComposer() | algosdk.transaction.Transaction():
+            return True
+        case _MethodCallTemplateCall():
+            return _has_fixed_validity(txn.template.params)
+        case _CommonTxnParams() if txn.first_valid_round or txn.last_valid_round:
+            return True
+        case _BaseAppMethodCall():
+            return any(_has_fixed_validity(arg) for arg in txn.args or [])
+    return False
+
+
+def _get_expiry_error(error: BaseException) -> BaseException | None:
+    """Find the error in the cause chain that shows a sent group may have outlived its validity window."""
+    cause: BaseException | None = error
+    while cause is not None:
+        if isinstance(cause, algosdk.error.ConfirmationTimeoutError) or (
+            isinstance(cause, algosdk.error.AlgodHTTPError) and "txn dead" in str(cause)
+        ):
+            return cause
+        cause = cause.__cause__
+    return None
+
+
+def _is_fee_error(error: BaseException) -> bool:
+    """Whether algod rejected a sent group (or one of its inner transactions) because a fee was too small."""
+    cause: BaseException | None = error
+    while cause is not None:
+        if isinstance(cause, algosdk.error.AlgodHTTPError) and any(
+            message in str(cause) for message in _FEE_ERROR_MESSAGES
+        ):
+            return True
+        cause = cause.__cause__
+    return False
+
+
+def _log_expired_resubmit(params: SendParams, resubmits: int) -> None:
+    config.logger.warning(
+        f"Transaction group expired before it was confirmed, rebuilding and resubmitting "
+        f"({resubmits} of {params.get('max_resubmits_on_expiry')})",
+        extra={"suppress_log": params.get("suppress_log") or False},
+    )
+
+
+def _get_group_id(transactions_to_send: list[algosdk.transaction.Transaction]) -> str | None:
+    if len(transactions_to_send) <= 1:
+        return None
+    return base64.b64encode(transactions_to_send[0].group).decode("utf-8") if transactions_to_send[0].group else ""
+
+
+def _log_sending_group(
+    transactions_to_send: list[algosdk.transaction.Transaction],
+    tx_ids: list[str],
+    group_id: str | None,
+    suppress_log: bool | None,
+) -> None:
+    if len(transactions_to_send) > 1 and not suppress_log:
+        config.logger.info(
+            f"Sending group of {len(transactions_to_send)} transactions ({group_id})",
+            extra={"suppress_log": suppress_log or False},
+        )
+        # Only formatted when debug logging is enabled
+        config.logger.debug(
+            "Transaction IDs (%s): %s",
+            group_id,
+            tx_ids,
+            extra={"suppress_log": suppress_log or False},
+        )
+
+
+def _log_group_sent(
+    transactions_to_send: list[algosdk.transaction.Transaction],
+    tx_ids: list[str],
+    group_id: str | None,
+    suppress_log: bool | None,
+) -> None:
+    if suppress_log:
+        return
+    if len(transactions_to_send) > 1:
+        config.logger.info(
+            f"Group transaction ({group_id}) sent with {len(transactions_to_send)} transactions",
+            extra={"suppress_log": suppress_log or False},
+        )
+    else:
+        config.logger.info(
+            f"Sent transaction ID {tx_ids[0]}",
+            extra={"suppress_log": suppress_log or False},
+        )
+
+
+def _wrap_transactions(
+    transactions: list[algosdk.transaction.Transaction], tx_ids: list[str]
+) -> list[TransactionWrapper]:
+    # The IDs were computed when the group was built, so the wrappers don't need to hash each transaction again
+    return [TransactionWrapper(txn, tx_id) for txn, tx_id in zip(transactions, tx_ids, strict=True)]
+
+
+def _log_send_error(error: Exception, suppress_log: bool | None) -> None:
+    if config.debug:
+        config.logger.error(
+            "Received error executing Atomic Transaction Composer and debug flag enabled; "
+            "attempting simulation to get more information ",
+            extra={"suppress_log": suppress_log or False},
+            exc_info=error,
+        )
+    else:
+        config.logger.error(
+            "Received error executing Atomic Transaction Composer, for more information enable the debug flag",
+            extra={"suppress_log": suppress_log or False},
+            exc_info=error,
+        )
+
+
+def _build_debug_send_error(error: Exception, simulate: SimulateAtomicTransactionResponse | None) -> Exception:
+    traces = []
+    if simulate and simulate.failed_at:
+        for txn_group in simulate.simulate_response["txn-groups"]:
+            app_budget = txn_group.get("app-budget-added")
+            app_budget_consumed = txn_group.get("app-budget-consumed")
+            failure_message = txn_group.get("failure-message")
+            txn_result = txn_group.get("txn-results", [{}])[0]
+            exec_trace = txn_result.get("exec-trace", {})
+
+            traces.append(
+                {
+                    "trace": exec_trace,
+                    "app_budget": app_budget,
+                    "app_budget_consumed": app_budget_consumed,
+                    "failure_message": failure_message,
+                }
+            )
+
+    debug_error = Exception(f"Transaction failed: {error}")
+    debug_error.traces = traces  # type: ignore[attr-defined]
+    return debug_error
+
+
+def _wait_for_group_confirmations(
+    algod: AlgodClient,
+    tx_ids: list[str],
+    wait_rounds: int,
+    confirmation_tracker: ConfirmationTracker | None = None,
+    retry_policy: SubmitRetryPolicy | None = None,
+) -> list[dict[str, Any]]:
+    wait = _GroupConfirmationWait(tx_ids, wait_rounds, retry_policy)
+    while True:
+        try:
+            current_round = cast(int, cast(dict, algod.status())["last-round"]) if wait.needs_current_round else None
+            rounds_to_wait = wait.get_rounds_to_wait(current_round)
+            return _wait_for_group_confirmations_once(algod, tx_ids, rounds_to_wait, confirmation_tracker)
+        except Exception as e:
+            delay = wait.get_retry_delay(e)
+            if delay is None:
+                raise
+            time.sleep(delay)
+
+
+class _GroupConfirmationWait(_RetryAttempts):
+    """Counts the attempts at waiting for a group and the rounds left to wait for it."""
+
+    def __init__(self, tx_ids: list[str], wait_rounds: int, retry_policy: SubmitRetryPolicy | None):
+        super().__init__(retry_policy)
+        self.tx_ids = tx_ids
+        self.wait_rounds = wait_rounds
+        self.start_round: int | None = None
+
+    @property
+    def needs_current_round(self) -> bool:
+        """Whether `get_rounds_to_wait` needs the current round, which is only the case when retrying."""
+        # Retries only wait for the rounds left of the caller's budget, so note the round the wait started at
+        return self.retry_policy is not None
+
+    def get_rounds_to_wait(self, current_round: int | None) -> int:
+        """Get the rounds to wait in this attempt.
+
+        :raises ConfirmationTimeoutError: If no rounds are left to wait
+        """
+        if current_round is None:
+            return self.wait_rounds
+        self.start_round = current_round if self.start_round is None else self.start_round
+        remaining_rounds = self.wait_rounds - (current_round - self.start_round)
+        if remaining_rounds <= 0:
+            raise algosdk.error.ConfirmationTimeoutError(f"Wait for transaction id {self.tx_ids[0]} timed out")
+        return remaining_rounds
+
+
+def _wait_for_group_confirmations_once(
+    algod: AlgodClient,
+    tx_ids: list[str],
+    wait_rounds: int,
+    confirmation_tracker: ConfirmationTracker | None,
+) -> list[dict[str, Any]]:
+    if confirmation_tracker is not None:
+        # The tracker follows each block once for every outstanding group rather than polling per group
+        with time_phase(SendPhase.CONFIRMATION_WAIT, len(tx_ids)):
+            return confirmation_tracker.wait(tx_ids, wait_rounds)
+
+    # A group is committed atomically, so once the first transaction is confirmed the pending info of every other
+    # transaction is available too; fetch those concurrently rather than one round trip after another
+    with time_phase(SendPhase.CONFIRMATION_WAIT, len(tx_ids)):
+        first_confirmation = transaction.wait_for_confirmation(algod, tx_ids[0], wait_rounds)
+    remaining_tx_ids = tx_ids[1:]
+    if not remaining_tx_ids:
+        return [first_confirmation]
+    with time_phase(SendPhase.CONFIRMATION_FETCH, len(tx_ids), count=len(remaining_tx_ids)):
+        if len(remaining_tx_ids) == 1:
+            remaining_confirmations = [algod.pending_transaction_info(remaining_tx_ids[0])]
+        else:
+            remaining_confirmations = list(
+                _get_confirmation_fetch_executor().map(algod.pending_transaction_info, remaining_tx_ids)
+            )
+        return [first_confirmation, *(cast(dict[str, Any], c) for c in remaining_confirmations)]
+
+
+def _get_confirmation_fetch_executor() -> ThreadPoolExecutor:
+    # Shared by every send, so concurrent sends don't each start (and tear down) their own threads
+    global _confirmation_fetch_executor  # noqa: PLW0603
+    with _confirmation_fetch_executor_lock:
+        if _confirmation_fetch_executor is None:
+            _confirmation_fetch_executor = ThreadPoolExecutor(
+                max_workers=_CONFIRMATION_FETCH_MAX_WORKERS, thread_name_prefix="algokit-confirmation-fetch"
+            )
+        return _confirmation_fetch_executor
+
+
+def _get_confirmation_wait_executor() -> ThreadPoolExecutor:
+    # Separate from the fetch executor, as the waits it runs fetch confirmations on that one
+    global _confirmation_wait_executor  # noqa: PLW0603
+    with _confirmation_fetch_executor_lock:
+        if _confirmation_wait_executor is None:
+            _confirmation_wait_executor = ThreadPoolExecutor(
+                max_workers=_CONFIRMATION_WAIT_MAX_WORKERS, thread_name_prefix="algokit-confirmation-wait"
+            )
+        return _confirmation_wait_executor
+
+
+def _submit_signed_group(
+    atc: AtomicTransactionComposer, algod: AlgodClient, retry_policy: SubmitRetryPolicy | None = None
+) -> None:
+    # Mirrors `atc.submit`, but signs and encodes the group as separately timed steps and only encodes it once
+    if atc.status > algosdk.atomic_transaction_composer.AtomicTransactionComposerStatus.SUBMITTED:
+        raise algosdk.error.AtomicTransactionComposerError(
+            "AtomicTransactionComposerStatus must be submitted or lower to submit a group"
+        )
+    group_size = len(atc.txn_list)
+    with time_phase(SendPhase.SIGN, group_size):
+        signed_transactions = atc.gather_signatures()
+    with time_phase(SendPhase.SUBMIT, group_size) as timer:
+        encoded_group = _encode_signed_group(signed_transactions)
+        timer.size_bytes = len(encoded_group)
+        timer.count = _send_raw_group(algod, encoded_group, atc.tx_ids[0], retry_policy)
+    atc.status = algosdk.atomic_transaction_composer.AtomicTransactionComposerStatus.SUBMITTED
+
+
+def _parse_abi_returns(atc: AtomicTransactionComposer, confirmations: list[dict[str, Any]]) -> list[ABIReturn]:
+    # Mirrors AtomicTransactionComposer.execute, but parses the already fetched confirmations
+    abi_results: list[algosdk.atomic_transaction_composer.ABIResult] = []
+    for index, method in atc.method_dict.items():
+        tx_id = atc.tx_ids[index]
+        try:
+            abi_result = atc.parse_result(method, tx_id, confirmations[index])
+        except Exception as e:
+            abi_result = algosdk.atomic_transaction_composer.ABIResult(
+                tx_id=tx_id,
+                raw_value=b"",
+                return_value=None,
+                decode_error=e,
+                tx_info={},
+                method=method,
+            )
+        abi_results.append(abi_result)
+    return [ABIReturn(r) for r in abi_results]
+
+
+def _submit_group(
+    atc: AtomicTransactionComposer,
+    algod: AlgodClient,
+    *,
+    suppress_log: bool | None,
+    populate_app_call_resources: bool | None,
+    cover_app_call_inner_transaction_fees: bool | None,
+    additional_atc_context: AdditionalAtcContext | None,
+) -> tuple[
+    AtomicTransactionComposer,
+    list[algosdk.transaction.Transaction],
+    str | None,
+    SimulateAtomicTransactionResponse | None,
+]:
+    from algokit_utils._debugging import simulate_and_persist_response
+
+    suggested_params = additional_atc_context.suggested_params if additional_atc_context else None
+    retry_policy = additional_atc_context.submit_retry_policy if additional_atc_context else None
+    traced_simulate: SimulateAtomicTransactionResponse | None = None
+
+    try:
+        # Build transactions
+        transactions_with_signer = atc.build_group()
+
+        populate_app_call_resources = (
+            populate_app_call_resources
+            if populate_app_call_resources is not None
+            else config.populate_app_call_resource
+        )
+
+        if _requires_group_preparation(
+            transactions_with_signer, populate_app_call_resources, cover_app_call_inner_transaction_fees
+        ):
+            atc = prepare_group_for_sending(
+                atc,
+                algod,
+                populate_app_call_resources,
+                cover_app_call_inner_transaction_fees,
+                additional_atc_context,
+            )
+
+        # atc.build_group() is needed to ensure that any changes
+        # made by prepare_group_for_sending are reflected and the group id is set
+        transactions_to_send = [t.txn for t in atc.build_group()]
+
+        # Get group ID if multiple transactions
+        group_id = _get_group_id(transactions_to_send)
+        _log_sending_group(transactions_to_send, atc.tx_ids, group_id, suppress_log)
+
+        # Simulate if debug enabled
+        if config.debug and config.trace_all and config.project_root:
+            traced_simulate = simulate_and_persist_response(
+                atc,
+                config.project_root,
+                algod,
+                config.trace_buffer_size_mb,
+                suggested_params=suggested_params,
+            )
+
+        # Sign and submit transactions
+        _submit_signed_group(atc, algod, retry_policy)
+
+        return atc, transactions_to_send, group_id, traced_simulate
+
+    except Exception as e:
+        _raise_send_error(e, atc, algod, suppress_log, suggested_params, traced_simulate)
+
+
+def _raise_send_error(
+    error: Exception,
+    atc: AtomicTransactionComposer,
+    algod: AlgodClient,
+    suppress_log: bool | None,
+    suggested_params: SuggestedParams | None = None,
+    traced_simulate: SimulateAtomicTransactionResponse | None = None,
+) -> NoReturn:
+    from algokit_utils._debugging import simulate_and_persist_response, simulate_response
+
+    _log_send_error(error, suppress_log)
+
+    # Handle error with debug info if enabled
+    if config.debug:
+        simulate = _get_reusable_debug_simulate(error, atc, traced_simulate)
+        if simulate is None:
+            project_root = _get_debug_simulate_persist_root()
+            simulate = (
+                simulate_and_persist_response(
+                    atc, project_root, algod, config.trace_buffer_size_mb, suggested_params=suggested_params
+                )
+                if project_root
+                else simulate_response(atc, algod)
+            )
+
+        raise _build_debug_send_error(error, simulate) from error
+
+    raise error
+
+
+def _get_debug_simulate_persist_root() -> Path | None:
+    """Get the project root to persist the simulate explaining a failed send to, if it's persisted."""
+    # With trace_all every send was already simulated and persisted before it was sent
+    return config.project_root if not config.trace_all else None
+
+
+def _get_reusable_debug_simulate(
+    error: Exception,
+    atc: AtomicTransactionComposer,
+    traced_simulate: SimulateAtomicTransactionResponse | None,
+) -> SimulateAtomicTransactionResponse | None:
+    """Get a traced simulate of the group made before it was sent, which can explain the failed send as is.
+
+    The simulate is persisted like a simulate made to explain the failure would be.
+    """
+    from algokit_utils._debugging import _parse_simulate_response, _persist_simulate_response
+
+    if traced_simulate is None and isinstance(error, _ExecutionInfoSimulateError):
+        # The group failed while resolving its execution info, before anything was sent
+        traced_simulate = _parse_simulate_response(atc, error.simulate_response)
+    if traced_simulate is None or not traced_simulate.simulate_response.get("exec-trace-config", {}).get("enable"):
+        return None
+    project_root = _get_debug_simulate_persist_root()
+    if project_root:
+        _persist_simulate_response(traced_simulate, project_root, config.trace_buffer_size_mb)
+    return traced_simulate
+
+
+def _complete_group_send(
+    atc: AtomicTransactionComposer,
+    transactions_to_send: list[algosdk.transaction.Transaction],
+    group_id: str | None,
+    confirmations: list[dict[str, Any]],
+    *,
+    include_confirmations: bool,
+    learn_inner_fees: bool,
+    additional_atc_context: AdditionalAtcContext | None,
+    suppress_log: bool | None,
+) -> SendAtomicTransactionComposerResults:
+    """Mark a sent group as committed once it's confirmed, log it and get its results."""
+    atc.status = algosdk.atomic_transaction_composer.AtomicTransactionComposerStatus.COMMITTED
+    if learn_inner_fees:
+        _learn_inner_fees(transactions_to_send, confirmations, additional_atc_context)
+
+    _log_group_sent(transactions_to_send, atc.tx_ids, group_id, suppress_log)
+
+    return SendAtomicTransactionComposerResults(
+        group_id=group_id or "",
+        confirmations=cast(
+            list[algosdk.v2client.algod.AlgodResponseType], confirmations if include_confirmations else []
+        ),
+        tx_ids=list(atc.tx_ids),
+        transactions=_wrap_transactions(transactions_to_send, atc.tx_ids),
+        returns=_parse_abi_returns(atc, confirmations),
+    )
 
 
-def send_atomic_transaction_composer(  # noqa: C901, PLR0912
+def send_atomic_transaction_composer(
     atc: AtomicTransactionComposer,
     algod: AlgodClient,
     *,
@@ -1210,151 +2108,133 @@ def send_atomic_transaction_composer(  # noqa: C901, PLR0912
     populate_app_call_resources: bool | None = None,
     cover_app_call_inner_transaction_fees: bool | None = None,
     additional_atc_context: AdditionalAtcContext | None = None,
+    confirmation_tracker: ConfirmationTracker | None = None,
 ) -> SendAtomicTransactionComposerResults:
     """Send an AtomicTransactionComposer transaction group.
 
     Executes a group of transactions atomically using the AtomicTransactionComposer.
 
+    When a `ConfirmationTracker` is given, confirmation is awaited through it, so concurrent senders share a single
+    block-following loop rather than each polling algod for their own transactions.
+
     :param atc: The AtomicTransactionComposer instance containing the transaction group to send
     :param algod: The Algod client to use for sending the transactions
     :param max_rounds_to_wait: Maximum number of rounds to wait for confirmation, defaults to 5
-    :param skip_waiting: If True, don't wait for transaction confirmation, defaults to False
+    :param skip_waiting: If True, leave the confirmations out of the results, defaults to False. The group is still
+        waited for; use `submit_atomic_transaction_composer` to return as soon as it's accepted by algod
     :param suppress_log: If True, suppress logging, defaults to None
     :param populate_app_call_resources: If True, populate app call resources, defaults to None
     :param cover_app_call_inner_transaction_fees: If True, cover app call inner transaction fees, defaults to None
     :param additional_atc_context: Additional context for the AtomicTransactionComposer
+    :param confirmation_tracker: Optional tracker to wait for confirmation with, defaults to polling algod for this
+        group
     :return: Results from sending the transaction group
     :raises Exception: If there is an error sending the transactions
     :raises error: If there is an error from the Algorand node
     """
-    from algokit_utils._debugging import simulate_and_persist_response, simulate_response
+    learn_inner_fees = _covers_inner_fees_from_estimates(
+        atc, populate_app_call_resources, cover_app_call_inner_transaction_fees, additional_atc_context
+    )
+    atc, transactions_to_send, group_id, traced_simulate = _submit_group(
+        atc,
+        algod,
+        suppress_log=suppress_log,
+        populate_app_call_resources=populate_app_call_resources,
+        cover_app_call_inner_transaction_fees=cover_app_call_inner_transaction_fees,
+        additional_atc_context=additional_atc_context,
+    )
 
     try:
-        # Build transactions
-        transactions_with_signer = atc.build_group()
-
-        populate_app_call_resources = (
-            populate_app_call_resources
-            if populate_app_call_resources is not None
-            else config.populate_app_call_resource
+        # Wait for the group to be committed and fetch every confirmation
+        confirmations = _wait_for_group_confirmations(
+            algod,
+            atc.tx_ids,
+            max_rounds_to_wait or 5,
+            confirmation_tracker,
+            additional_atc_context.submit_retry_policy if additional_atc_context else None,
         )
-
-        if (populate_app_call_resources or cover_app_call_inner_transaction_fees) and any(
-            isinstance(t.txn, algosdk.transaction.ApplicationCallTxn) for t in transactions_with_signer
-        ):
-            atc = prepare_group_for_sending(
-                atc,
-                algod,
-                populate_app_call_resources,
-                cover_app_call_inner_transaction_fees,
-                additional_atc_context,
-            )
-
-        # atc.build_group() is needed to ensure that any changes
-        # made by prepare_group_for_sending are reflected and the group id is set
-        transactions_to_send = [t.txn for t in atc.build_group()]
-
-        # Get group ID if multiple transactions
-        group_id = None
-        if len(transactions_to_send) > 1:
-            group_id = (
-                base64.b64encode(transactions_to_send[0].group).decode("utf-8") if transactions_to_send[0].group else ""
-            )
-
-            if not suppress_log:
-                config.logger.info(
-                    f"Sending group of {len(transactions_to_send)} transactions ({group_id})",
-                    extra={"suppress_log": suppress_log or False},
-                )
-                config.logger.debug(
-                    f"Transaction IDs ({group_id}): {[t.get_txid() for t in transactions_to_send]}",
-                    extra={"suppress_log": suppress_log or False},
-                )
-
-        # Simulate if debug enabled
-        if config.debug and config.trace_all and config.project_root:
-            simulate_and_persist_response(
-                atc,
-                config.project_root,
-                algod,
-                config.trace_buffer_size_mb,
-            )
-
-        # Execute transactions
-        result = atc.execute(algod, wait_rounds=max_rounds_to_wait or 5)
-
-        # Log results
-        if not suppress_log:
-            if len(transactions_to_send) > 1:
-                config.logger.info(
-                    f"Group transaction ({group_id}) sent with {len(transactions_to_send)} transactions",
-                    extra={"suppress_log": suppress_log or False},
-                )
-            else:
-                config.logger.info(
-                    f"Sent transaction ID {transactions_to_send[0].get_txid()}",
-                    extra={"suppress_log": suppress_log or False},
-                )
-
-        # Get confirmations if not skipping
-        confirmations = None
-        if not skip_waiting:
-            confirmations = [algod.pending_transaction_info(t.get_txid()) for t in transactions_to_send]
-
-        # Return results
-        return SendAtomicTransactionComposerResults(
-            group_id=group_id or "",
-            confirmations=confirmations or [],
-            tx_ids=[t.get_txid() for t in transactions_to_send],
-            transactions=[TransactionWrapper(t) for t in transactions_to_send],
-            returns=[ABIReturn(r) for r in result.abi_results],
+        return _complete_group_send(
+            atc,
+            transactions_to_send,
+            group_id,
+            confirmations,
+            include_confirmations=not skip_waiting,
+            learn_inner_fees=learn_inner_fees,
+            additional_atc_context=additional_atc_context,
+            suppress_log=suppress_log,
         )
 
     except Exception as e:
-        # Handle error with debug info if enabled
-        if config.debug:
-            config.logger.error(
-                "Received error executing Atomic Transaction Composer and debug flag enabled; "
-                "attempting simulation to get more information ",
-                extra={"suppress_log": suppress_log or False},
-                exc_info=e,
-            )
+        _raise_send_error(
+            e,
+            atc,
+            algod,
+            suppress_log,
+            additional_atc_context.suggested_params if additional_atc_context else None,
+            traced_simulate,
+        )
 
-            simulate = None
-            if config.project_root and not config.trace_all:
-                # Only simulate if trace_all is disabled and project_root is set
-                simulate = simulate_and_persist_response(atc, config.project_root, algod, config.trace_buffer_size_mb)
-            else:
-                simulate = simulate_response(atc, algod)
-
-            traces = []
-            if simulate and simulate.failed_at:
-                for txn_group in simulate.simulate_response["txn-groups"]:
-                    app_budget = txn_group.get("app-budget-added")
-                    app_budget_consumed = txn_group.get("app-budget-consumed")
-                    failure_message = txn_group.get("failure-message")
-                    txn_result = txn_group.get("txn-results", [{}])[0]
-                    exec_trace = txn_result.get("exec-trace", {})
-
-                    traces.append(
-                        {
-                            "trace": exec_trace,
-                            "app_budget": app_budget,
-                            "app_budget_consumed": app_budget_consumed,
-                            "failure_message": failure_message,
-                        }
-                    )
 
-            error = Exception(f"Transaction failed: {e}")
-            error.traces = traces  # type: ignore[attr-defined]
-            raise error from e
+def submit_atomic_transaction_composer(
+    atc: AtomicTransactionComposer,
+    algod: AlgodClient,
+    confirmation_tracker: ConfirmationTracker | None = None,
+    *,
+    max_rounds_to_wait: int | None = 5,
+    suppress_log: bool | None = None,
+    populate_app_call_resources: bool | None = None,
+    cover_app_call_inner_transaction_fees: bool | None = None,
+    additional_atc_context: AdditionalAtcContext | None = None,
+    error_transformer: Callable[[Exception], Exception] | None = None,
+) -> PendingTransactionGroup:
+    """Submit an AtomicTransactionComposer transaction group without waiting for it to be confirmed.
+
+    The group is prepared and submitted exactly as `send_atomic_transaction_composer` would, but confirmation is
+    handed to the given `ConfirmationTracker`, so many independent groups can be submitted back to back and
+    confirmed together as blocks arrive. Without a tracker each group is polled for on a shared pool of threads.
 
-        config.logger.error(
-            "Received error executing Atomic Transaction Composer, for more information enable the debug flag",
-            extra={"suppress_log": suppress_log or False},
-            exc_info=e,
+    :param atc: The AtomicTransactionComposer instance containing the transaction group to send
+    :param algod: The Algod client to use for sending the transactions
+    :param confirmation_tracker: Optional tracker that follows the chain and resolves the confirmation, defaults to
+        polling algod for this group
+    :param max_rounds_to_wait: Maximum number of rounds to wait for confirmation, defaults to 5
+    :param suppress_log: If True, suppress logging, defaults to None
+    :param populate_app_call_resources: If True, populate app call resources, defaults to None
+    :param cover_app_call_inner_transaction_fees: If True, cover app call inner transaction fees, defaults to None
+    :param additional_atc_context: Additional context for the AtomicTransactionComposer
+    :param error_transformer: Optional function to transform an error raised while waiting for confirmation
+    :return: A handle to the submitted group, whose `result()` waits for and returns the send results
+    :raises Exception: If there is an error submitting the transactions
+    """
+    atc, transactions_to_send, group_id, _ = _submit_group(
+        atc,
+        algod,
+        suppress_log=suppress_log,
+        populate_app_call_resources=populate_app_call_resources,
+        cover_app_call_inner_transaction_fees=cover_app_call_inner_transaction_fees,
+        additional_atc_context=additional_atc_context,
+    )
+    _log_group_sent(transactions_to_send, atc.tx_ids, group_id, suppress_log)
+
+    confirmations = (
+        confirmation_tracker.track(atc.tx_ids, max_rounds_to_wait or 5)
+        if confirmation_tracker
+        else _get_confirmation_wait_executor().submit(
+            _wait_for_group_confirmations,
+            algod,
+            atc.tx_ids,
+            max_rounds_to_wait or 5,
+            None,
+            additional_atc_context.submit_retry_policy if additional_atc_context else None,
         )
-        raise e
+    )
+    return PendingTransactionGroup(
+        atc,
+        confirmations,
+        group_id=group_id or "",
+        transactions=_wrap_transactions(transactions_to_send, atc.tx_ids),
+        error_transformer=error_transformer,
+    )
 
 
 class TransactionComposer:
@@ -1369,7 +2249,16 @@ class TransactionComposer:
         defaults to using algod.suggested_params()
     :param default_validity_window: Optional default validity window for transactions in rounds, defaults to 10
     :param app_manager: Optional AppManager instance for compiling TEAL programs, defaults to None
-    :param error_transformers: Optional list of error transformers to use when an error is caught in simulate or send
+    :param error_transformers: Optional list of error transformers to use when an error is caught in simulate, send
+        or sign
+    :param confirmation_tracker: Optional tracker used to confirm sent groups, shared with every other composer using
+        it; defaults to polling algod for each group, which `submit` does on a shared pool of threads
+    :param execution_info_cache: Optional cache of the simulate responses used to populate app call resources and
+        cover inner transaction fees, defaults to simulating every send
+    :param submit_retry_policy: Optional policy for retrying transient algod failures while submitting and confirming,
+        defaults to not retrying
+    :param inner_fee_model: Optional model of learned inner transaction fees, used to cover app call inner transaction
+        fees without simulating once it's confident, defaults to simulating every send
     """
 
     def __init__(
@@ -1380,12 +2269,23 @@ class TransactionComposer:
         default_validity_window: int | None = None,
         app_manager: AppManager | None = None,
         error_transformers: list[ErrorTransformer] | None = None,
+        confirmation_tracker: ConfirmationTracker | None = None,
+        execution_info_cache: ExecutionInfoCache | None = None,
+        submit_retry_policy: SubmitRetryPolicy | None = None,
+        inner_fee_model: InnerFeeModel | None = None,
     ):
         # Map of transaction index in the atc to a max logical fee.
         # This is set using the value of either maxFee or staticFee.
         self._txn_max_fees: dict[int, AlgoAmount] = {}
-        self._txns: list[TransactionWithSigner | TxnParams | AtomicTransactionComposer] = []
+        self._txns: list[TransactionWithSigner | TxnParams | AtomicTransactionComposer | _MethodCallTemplateCall] = []
         self._atc: AtomicTransactionComposer = AtomicTransactionComposer()
+        # Transactions built from each entry in `_txns` (without resolving default signers), in the same order, so
+        # counting, simulating and building only build each entry once. `_txns` is append-only, so any entries past
+        # the end of this list are the ones added since the last build.
+        self._built_txns: list[list[TransactionWithSigner]] = []
+        # The suggested params every transaction in the group is built with, fetched on first build
+        self._build_suggested_params: algosdk.transaction.SuggestedParams | None = None
+        self._build_suggested_params_fetched_at = 0.0
         self._algod: AlgodClient = algod
         self._default_get_send_params = lambda: self._algod.suggested_params()
         self._get_suggested_params = get_suggested_params or self._default_get_send_params
@@ -1394,6 +2294,10 @@ class TransactionComposer:
         self._default_validity_window_is_explicit: bool = default_validity_window is not None
         self._app_manager = app_manager or AppManager(algod)
         self._error_transformers: list[ErrorTransformer] = error_transformers or []
+        self._confirmation_tracker = confirmation_tracker
+        self._execution_info_cache = execution_info_cache
+        self._submit_retry_policy = submit_retry_policy
+        self._inner_fee_model = inner_fee_model
 
     def _transform_error(self, original_error: Exception) -> Exception:
         """Transform an error using registered error transformers.
@@ -1774,6 +2678,21 @@ class TransactionComposer:
         self._txns.append(params)
         return self
 
+    def add_method_call_template(self, template: MethodCallTemplate, args: Sequence[Any]) -> TransactionComposer:
+        """Add a call to the ABI method of a precompiled method call template.
+
+        :param template: The precompiled method call
+        :param args: The ABI method arguments for this call
+        :return: The transaction composer instance for chaining
+        :raises ValueError: If the wrong number of arguments is given
+
+        :example:
+            >>> template = MethodCallTemplate(AppCallMethodCallParams(sender=sender, app_id=app_id, method=method))
+            >>> composer.add_method_call_template(template, [1, 2])
+        """
+        self._txns.append(_MethodCallTemplateCall(template=template, app_args=template.encode_args(args)))
+        return self
+
     def add_online_key_registration(self, params: OnlineKeyRegistrationParams) -> TransactionComposer:
         """Add an online key registration transaction.
 
@@ -1792,6 +2711,10 @@ class TransactionComposer:
         self._txns.append(params)
         return self
 
+    def _add_txn_params(self, params: TxnParams) -> TransactionComposer:
+        self._txns.append(params)
+        return self
+
     def add_atc(self, atc: AtomicTransactionComposer) -> TransactionComposer:
         """Add an existing AtomicTransactionComposer's transactions.
 
@@ -1811,7 +2734,8 @@ class TransactionComposer:
 
         :return: The number of transactions
         """
-        return len(self.build_transactions().transactions)
+        self._build_pending_txns(self._get_build_suggested_params())
+        return sum(len(built) for built in self._built_txns)
 
     def build(self) -> TransactionComposerBuildResult:
         """Build the transaction group.
@@ -1819,18 +2743,10 @@ class TransactionComposer:
         :return: The built transaction group result
         """
         if self._atc.get_status() == algosdk.atomic_transaction_composer.AtomicTransactionComposerStatus.BUILDING:
-            suggested_params = self._get_suggested_params()
-            txn_with_signers: list[TransactionWithSignerAndContext] = []
-
-            for txn in self._txns:
-                txn_with_signers.extend(self._build_txn(txn, suggested_params, include_signer=True))
-
-            for ts in txn_with_signers:
-                self._atc.add_transaction(ts)
-                if ts.context.abi_method:
-                    self._atc.method_dict[len(self._atc.txn_list) - 1] = ts.context.abi_method
-                if ts.context.max_fee:
-                    self._txn_max_fees[len(self._atc.txn_list) - 1] = ts.context.max_fee
+            suggested_params = self._get_build_suggested_params()
+            with time_phase(SendPhase.BUILD) as timer:
+                self._build(suggested_params)
+                timer.group_size = len(self._atc.txn_list)
 
         return TransactionComposerBuildResult(
             atc=self._atc,
@@ -1838,20 +2754,73 @@ class TransactionComposer:
             method_calls=self._atc.method_dict,
         )
 
+    def _get_build_suggested_params(self) -> algosdk.transaction.SuggestedParams:
+        self._expire_build_suggested_params()
+        if self._build_suggested_params is None:
+            with time_phase(SendPhase.PARAM_FETCH):
+                self._build_suggested_params = self._get_suggested_params()
+            self._build_suggested_params_fetched_at = time.monotonic()
+        return self._build_suggested_params
+
+    def _expire_build_suggested_params(self) -> None:
+        # A composer that's counted early and sent later would otherwise send with a stale validity window. Once the
+        # group has been built into the ATC it's kept as is, until it's rebuilt.
+        if (
+            self._build_suggested_params is not None
+            and not self._atc.txn_list
+            and time.monotonic() - self._build_suggested_params_fetched_at > _BUILD_SUGGESTED_PARAMS_MAX_AGE
+        ):
+            self._built_txns = []
+            self._build_suggested_params = None
+
+    def _build(self, suggested_params: algosdk.transaction.SuggestedParams) -> None:
+        self._build_pending_txns(suggested_params)
+
+        for txn_with_signers in self._built_txns:
+            for ts in txn_with_signers:
+                signer = self._get_signer(ts.signer.address) if isinstance(ts.signer, _DeferredSigner) else ts.signer
+                # Copy so that grouping the transactions in the ATC doesn't affect the built transactions
+                self._atc.add_transaction(TransactionWithSigner(txn=copy(ts.txn), signer=signer))
+                if isinstance(ts, TransactionWithSignerAndContext):
+                    if ts.context.abi_method:
+                        self._atc.method_dict[len(self._atc.txn_list) - 1] = ts.context.abi_method
+                    if ts.context.max_fee:
+                        self._txn_max_fees[len(self._atc.txn_list) - 1] = ts.context.max_fee
+
     def rebuild(self) -> TransactionComposerBuildResult:
         """Rebuild the transaction group from scratch.
 
+        Suggested params are fetched again, so this can be used to refresh the validity window of the group.
+
         :return: The rebuilt transaction group result
         """
-        self._atc = AtomicTransactionComposer()
+        self._reset_build()
         return self.build()
 
+    def _reset_build(self) -> None:
+        self._atc = AtomicTransactionComposer()
+        self._built_txns = []
+        self._build_suggested_params = None
+
     def build_transactions(self) -> BuiltTransactions:
         """Build and return the transactions without executing them.
 
+        Transactions are only built once, so calling this again (or `count`, `simulate` etc.) only builds the
+        transactions added since the previous call. Each call returns new transaction instances.
+
         :return: The built transactions result
         """
-        suggested_params = self._get_suggested_params()
+        return self._build_transactions(self._get_build_suggested_params())
+
+    def _build_pending_txns(self, suggested_params: algosdk.transaction.SuggestedParams) -> None:
+        for txn in self._txns[len(self._built_txns) :]:
+            if isinstance(txn, MethodCallParams):
+                self._built_txns.append(list(self._build_method_call(txn, suggested_params)))
+            else:
+                self._built_txns.append(list(self._build_txn(txn, suggested_params)))
+
+    def _build_transactions(self, suggested_params: algosdk.transaction.SuggestedParams) -> BuiltTransactions:
+        self._build_pending_txns(suggested_params)
 
         transactions: list[algosdk.transaction.Transaction] = []
         method_calls: dict[int, Method] = {}
@@ -1859,17 +2828,11 @@ class TransactionComposer:
 
         idx = 0
 
-        for txn in self._txns:
-            txn_with_signers: list[TransactionWithSigner] = []
-
-            if isinstance(txn, MethodCallParams):
-                txn_with_signers.extend(self._build_method_call(txn, suggested_params, include_signer=False))
-            else:
-                txn_with_signers.extend(self._build_txn(txn, suggested_params, include_signer=False))
-
+        for txn_with_signers in self._built_txns:
             for ts in txn_with_signers:
-                transactions.append(ts.txn)
-                if ts.signer and ts.signer != NULL_SIGNER:
+                # Copy so that callers grouping the transactions (which sets the group ID) don't affect later builds
+                transactions.append(copy(ts.txn))
+                if ts.signer and ts.signer != NULL_SIGNER and not isinstance(ts.signer, _DeferredSigner):
                     signers[idx] = ts.signer
                 if isinstance(ts, TransactionWithSignerAndContext) and ts.context.abi_method:
                     method_calls[idx] = ts.context.abi_method
@@ -1890,44 +2853,295 @@ class TransactionComposer:
     def send(
         self,
         params: SendParams | None = None,
+        *,
+        skip_waiting: bool = False,
     ) -> SendAtomicTransactionComposerResults:
         """Send the transaction group to the network.
 
+        If `max_resubmits_on_expiry` is set and the group expires before it's confirmed (e.g. because of
+        congestion), the group is rebuilt with fresh suggested params, re-signed and sent again, up to that many times.
+        Groups containing prebuilt transactions or explicit validity rounds are never rebuilt.
+
+        If inner transaction fees were covered from the composer's `InnerFeeModel` and algod rejects the group because
+        a fee was too small, the estimates are forgotten and the group is rebuilt and sent once more, covering fees
+        via simulate.
+
+        If `skip_waiting` is set the group is sent with `submit()`, and the results are returned as soon as it has
+        been accepted by algod, without confirmations or ABI return values. Their `pending` handle waits for them.
+        Expired groups can't be resubmitted once the send has returned, so `max_resubmits_on_expiry` doesn't apply.
+
         :param params: Parameters for the send operation
+        :param skip_waiting: If True, return as soon as the group is accepted by algod, defaults to False
         :return: The transaction send results
         :raises self._transform_error: If the transaction fails (may be transformed by error transformers)
-        """
-        group = self.build().transactions
 
+        :example:
+            >>> result = composer.send(skip_waiting=True)
+            >>> ...  # Other work while the group is confirmed
+            >>> confirmed = result.pending.result()
+        """
         if not params:
             params = SendParams()
 
-        cover_app_call_inner_transaction_fees = params.get("cover_app_call_inner_transaction_fees")
+        if skip_waiting:
+            pending = self.submit(params)
+            return SendAtomicTransactionComposerResults(
+                group_id=pending.group_id,
+                confirmations=[],
+                tx_ids=pending.tx_ids,
+                transactions=pending.transactions,
+                returns=[],
+                pending=pending,
+            )
+
+        resubmits = 0
+        resimulated_fees = False
+        while True:
+            wait_rounds, sp = self._get_send_wait_rounds_and_suggested_params(params)
+
+            try:
+                result = send_atomic_transaction_composer(
+                    self._atc,
+                    self._algod,
+                    max_rounds_to_wait=wait_rounds,
+                    suppress_log=params.get("suppress_log"),
+                    populate_app_call_resources=params.get("populate_app_call_resources"),
+                    cover_app_call_inner_transaction_fees=params.get("cover_app_call_inner_transaction_fees"),
+                    additional_atc_context=self._get_additional_atc_context(sp),
+                    confirmation_tracker=self._confirmation_tracker,
+                )
+            except Exception as original_error:
+                if not resimulated_fees and self._forget_inner_fee_estimates(original_error, params):
+                    resimulated_fees = True
+                    self._reset_build()
+                    continue
+                if not self._should_resubmit_expired(original_error, params, resubmits):
+                    raise self._transform_error(original_error) from original_error
+                resubmits += 1
+                _log_expired_resubmit(params, resubmits)
+                self._reset_build()
+                continue
+
+            self._invalidate_cached_execution_info()
+            return result
+
+    def sign(self, params: SendParams | None = None) -> SignedGroup:
+        """Build and sign the transaction group without sending it, e.g. to submit it later from another process.
+
+        App call resources are populated and inner transaction fees covered just as they would be by `send`.
+
+        :param params: Parameters for preparing the group, only `populate_app_call_resources` and
+            `cover_app_call_inner_transaction_fees` are used
+        :return: The signed group, encoded as it's submitted to algod
+        :raises self._transform_error: If the group can't be prepared or signed (may be transformed by error
+            transformers)
+
+        :example:
+            >>> write_signed_groups("batch.msgpack", (composer.sign() for composer in composers))
+        """
+        try:
+            atc = self._get_prepared_atc(params or SendParams())
+            with time_phase(SendPhase.SIGN, len(atc.txn_list)):
+                return SignedGroup.from_signed_transactions(atc.gather_signatures())
+        except Exception as original_error:
+            raise self._transform_error(original_error) from original_error
+
+    @staticmethod
+    def sign_many(
+        composers: Sequence[TransactionComposer],
+        params: SendParams | None = None,
+        *,
+        parallel_signer: ParallelSigner | None = None,
+    ) -> list[SignedGroup]:
+        """Build and sign many transaction groups without sending them, signing in parallel across processes.
+
+        Each group is prepared as it would be by `sign`, then every transaction signed by a private key is signed
+        by a `ParallelSigner`, batched per key, so large batches (e.g. airdrops) aren't limited to a single core.
+
+        :param composers: The composers whose groups to sign
+        :param params: Parameters for preparing the groups, only `populate_app_call_resources` and
+            `cover_app_call_inner_transaction_fees` are used
+        :param parallel_signer: Optional signer to reuse across calls, defaults to one that's closed once the groups
+            are signed
+        :return: The signed groups, in the same order as `composers`
+        :raises Exception: If a group can't be prepared (may be transformed by its composer's error transformers)
+
+        :example:
+            >>> write_signed_groups("airdrop.msgpack", TransactionComposer.sign_many(composers))
+        """
+        atcs = [composer._prepare_for_signing(params or SendParams()) for composer in composers]  # noqa: SLF001
+        groups = [atc.build_group() for atc in atcs]
+        with (
+            time_phase(SendPhase.SIGN, sum(len(group) for group in groups)),
+            contextlib.nullcontext(parallel_signer) if parallel_signer else ParallelSigner() as signer,
+        ):
+            return [SignedGroup.from_signed_transactions(signed) for signed in signer.sign_groups(groups)]
+
+    def _prepare_for_signing(self, params: SendParams) -> AtomicTransactionComposer:
+        try:
+            return self._get_prepared_atc(params)
+        except Exception as original_error:
+            raise self._transform_error(original_error) from original_error
+
+    def _get_prepared_atc(self, params: SendParams) -> AtomicTransactionComposer:
+        self.build()
         populate_app_call_resources = params.get("populate_app_call_resources")
+        if populate_app_call_resources is None:
+            populate_app_call_resources = config.populate_app_call_resource
+        cover_app_call_inner_transaction_fees = params.get("cover_app_call_inner_transaction_fees")
+
+        if not _requires_group_preparation(
+            self._atc.build_group(), populate_app_call_resources, cover_app_call_inner_transaction_fees
+        ):
+            return self._atc
+        return prepare_group_for_sending(
+            self._atc,
+            self._algod,
+            populate_app_call_resources,
+            cover_app_call_inner_transaction_fees,
+            self._get_additional_atc_context(self._get_build_suggested_params()),
+        )
+
+    def submit(
+        self,
+        params: SendParams | None = None,
+    ) -> PendingTransactionGroup:
+        """Submit the transaction group to the network without waiting for it to be confirmed.
+
+        Confirmation is followed by the composer's `ConfirmationTracker` (for composers from `AlgorandClient`, the one
+        shared by its client manager), which resolves every submitted group as blocks arrive, so independent groups
+        can be submitted back to back instead of one per block. Composers without a tracker poll algod for each group
+        on a shared pool of threads.
+
+        Groups rejected for a too small fee after covering inner transaction fees from the `InnerFeeModel` are
+        rebuilt and submitted once more in the same way as `send`.
+
+        :param params: Parameters for the send operation
+        :return: A handle to the submitted group, whose `result()` waits for and returns the send results
+        :raises self._transform_error: If the transaction fails (may be transformed by error transformers)
+
+        :example:
+            >>> pending = [algorand.new_group().add_payment(payment).submit() for payment in payments]
+            >>> results = [p.result() for p in pending]
+        """
+        if not params:
+            params = SendParams()
+
+        resimulated_fees = False
+        while True:
+            wait_rounds, sp = self._get_send_wait_rounds_and_suggested_params(params)
+
+            try:
+                pending = submit_atomic_transaction_composer(
+                    self._atc,
+                    self._algod,
+                    self._confirmation_tracker,
+                    max_rounds_to_wait=wait_rounds,
+                    suppress_log=params.get("suppress_log"),
+                    populate_app_call_resources=params.get("populate_app_call_resources"),
+                    cover_app_call_inner_transaction_fees=params.get("cover_app_call_inner_transaction_fees"),
+                    additional_atc_context=self._get_additional_atc_context(sp),
+                    error_transformer=self._transform_error,
+                )
+            except Exception as original_error:
+                if not resimulated_fees and self._forget_inner_fee_estimates(original_error, params):
+                    resimulated_fees = True
+                    self._reset_build()
+                    continue
+                raise self._transform_error(original_error) from original_error
+
+            self._invalidate_cached_execution_info()
+            return pending
+
+    def _get_resubmittable_expiry_error(
+        self, error: Exception, params: SendParams, resubmits: int
+    ) -> BaseException | None:
+        """Get the error showing the group may have expired, if it's one that can be rebuilt and resubmitted."""
+        if resubmits >= (params.get("max_resubmits_on_expiry") or 0):
+            return None
+        if any(_has_fixed_validity(txn) for txn in self._txns):
+            return None
+        return _get_expiry_error(error)
+
+    def _has_expired(self, last_round: int) -> bool:
+        # Waiting can time out before the group expires (e.g. with a short `max_rounds_to_wait`), in which case it may
+        # still be confirmed, so it's only safe to resubmit once it can no longer be
+        last_valid_round: int = min(txn.txn.last_valid_round for txn in self._atc.build_group())
+        return last_round > last_valid_round
+
+    def _forget_inner_fee_estimates(self, error: Exception, params: SendParams) -> bool:
+        """Forget the learned inner fees of a group algod rejected for a too small fee.
+
+        :return: True if any of the group's fees may have been estimated, in which case simulating could fix them
+        """
+        if (
+            self._inner_fee_model is None
+            or not params.get("cover_app_call_inner_transaction_fees")
+            or not _is_fee_error(error)
+        ):
+            return False
+        forgotten = [
+            self._inner_fee_model.forget(t.txn)
+            for t in self._atc.build_group()
+            if isinstance(t.txn, algosdk.transaction.ApplicationCallTxn)
+        ]
+        if not any(forgotten):
+            return False
+        config.logger.warning(
+            "Transaction group was rejected with estimated inner transaction fees, resending with simulated fees",
+            extra={"suppress_log": params.get("suppress_log") or False},
+        )
+        return True
+
+    def _should_resubmit_expired(self, error: Exception, params: SendParams, resubmits: int) -> bool:
+        expiry_error = self._get_resubmittable_expiry_error(error, params, resubmits)
+        if not isinstance(expiry_error, algosdk.error.ConfirmationTimeoutError):
+            return expiry_error is not None
+        try:
+            return self._has_expired(cast(int, cast(dict, self._algod.status())["last-round"]))
+        except Exception:
+            return False
+
+    def _get_additional_atc_context(self, sp: algosdk.transaction.SuggestedParams | None) -> AdditionalAtcContext:
+        return AdditionalAtcContext(
+            suggested_params=sp,
+            max_fees=self._txn_max_fees,
+            execution_info_cache=self._execution_info_cache,
+            submit_retry_policy=self._submit_retry_policy,
+            inner_fee_model=self._inner_fee_model,
+        )
+
+    def _invalidate_cached_execution_info(self) -> None:
+        # Updating or deleting an app changes what calls to it access and the inner transactions they issue, so
+        # previously cached execution info and learned inner fees are stale
+        if self._execution_info_cache is None and self._inner_fee_model is None:
+            return
+        for txn_with_signer in self._atc.txn_list:
+            txn = txn_with_signer.txn
+            if isinstance(txn, algosdk.transaction.ApplicationCallTxn) and txn.on_complete in (
+                OnComplete.UpdateApplicationOC,
+                OnComplete.DeleteApplicationOC,
+            ):
+                if self._execution_info_cache is not None:
+                    self._execution_info_cache.invalidate(app_id=txn.index)
+                if self._inner_fee_model is not None:
+                    self._inner_fee_model.invalidate(app_id=txn.index)
+
+    def _get_send_wait_rounds_and_suggested_params(
+        self, params: SendParams
+    ) -> tuple[int, algosdk.transaction.SuggestedParams]:
+        group = self.build().transactions
+
+        # The same snapshot the group was built with is used for fee coverage, debug simulation and working out how
+        # long to wait, so a send only fetches suggested params once and every phase agrees on the current round
+        sp = self._get_build_suggested_params()
         wait_rounds = params.get("max_rounds_to_wait")
-        sp = self._get_suggested_params() if not wait_rounds or cover_app_call_inner_transaction_fees else None
 
         if wait_rounds is None:
             last_round = max(txn.txn.last_valid_round for txn in group)
-            assert sp is not None
-            first_round = sp.first
-            wait_rounds = last_round - first_round + 1
+            wait_rounds = last_round - sp.first + 1
 
-        try:
-            return send_atomic_transaction_composer(
-                self._atc,
-                self._algod,
-                max_rounds_to_wait=wait_rounds,
-                suppress_log=params.get("suppress_log"),
-                populate_app_call_resources=populate_app_call_resources,
-                cover_app_call_inner_transaction_fees=cover_app_call_inner_transaction_fees,
-                additional_atc_context=AdditionalAtcContext(
-                    suggested_params=sp,
-                    max_fees=self._txn_max_fees,
-                ),
-            )
-        except Exception as original_error:
-            raise self._transform_error(original_error) from original_error
+        return wait_rounds, sp
 
     def _handle_simulate_error(self, simulate_response: SimulateAtomicTransactionResponse) -> None:
         # const failedGroup = simulateResponse?.txnGroups[0]
@@ -1968,16 +3182,9 @@ class TransactionComposer:
         """
         from algokit_utils._debugging import simulate_and_persist_response, simulate_response
 
-        atc = AtomicTransactionComposer() if skip_signatures else self._atc
-
+        atc = self._get_simulate_atc(skip_signatures=skip_signatures)
         if skip_signatures:
             allow_empty_signatures = True
-            transactions = self.build_transactions()
-            for txn in transactions.transactions:
-                atc.add_transaction(TransactionWithSigner(txn=txn, signer=NULL_SIGNER))
-            atc.method_dict = transactions.method_calls
-        else:
-            self.build()
 
         if config.debug and config.project_root and config.trace_all:
             response = simulate_and_persist_response(
@@ -1991,18 +3198,9 @@ class TransactionComposer:
                 extra_opcode_budget,
                 exec_trace_config,
                 simulation_round,
+                suggested_params=self._build_suggested_params,
             )
-            self._handle_simulate_error(response)
-            return SendAtomicTransactionComposerResults(
-                confirmations=response.simulate_response.get("txn-groups", [{"txn-results": [{"txn-result": {}}]}])[0][
-                    "txn-results"
-                ],
-                transactions=[TransactionWrapper(txn.txn) for txn in atc.txn_list],
-                tx_ids=response.tx_ids,
-                group_id=atc.txn_list[-1].txn.group or "",
-                simulate_response=response.simulate_response,
-                returns=[ABIReturn(r) for r in response.abi_results],
-            )
+            return self._build_simulate_results(atc, response, persisted=True)
 
         response = simulate_response(
             atc,
@@ -2014,14 +3212,105 @@ class TransactionComposer:
             exec_trace_config,
             simulation_round,
         )
+        return self._build_simulate_results(atc, response, persisted=False)
+
+    @staticmethod
+    def simulate_many(
+        composers: Sequence[TransactionComposer],
+        *,
+        allow_more_logs: bool | None = None,
+        allow_empty_signatures: bool | None = None,
+        allow_unnamed_resources: bool | None = None,
+        extra_opcode_budget: int | None = None,
+        exec_trace_config: SimulateTraceConfig | None = None,
+        simulation_round: int | None = None,
+        skip_signatures: bool | None = None,
+        max_groups_per_request: int = 1,
+        max_workers: int = 8,
+    ) -> list[SendAtomicTransactionComposerResults]:
+        """Simulate the transaction groups of many composers at once.
+
+        Each composer's group is simulated independently, exactly as `simulate` would, but the groups are packed
+        into simulate requests of up to `max_groups_per_request` groups each and those requests are sent concurrently.
+        The simulate options apply to every group. Groups are simulated with the algod client of the first composer.
+
+        Current algod versions only accept a single group per simulate request, so `max_groups_per_request` defaults
+        to 1; raise it when simulating against a node that accepts more.
+
+        :param composers: The composers to simulate
+        :param allow_more_logs: Whether to allow more logs than the standard limit
+        :param allow_empty_signatures: Whether to allow transactions with empty signatures
+        :param allow_unnamed_resources: Whether to allow unnamed resources.
+        :param extra_opcode_budget: Additional opcode budget to allocate
+        :param exec_trace_config: Configuration for execution tracing
+        :param simulation_round: Round number to simulate at
+        :param skip_signatures: Whether to skip signature validation
+        :param max_groups_per_request: Maximum number of groups to send in a single simulate request, defaults to 1
+        :param max_workers: Maximum number of simulate requests to have in flight at once, defaults to 8
+        :return: The simulation results of each composer, in the same order as `composers`
+        :raises Exception: If any group fails to simulate (may be transformed by that composer's error transformers)
+
+        :example:
+            >>> composers = [algorand.new_group().add_app_call_method_call(params) for params in calls]
+            >>> results = TransactionComposer.simulate_many(composers, skip_signatures=True)
+            >>> values = [result.returns[-1].value for result in results]
+        """
+        from algokit_utils._debugging import _persist_simulate_response, simulate_responses
+
+        if not composers:
+            return []
+
+        atcs = [composer._get_simulate_atc(skip_signatures=skip_signatures) for composer in composers]  # noqa: SLF001
+        responses = simulate_responses(
+            atcs,
+            composers[0]._algod,  # noqa: SLF001
+            allow_more_logs,
+            True if skip_signatures else allow_empty_signatures,
+            allow_unnamed_resources,
+            extra_opcode_budget,
+            exec_trace_config,
+            simulation_round,
+            max_groups_per_request=max_groups_per_request,
+            max_workers=max_workers,
+        )
+
+        persisted = bool(config.debug and config.project_root and config.trace_all)
+        results = []
+        for composer, atc, response in zip(composers, atcs, responses, strict=True):
+            if persisted:
+                assert config.project_root is not None
+                _persist_simulate_response(response, config.project_root, config.trace_buffer_size_mb)
+            results.append(composer._build_simulate_results(atc, response, persisted=persisted))  # noqa: SLF001
+        return results
+
+    def _get_simulate_atc(self, *, skip_signatures: bool | None) -> AtomicTransactionComposer:
+        if skip_signatures:
+            return self._build_unsigned_atc(self.build_transactions())
+        return self.build().atc
+
+    @staticmethod
+    def _build_unsigned_atc(transactions: BuiltTransactions) -> AtomicTransactionComposer:
+        atc = AtomicTransactionComposer()
+        for txn in transactions.transactions:
+            atc.add_transaction(TransactionWithSigner(txn=txn, signer=NULL_SIGNER))
+        atc.method_dict = transactions.method_calls
+        return atc
+
+    def _build_simulate_results(
+        self,
+        atc: AtomicTransactionComposer,
+        response: SimulateAtomicTransactionResponse,
+        *,
+        persisted: bool,
+    ) -> SendAtomicTransactionComposerResults:
         self._handle_simulate_error(response)
         confirmation_results = response.simulate_response.get("txn-groups", [{"txn-results": [{"txn-result": {}}]}])[0][
             "txn-results"
         ]
 
         return SendAtomicTransactionComposerResults(
-            confirmations=[txn["txn-result"] for txn in confirmation_results],
-            transactions=[TransactionWrapper(txn.txn) for txn in atc.txn_list],
+            confirmations=confirmation_results if persisted else [txn["txn-result"] for txn in confirmation_results],
+            transactions=_wrap_transactions([txn.txn for txn in atc.txn_list], response.tx_ids),
             tx_ids=response.tx_ids,
             group_id=atc.txn_list[-1].txn.group or "",
             simulate_response=response.simulate_response,
@@ -2143,8 +3432,6 @@ class TransactionComposer:
         self,
         params: MethodCallParams,
         suggested_params: algosdk.transaction.SuggestedParams,
-        *,
-        include_signer: bool,
     ) -> list[TransactionWithSignerAndContext]:
         method_args: list[ABIValue | TransactionWithSigner] = []
         txns_for_group: list[TransactionWithSignerAndContext] = []
@@ -2174,9 +3461,7 @@ class TransactionComposer:
                     method_args.append(
                         TransactionWithSignerAndContext(
                             txn=arg,
-                            signer=signer
-                            if signer is not None
-                            else (NULL_SIGNER if not include_signer else self._get_signer(params.sender)),
+                            signer=signer if signer is not None else _DeferredSigner(params.sender),
                             context=TransactionContext(abi_method=None),
                         )
                     )
@@ -2188,9 +3473,7 @@ class TransactionComposer:
                         | AppUpdateMethodCallParams()
                         | AppDeleteMethodCallParams()
                     ):
-                        temp_txn_with_signers = self._build_method_call(
-                            arg, suggested_params, include_signer=include_signer
-                        )
+                        temp_txn_with_signers = self._build_method_call(arg, suggested_params)
                         # Add all transactions except the last one in reverse order
                         txns_for_group.extend(temp_txn_with_signers[:-1])
                         # Add the last transaction to method_args
@@ -2227,7 +3510,7 @@ class TransactionComposer:
                 method_args.append(
                     TransactionWithSignerAndContext(
                         txn=txn.txn,
-                        signer=signer or (NULL_SIGNER if not include_signer else self._get_signer(params.sender)),
+                        signer=signer or _DeferredSigner(params.sender),
                         context=TransactionContext(abi_method=params.method),
                     )
                 )
@@ -2272,10 +3555,7 @@ class TransactionComposer:
             "method": params.method,
             "sender": params.sender,
             "sp": suggested_params,
-            "signer": params.signer
-            if params.signer is not None
-            else (NULL_SIGNER if not include_signer else self._get_signer(params.sender))
-            or algosdk.atomic_transaction_composer.EmptySigner(),
+            "signer": params.signer if params.signer is not None else _DeferredSigner(params.sender),
             "method_args": list(reversed(method_args)),
             "on_complete": params.on_complete or algosdk.transaction.OnComplete.NoOpOC,
             "boxes": [AppManager.get_box_reference(ref) for ref in params.box_references]
@@ -2316,6 +3596,26 @@ class TransactionComposer:
 
         return response
 
+    def _build_method_call_template_call(
+        self,
+        call: _MethodCallTemplateCall,
+        suggested_params: algosdk.transaction.SuggestedParams,
+    ) -> TransactionWithSignerAndContext:
+        template = call.template
+        result = self._common_txn_build_step(
+            lambda x: template.build_transaction(
+                call.app_args, x["sp"], note=x.get("note"), lease=x.get("lease"), rekey_to=x.get("rekey_to")
+            ),
+            template.params,
+            {"sp": suggested_params},
+        )
+        signer = template.signer or _DeferredSigner(template.params.sender)
+        return TransactionWithSignerAndContext(
+            txn=result.txn,
+            signer=signer,
+            context=TransactionContext(abi_method=template.method, max_fee=result.context.max_fee),
+        )
+
     def _build_payment(
         self, params: PaymentParams, suggested_params: algosdk.transaction.SuggestedParams
     ) -> TransactionWithContext:
@@ -2514,10 +3814,8 @@ class TransactionComposer:
 
     def _build_txn(  # noqa: C901, PLR0912, PLR0911
         self,
-        txn: TransactionWithSigner | TxnParams | AtomicTransactionComposer,
+        txn: TransactionWithSigner | TxnParams | AtomicTransactionComposer | _MethodCallTemplateCall,
         suggested_params: algosdk.transaction.SuggestedParams,
-        *,
-        include_signer: bool,
     ) -> list[TransactionWithSignerAndContext]:
         match txn:
             case TransactionWithSigner():
@@ -2526,8 +3824,10 @@ class TransactionComposer:
                 ]
             case AtomicTransactionComposer():
                 return self._build_atc(txn)
+            case _MethodCallTemplateCall():
+                return [self._build_method_call_template_call(txn, suggested_params)]
             case algosdk.transaction.Transaction():
-                signer = NULL_SIGNER if not include_signer else self._get_signer(txn.sender)
+                signer = _DeferredSigner(txn.sender)
                 return [TransactionWithSignerAndContext(txn=txn, signer=signer, context=TransactionContext.empty())]
             case (
                 AppCreateMethodCallParams()
@@ -2535,10 +3835,10 @@ class TransactionComposer:
                 | AppUpdateMethodCallParams()
                 | AppDeleteMethodCallParams()
             ):
-                return self._build_method_call(txn, suggested_params, include_signer=include_signer)
+                return self._build_method_call(txn, suggested_params)
 
         signer = txn.signer.signer if isinstance(txn.signer, TransactionSignerAccountProtocol) else txn.signer  # type: ignore[assignment]
-        signer = signer or (NULL_SIGNER if not include_signer else self._get_signer(txn.sender))
+        signer = signer or _DeferredSigner(txn.sender)
 
         match txn:
             case PaymentParams():
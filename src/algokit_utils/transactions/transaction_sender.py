@@ -222,6 +222,7 @@ class AlgorandClientTransactionSender:
             raw_result_dict = raw_result.__dict__.copy()
             raw_result_dict["transactions"] = raw_result.transactions
             del raw_result_dict["simulate_response"]
+            del raw_result_dict["pending"]
 
             result = SendSingleTransactionResult(
                 **raw_result_dict,
@@ -0,0 +1,85 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from unittest.mock import Mock
+
+import algosdk
+import pytest
+from algosdk.v2client.algod import AlgodClient
+
+from algokit_utils.algorand import AlgorandClient
+from algokit_utils.clients.coalescing_algod_client import CoalescingAlgodClient
+from algokit_utils.models.network import AlgoClientNetworkConfig
+
+CALLERS = 8
+
+
+def _blocked_algod(response: object) -> tuple[AlgodClient, threading.Event]:
+    algod = AlgodClient("", "http://algod")
+    release = threading.Event()
+
+    def algod_request(*_: object) -> object:
+        release.wait()
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    algod.algod_request = Mock(side_effect=algod_request)  # type: ignore[method-assign]
+    return algod, release
+
+
+def _wait_for_coalesced(algod: CoalescingAlgodClient, count: int) -> None:
+    for _ in range(500):
+        if algod.coalesced == count:
+            return
+        time.sleep(0.01)
+    raise AssertionError(f"Expected {count} coalesced reads, got {algod.coalesced}")
+
+
+def test_identical_concurrent_reads_share_one_request() -> None:
+    inner, release = _blocked_algod({"id": 1, "params": {"global-state": []}})
+    algod = CoalescingAlgodClient(inner)
+
+    with ThreadPoolExecutor(CALLERS) as executor:
+        futures = [executor.submit(algod.application_info, 1) for _ in range(CALLERS)]
+        _wait_for_coalesced(algod, CALLERS - 1)
+        release.set()
+        results: list[Any] = [f.result() for f in futures]
+
+    assert inner.algod_request.call_count == 1  # type: ignore[attr-defined]
+    assert all(r == {"id": 1, "params": {"global-state": []}} for r in results)
+    # Each caller gets its own copy
+    assert len({id(r) for r in results}) == CALLERS
+
+    # Later reads aren't served from the finished request
+    algod.application_info(1)
+    assert inner.algod_request.call_count == 2  # type: ignore[attr-defined]
+
+
+def test_errors_are_shared_and_writes_are_not_coalesced() -> None:
+    inner, release = _blocked_algod(algosdk.error.AlgodHTTPError("application does not exist", 404))
+    algod = CoalescingAlgodClient(inner)
+
+    with ThreadPoolExecutor(CALLERS) as executor:
+        futures = [executor.submit(algod.application_info, 1) for _ in range(CALLERS)]
+        _wait_for_coalesced(algod, CALLERS - 1)
+        release.set()
+        for future in futures:
+            with pytest.raises(algosdk.error.AlgodHTTPError, match="does not exist"):
+                future.result()
+
+    inner.algod_request.side_effect = None  # type: ignore[attr-defined]
+    inner.algod_request.return_value = {"txId": "TX"}  # type: ignore[attr-defined]
+    with ThreadPoolExecutor(2) as executor:
+        list(executor.map(lambda _: algod.send_raw_transaction("AA=="), range(2)))
+    assert inner.algod_request.call_count == 3  # type: ignore[attr-defined]
+    assert algod.coalesced == CALLERS - 1
+
+
+def test_from_config_coalesces_reads() -> None:
+    algorand = AlgorandClient.from_config(AlgoClientNetworkConfig(server="http://localhost"), coalesce_reads=True)
+
+    algod = algorand.client.algod
+    assert isinstance(algod, CoalescingAlgodClient)
+    assert type(algod.algod) is AlgodClient
@@ -0,0 +1,123 @@
+from typing import Any, cast
+from unittest.mock import Mock
+
+import pytest
+from algosdk import error
+
+from algokit_utils.clients.confirmation_tracker import ConfirmationTracker
+
+
+def _mock_algod(confirmed_in_round: dict[str, int], pool_errors: dict[str, str] | None = None) -> Mock:
+    """Mock algod where each transaction is confirmed once the chain reaches the given round."""
+    chain = {"round": 10}
+    algod = Mock()
+    algod.status.side_effect = lambda: {"last-round": chain["round"]}
+
+    def status_after_block(round_num: int) -> dict[str, Any]:
+        chain["round"] = round_num + 1
+        return {"last-round": chain["round"]}
+
+    def pending_transaction_info(tx_id: str) -> dict[str, Any]:
+        if pool_errors and tx_id in pool_errors:
+            return {"pool-error": pool_errors[tx_id], "confirmed-round": 0}
+        if tx_id not in confirmed_in_round:
+            raise error.AlgodHTTPError("not found", 404)
+        confirmed = confirmed_in_round[tx_id] if chain["round"] >= confirmed_in_round[tx_id] else 0
+        return {"pool-error": "", "confirmed-round": confirmed, "txid": tx_id}
+
+    def get_block_txids(round_num: int) -> dict[str, Any]:
+        return {"blockTxids": [tx_id for tx_id, confirmed in confirmed_in_round.items() if confirmed == round_num]}
+
+    algod.status_after_block.side_effect = status_after_block
+    algod.pending_transaction_info.side_effect = pending_transaction_info
+    algod.get_block_txids.side_effect = get_block_txids
+    return algod
+
+
+def test_resolves_many_groups_with_a_single_round_follower() -> None:
+    algod = _mock_algod({"a1": 11, "a2": 11, "b1": 13, "c1": 12, "c2": 12, "c3": 12})
+
+    with ConfirmationTracker(algod) as tracker:
+        futures = [tracker.track(["a1", "a2"]), tracker.track(["b1"]), tracker.track(["c1", "c2", "c3"])]
+        results = [future.result(timeout=5) for future in futures]
+
+    assert [[c["txid"] for c in result] for result in results] == [["a1", "a2"], ["b1"], ["c1", "c2", "c3"]]
+    assert [[c["confirmed-round"] for c in result] for result in results] == [[11, 11], [13], [12, 12, 12]]
+    # One status call, then one status_after_block and one block fetch per round, shared by every group
+    assert algod.status.call_count == 1
+    assert algod.status_after_block.call_count == 3
+    assert algod.get_block_txids.call_count == 3
+    # Pending info is only fetched when a group is first tracked and once its transactions are in a block
+    assert algod.pending_transaction_info.call_count == 3 + 6
+    assert tracker.pending_count == 0
+
+
+def test_fails_rejected_groups() -> None:
+    algod = _mock_algod({"a1": 11}, pool_errors={"b1": "overspend"})
+
+    with ConfirmationTracker(algod) as tracker:
+        confirmed = tracker.track(["a1"])
+        rejected = tracker.track(["b1"])
+
+        with pytest.raises(error.TransactionRejectedError, match="overspend"):
+            rejected.result(timeout=5)
+        assert confirmed.result(timeout=5)[0]["confirmed-round"] == 11
+
+
+def test_times_out_after_max_rounds_to_wait() -> None:
+    algod = _mock_algod({})
+
+    with ConfirmationTracker(algod) as tracker, pytest.raises(error.ConfirmationTimeoutError, match="missing"):
+        tracker.wait(["missing"], max_rounds_to_wait=3)
+
+    assert algod.status_after_block.call_count == 3
+
+
+def test_restarts_after_going_idle() -> None:
+    algod = _mock_algod({"a1": 11, "b1": 12})
+    tracker = ConfirmationTracker(algod)
+
+    assert tracker.wait(["a1"])[0]["confirmed-round"] == 11
+    assert tracker.wait(["b1"])[0]["confirmed-round"] == 12
+    tracker.close()
+
+
+def test_retries_following_the_chain_and_only_fails_groups_whose_lookup_fails() -> None:
+    algod = _mock_algod({"a1": 12})
+    follow_chain = algod.status_after_block.side_effect
+    failures = iter([ConnectionError("connection reset"), TimeoutError("timed out")])
+
+    def flaky_status_after_block(round_num: int) -> dict[str, Any]:
+        failure = next(failures, None)
+        if failure is not None:
+            raise failure
+        return cast(dict[str, Any], follow_chain(round_num))
+
+    get_pending_info = algod.pending_transaction_info.side_effect
+
+    def pending_transaction_info(tx_id: str) -> dict[str, Any]:
+        if tx_id == "broken":
+            raise RuntimeError("lookup failed")
+        return cast(dict[str, Any], get_pending_info(tx_id))
+
+    algod.status_after_block.side_effect = flaky_status_after_block
+    algod.pending_transaction_info.side_effect = pending_transaction_info
+
+    with ConfirmationTracker(algod, retry_interval=0) as tracker:
+        confirmed = tracker.track(["a1"])
+        broken = tracker.track(["broken"])
+
+        with pytest.raises(RuntimeError, match="lookup failed"):
+            broken.result(timeout=5)
+        assert confirmed.result(timeout=5)[0]["confirmed-round"] == 12
+
+    assert algod.status_after_block.call_count == 4
+
+
+def test_polls_every_group_when_blocks_cant_be_fetched() -> None:
+    algod = _mock_algod({"a1": 11, "b1": 12})
+    algod.get_block_txids.side_effect = error.AlgodHTTPError("not found", 404)
+
+    with ConfirmationTracker(algod) as tracker:
+        futures = [tracker.track(["a1"]), tracker.track(["b1"])]
+        assert [future.result(timeout=5)[0]["confirmed-round"] for future in futures] == [11, 12]
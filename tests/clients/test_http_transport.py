@@ -0,0 +1,56 @@
+import algosdk
+import pytest
+from pytest_httpx._httpx_mock import HTTPXMock
+
+from algokit_utils.algorand import AlgorandClient
+from algokit_utils.clients.http_transport import (
+    HttpTransportConfig,
+    PooledAlgodClient,
+    PooledIndexerClient,
+    PooledKMDClient,
+)
+from algokit_utils.models.network import AlgoClientNetworkConfig
+
+
+def test_pooled_algod_client_mirrors_algosdk(httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(url="http://algod/v2/status", json={"last-round": 7})
+    httpx_mock.add_response(url="http://algod/v2/status", status_code=400, json={"message": "bad", "data": {"a": 1}})
+
+    with PooledAlgodClient("token", "http://algod") as algod:
+        assert algod.status() == {"last-round": 7}
+        with pytest.raises(algosdk.error.AlgodHTTPError, match="bad") as e:
+            algod.status()
+
+    assert e.value.code == 400
+    assert e.value.data == {"a": 1}
+    request = httpx_mock.get_requests()[0]
+    assert request.headers["X-Algo-API-Token"] == "token"
+    assert request.headers["User-Agent"] == "py-algorand-sdk"
+
+
+def test_pooled_indexer_and_kmd_clients_mirror_algosdk(httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(url="http://indexer/health", json={"b": {"d": 1, "c": 2}, "a": 0})
+    httpx_mock.add_response(url="http://kmd/v1/wallets", json={"wallets": []})
+    httpx_mock.add_response(url="http://kmd/v1/wallets", status_code=401, json={"message": "unauthorized"})
+
+    with PooledIndexerClient("", "http://indexer") as indexer:
+        health = indexer.health()  # type: ignore[no-untyped-call]
+    assert list(health) == ["a", "b"]
+    assert list(health["b"]) == ["c", "d"]
+
+    with PooledKMDClient("token", "http://kmd") as kmd:
+        assert kmd.list_wallets() == []
+        with pytest.raises(algosdk.error.KMDHTTPError, match="unauthorized"):
+            kmd.list_wallets()
+
+
+def test_from_config_installs_the_pooled_transport() -> None:
+    config = AlgoClientNetworkConfig(server="http://localhost", port=4001)
+
+    pooled = AlgorandClient.from_config(config, config, config, http_transport=HttpTransportConfig(max_connections=4))
+    default = AlgorandClient.from_config(config)
+
+    assert isinstance(pooled.client.algod, PooledAlgodClient)
+    assert isinstance(pooled.client.indexer, PooledIndexerClient)
+    assert isinstance(pooled.client.kmd, PooledKMDClient)
+    assert type(default.client.algod) is algosdk.v2client.algod.AlgodClient
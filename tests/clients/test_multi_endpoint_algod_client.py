@@ -0,0 +1,133 @@
+import asyncio
+from typing import cast
+from unittest.mock import Mock, patch
+from urllib.error import URLError
+
+import algosdk
+import httpx
+import pytest
+from algosdk.v2client.algod import AlgodClient
+from pytest_httpx._httpx_mock import HTTPXMock
+
+from algokit_utils.algorand import AlgorandClient
+from algokit_utils.clients.multi_endpoint_algod_client import MultiEndpointAlgodClient
+from algokit_utils.models.network import AlgoClientNetworkConfig
+
+
+def _endpoint(address: str) -> AlgodClient:
+    client = AlgodClient("", address)
+    client.algod_request = Mock(return_value={"address": address, "txId": address})  # type: ignore[method-assign]
+    return client
+
+
+def _address(response: object) -> str:
+    return cast(dict[str, str], response)["address"]
+
+
+def test_reads_are_spread_by_latency_and_submissions_go_to_the_primary() -> None:
+    primary, replica = _endpoint("http://primary"), _endpoint("http://replica")
+    algod = MultiEndpointAlgodClient([primary, replica])
+    clock = [0.0]
+
+    def respond_after(client: AlgodClient, latency: float) -> None:
+        response = client.algod_request.return_value  # type: ignore[attr-defined]
+
+        def request(*_: object) -> object:
+            clock[0] += latency
+            return response
+
+        client.algod_request.side_effect = request  # type: ignore[attr-defined]
+
+    respond_after(primary, 1)
+    respond_after(replica, 0.1)
+
+    with patch("algokit_utils.clients.multi_endpoint_algod_client.time.monotonic", lambda: clock[0]):
+        # Nodes without a latency yet are tried first
+        addresses = {_address(algod.status()) for _ in range(2)}
+        assert addresses == {"http://primary", "http://replica"}
+        # Once both have been observed every read goes to the faster replica
+        assert all(_address(algod.account_info("A")) == "http://replica" for _ in range(5))
+
+    assert algod.send_raw_transaction("AA==") == "http://primary"
+    assert _address(algod.pending_transaction_info("TX")) == "http://primary"
+
+
+def test_failed_nodes_are_ejected_and_requests_fail_over() -> None:
+    primary, replica = _endpoint("http://primary"), _endpoint("http://replica")
+    primary.algod_request.side_effect = URLError("connection refused")  # type: ignore[attr-defined]
+    algod = MultiEndpointAlgodClient([primary, replica], eject_seconds=60)
+
+    assert _address(algod.pending_transaction_info("TX")) == "http://replica"
+    assert algod.healthy_endpoints == [replica]
+    assert _address(algod.status()) == "http://replica"
+    assert primary.algod_request.call_count == 1  # type: ignore[attr-defined]
+
+    # Ejected nodes are still tried when every node has failed
+    replica.algod_request.side_effect = algosdk.error.AlgodHTTPError("unavailable", 503)  # type: ignore[attr-defined]
+    with pytest.raises(URLError):
+        algod.status()
+    assert algod.healthy_endpoints == []
+
+
+def test_submissions_only_fail_over_when_unsent() -> None:
+    primary, replica = _endpoint("http://primary"), _endpoint("http://replica")
+    primary.algod_request.side_effect = URLError("connection refused")  # type: ignore[attr-defined]
+    algod = MultiEndpointAlgodClient([primary, replica])
+
+    assert algod.send_raw_transaction("AA==") == "http://replica"
+
+    # The primary may have accepted a submission that timed out or failed on the node
+    for node_error in (TimeoutError("timed out"), algosdk.error.AlgodHTTPError("unavailable", 503)):
+        primary, replica = _endpoint("http://primary"), _endpoint("http://replica")
+        primary.algod_request.side_effect = node_error  # type: ignore[attr-defined]
+        algod = MultiEndpointAlgodClient([primary, replica])
+
+        with pytest.raises(type(node_error)):
+            algod.send_raw_transaction("AA==")
+        replica.algod_request.assert_not_called()  # type: ignore[attr-defined]
+        assert algod.healthy_endpoints == [replica]
+
+
+def test_request_errors_are_not_failed_over() -> None:
+    primary, replica = _endpoint("http://primary"), _endpoint("http://replica")
+    primary.algod_request.side_effect = algosdk.error.AlgodHTTPError("overspend", 400)  # type: ignore[attr-defined]
+    algod = MultiEndpointAlgodClient([primary, replica])
+
+    with pytest.raises(algosdk.error.AlgodHTTPError, match="overspend"):
+        algod.send_raw_transaction("AA==")
+
+    replica.algod_request.assert_not_called()  # type: ignore[attr-defined]
+    assert algod.healthy_endpoints == [primary, replica]
+
+
+def test_from_config_accepts_several_algod_endpoints() -> None:
+    algorand = AlgorandClient.from_config(
+        [AlgoClientNetworkConfig(server="http://primary"), AlgoClientNetworkConfig(server="http://replica")]
+    )
+
+    algod = algorand.client.algod
+    assert isinstance(algod, MultiEndpointAlgodClient)
+    assert [e.algod_address for e in algod.endpoints] == ["http://primary", "http://replica"]
+    assert algod.algod_address == "http://primary"
+
+
+def test_async_algod_routes_over_every_endpoint(httpx_mock: HTTPXMock) -> None:
+    algorand = AlgorandClient.from_config(
+        [AlgoClientNetworkConfig(server="http://primary"), AlgoClientNetworkConfig(server="http://replica")],
+        coalesce_reads=True,
+    )
+    algod = cast(MultiEndpointAlgodClient, algorand.client.algod.algod)  # type: ignore[attr-defined]
+    httpx_mock.add_exception(
+        httpx.ConnectError("connection refused"), url="http://primary/v2/transactions/pending/TX?format=json"
+    )
+    httpx_mock.add_response(url="http://replica/v2/transactions/pending/TX?format=json", json={"pool-error": ""})
+    httpx_mock.add_response(url="http://replica/v2/transactions", method="POST", json={"txId": "TX"})
+
+    async def requests() -> tuple[object, str]:
+        async_algod = algorand.client.async_algod
+        pending = await async_algod.pending_transaction_info("TX")
+        # The primary is ejected, and health is shared with the sync client
+        assert algod.healthy_endpoints == [algod.endpoints[1]]
+        return pending, await async_algod.send_raw_transaction("AA==")
+
+    assert asyncio.run(requests()) == ({"pool-error": ""}, "TX")
@@ -0,0 +1,100 @@
+import asyncio
+import email.utils
+from datetime import datetime, timedelta, timezone
+
+import algosdk
+import pytest
+from pytest_httpx._httpx_mock import HTTPXMock
+
+from algokit_utils.algorand import AlgorandClient
+from algokit_utils.clients.http_transport import HttpTransportConfig, PooledAlgodClient
+from algokit_utils.clients.rate_limiter import RateLimiter
+from algokit_utils.models.network import AlgoClientNetworkConfig
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> _FakeClock:
+    clock = _FakeClock()
+    monkeypatch.setattr("algokit_utils.clients.rate_limiter.time.monotonic", clock.monotonic)
+    monkeypatch.setattr("algokit_utils.clients.rate_limiter.time.sleep", clock.sleep)
+    return clock
+
+
+def test_requests_are_paced_per_endpoint(clock: _FakeClock) -> None:
+    limiter = RateLimiter(requests_per_second=10, burst=2)
+
+    for _ in range(4):
+        limiter.acquire("https://mainnet-api.algonode.cloud/v2/status")
+    # The burst is used straight away, then requests are spread 0.1s apart
+    assert clock.now == pytest.approx(1000.2)
+
+    limiter.acquire("https://mainnet-idx.algonode.cloud/v2/accounts")
+    assert clock.now == pytest.approx(1000.2)
+
+
+def test_throttled_endpoints_pause_and_slow_down(clock: _FakeClock) -> None:
+    limiter = RateLimiter(requests_per_second=10, burst=1, recovery_seconds=10)
+    url = "https://testnet-api.algonode.cloud/v2/status"
+
+    limiter.throttle(url, 0, "2")
+    limiter.acquire(url)
+    assert clock.now == pytest.approx(1002)
+    # Slower than the full rate straight after being throttled, recovering to it over `recovery_seconds`
+    limiter.acquire(url)
+    assert clock.now - 1002 > 0.15
+
+    clock.now += 10
+    limiter.acquire(url)
+    limiter.acquire(url)
+    assert clock.sleeps[-1] == pytest.approx(0.1)
+
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=120)
+    limiter.throttle(url, 0, email.utils.format_datetime(retry_at, usegmt=True))
+    start = clock.now
+    limiter.acquire(url)
+    # Capped at `max_retry_after`
+    assert clock.now - start == pytest.approx(60)
+    assert limiter.throttled == 2
+
+
+def test_pooled_clients_retry_throttled_requests(clock: _FakeClock, httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(url="http://algod/v2/status", status_code=429, headers={"Retry-After": "1"})
+    httpx_mock.add_response(url="http://algod/v2/status", status_code=429)
+    httpx_mock.add_response(url="http://algod/v2/status", json={"last-round": 7})
+    httpx_mock.add_response(url="http://algod/v2/status", status_code=429, is_reusable=True)
+
+    transport = HttpTransportConfig.algonode(requests_per_second=100)
+    assert transport.rate_limiter is not None
+    with PooledAlgodClient("", "http://algod", transport=transport) as algod:
+        assert algod.status() == {"last-round": 7}
+        assert clock.now - 1000 >= 2
+
+        with pytest.raises(algosdk.error.AlgodHTTPError) as e:
+            algod.status()
+    assert e.value.code == 429
+    assert len(httpx_mock.get_requests()) == 3 + 1 + transport.rate_limiter.max_retries
+
+
+def test_async_algod_shares_the_transport_rate_limiter(httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(url="http://algod/v2/status", status_code=429, headers={"Retry-After": "0"})
+    httpx_mock.add_response(url="http://algod/v2/status", json={"last-round": 7})
+
+    transport = HttpTransportConfig.algonode(requests_per_second=1000)
+    algorand = AlgorandClient.from_config(AlgoClientNetworkConfig(server="http://algod"), http_transport=transport)
+
+    assert asyncio.run(algorand.client.async_algod.status()) == {"last-round": 7}
+    assert transport.rate_limiter is not None
+    assert transport.rate_limiter.throttled == 1
@@ -0,0 +1,124 @@
+import asyncio
+import base64
+import copy
+import threading
+from unittest.mock import Mock
+
+import algosdk
+import pytest
+from algosdk.transaction import SuggestedParams
+
+from algokit_utils.algorand import AlgorandClient
+from algokit_utils.clients.suggested_params_refresher import SuggestedParamsRefresher
+from algokit_utils.models.amount import AlgoAmount
+from algokit_utils.transactions.transaction_composer import PaymentParams
+
+
+def _suggested_params(round_number: int) -> SuggestedParams:
+    return SuggestedParams(
+        fee=0,
+        first=round_number,
+        last=round_number + 1000,
+        gh=base64.b64encode(bytes(32)).decode(),
+        gen="testnet-v1.0",
+        min_fee=1000,
+    )
+
+
+def _algod_following_blocks() -> tuple[Mock, threading.Semaphore]:
+    """An algod mock whose suggested params advance one round each time the returned semaphore is released.
+
+    Waiting for a block otherwise times out, so the refresher can be closed at any point.
+    """
+    algod = Mock()
+    next_block = threading.Semaphore(0)
+    rounds = iter(range(1, 1000))
+    algod.suggested_params.side_effect = lambda: _suggested_params(next(rounds))
+
+    def status_after_block(round_number: int) -> dict[str, int]:
+        if not next_block.acquire(timeout=0.05):
+            raise TimeoutError
+        return {"last-round": round_number + 1}
+
+    algod.status_after_block.side_effect = status_after_block
+    return algod, next_block
+
+
+def test_snapshots_are_refreshed_in_the_background_and_immutable() -> None:
+    algod, next_block = _algod_following_blocks()
+
+    with SuggestedParamsRefresher(algod, retry_interval=0) as refresher:
+        first = refresher.get()
+        assert first.first in (1, 2)
+        with pytest.raises(AttributeError, match="copy them first"):
+            first.fee = 1
+
+        next_block.release()
+        for _ in range(100):
+            if refresher.get().first > first.first:
+                break
+            threading.Event().wait(0.01)
+        assert refresher.get().first > first.first
+
+    copied = copy.copy(first)
+    copied.fee = 1
+    assert type(copied) is SuggestedParams
+
+
+def test_stale_snapshots_are_fetched_on_the_calling_thread() -> None:
+    algod = Mock()
+    algod.suggested_params.return_value = _suggested_params(6)
+    algod.status_after_block.side_effect = Exception("unreachable")
+
+    with SuggestedParamsRefresher(algod, max_age=0, retry_interval=60) as refresher:
+        assert refresher.update(_suggested_params(5)).first == 5
+        # Older params never replace newer ones
+        assert refresher.update(_suggested_params(4)).first == 5
+        assert refresher.current is None
+        assert refresher.get().first == 6
+
+    assert algod.suggested_params.call_count == 1
+
+
+def test_getting_params_async_starts_the_background_refresh() -> None:
+    algod, _ = _algod_following_blocks()
+    algorand = AlgorandClient.from_clients(algod)
+
+    with SuggestedParamsRefresher(algod) as refresher:
+        algorand.set_suggested_params_refresher(refresher)
+        refresher.update(_suggested_params(1))
+
+        assert asyncio.run(algorand.get_suggested_params_async()).first == 1
+        for _ in range(100):
+            if algod.status_after_block.called:
+                break
+            threading.Event().wait(0.01)
+        algod.status_after_block.assert_called_with(1)
+
+
+def test_composers_build_from_shared_snapshots() -> None:
+    algod, next_block = _algod_following_blocks()
+    algorand = AlgorandClient.from_clients(algod)
+    account = algorand.account.random()
+
+    with SuggestedParamsRefresher(algod) as refresher:
+        algorand.set_suggested_params_refresher(refresher)
+        txn = (
+            algorand.new_group()
+            .add_payment(
+                PaymentParams(
+                    sender=account.address,
+                    receiver=account.address,
+                    amount=AlgoAmount.from_micro_algo(1),
+                    validity_window=10,
+                )
+            )
+            .build_transactions()
+            .transactions[0]
+        )
+        assert isinstance(txn, algosdk.transaction.PaymentTxn)
+        assert txn.last_valid_round == txn.first_valid_round + 10
+
+        params = algorand.get_suggested_params()
+        params.fee = 5
+        assert refresher.get().fee == 0
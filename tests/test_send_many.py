@@ -0,0 +1,92 @@
+import asyncio
+import base64
+import threading
+import time
+from typing import Any
+from unittest.mock import AsyncMock, Mock
+
+import algosdk
+import pytest
+
+from algokit_utils import AlgorandClient
+from algokit_utils.models.account import SigningAccount
+from algokit_utils.models.amount import AlgoAmount
+from algokit_utils.transactions.transaction_composer import PaymentParams, SendAtomicTransactionComposerResults
+
+SP = algosdk.transaction.SuggestedParams(
+    fee=0, first=1, last=1001, gh=base64.b64encode(bytes(32)).decode(), min_fee=1000, flat_fee=False
+)
+
+
+def _pending_transaction_info(tx_id: str) -> dict[str, Any]:
+    return {"pool-error": "", "confirmed-round": 2, "txid": tx_id}
+
+
+def _payments(account: SigningAccount, amounts: list[int]) -> list[PaymentParams]:
+    return [
+        PaymentParams(sender=account.address, receiver=account.address, amount=AlgoAmount.from_micro_algo(amount))
+        for amount in amounts
+    ]
+
+
+@pytest.fixture
+def account() -> SigningAccount:
+    return SigningAccount(private_key=algosdk.account.generate_account()[0])
+
+
+def test_send_many_returns_results_and_errors_in_order(account: SigningAccount) -> None:
+    algod = Mock()
+    algod.suggested_params.return_value = SP
+    algod.status.return_value = {"last-round": 2}
+    algod.status_after_block.return_value = {"last-round": 2}
+    algod.pending_transaction_info.side_effect = _pending_transaction_info
+    in_flight = {"now": 0, "max": 0}
+    lock = threading.Lock()
+
+    def send_raw_transaction(encoded: bytes) -> str:
+        with lock:
+            in_flight["now"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        time.sleep(0.01)
+        with lock:
+            in_flight["now"] -= 1
+        stxn = algosdk.encoding.msgpack_decode(encoded.decode())
+        if stxn.transaction.amt == 3:
+            raise algosdk.error.AlgodHTTPError("overspend", 400)
+        return ""
+
+    algod.send_raw_transaction.side_effect = send_raw_transaction
+    algorand = AlgorandClient.from_clients(algod=algod).set_signer_from_account(account)
+    payments = _payments(account, list(range(1, 9)))
+
+    results = algorand.send_many(iter(payments), max_concurrency=3)
+
+    assert in_flight["max"] <= 3
+    assert isinstance(results[2], algosdk.error.AlgodHTTPError)
+    sent = [r for r in results if isinstance(r, SendAtomicTransactionComposerResults)]
+    assert [r.transactions[0].payment.amt for r in sent] == [1, 2, 4, 5, 6, 7, 8]
+
+
+def test_send_many_async_limits_concurrency(account: SigningAccount) -> None:
+    async_algod = Mock()
+    async_algod.suggested_params = AsyncMock(return_value=SP)
+    async_algod.status = AsyncMock(return_value={"last-round": 2})
+    async_algod.status_after_block = AsyncMock(return_value={"last-round": 2})
+    async_algod.pending_transaction_info = AsyncMock(side_effect=_pending_transaction_info)
+    in_flight = {"now": 0, "max": 0}
+
+    async def send_raw_transaction(_: bytes) -> str:
+        in_flight["now"] += 1
+        in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        await asyncio.sleep(0.01)
+        in_flight["now"] -= 1
+        return ""
+
+    async_algod.send_raw_transaction = send_raw_transaction
+    algorand = AlgorandClient.from_clients(algod=Mock()).set_signer_from_account(account)
+    algorand.client._async_algod = async_algod  # noqa: SLF001
+
+    results = asyncio.run(algorand.send_many_async(_payments(account, list(range(1, 11))), max_concurrency=4))
+
+    assert in_flight["max"] == 4
+    assert [r.transactions[0].payment.amt for r in results] == list(range(1, 11))  # type: ignore[union-attr]
@@ -0,0 +1,291 @@
+import asyncio
+import base64
+import re
+from pathlib import Path
+from unittest.mock import patch
+
+import algosdk
+import httpx
+import pytest
+from pytest_httpx._httpx_mock import HTTPXMock
+
+from algokit_utils.algorand import AlgorandClient
+from algokit_utils.config import config
+from algokit_utils.models.account import SigningAccount
+from algokit_utils.models.amount import AlgoAmount
+from algokit_utils.models.network import AlgoClientNetworkConfig
+from algokit_utils.transactions.transaction_composer import (
+    AppCallMethodCallParams,
+    AppCreateParams,
+    PaymentParams,
+    SendAtomicTransactionComposerResults,
+)
+
+MOCK_ALGOD_URL = "http://algod.test"
+
+
+@pytest.fixture
+def algorand() -> AlgorandClient:
+    return AlgorandClient.default_localnet()
+
+
+@pytest.fixture
+def funded_account(algorand: AlgorandClient) -> SigningAccount:
+    new_account = algorand.account.random()
+    dispenser = algorand.account.localnet_dispenser()
+    algorand.account.ensure_funded(
+        new_account, dispenser, AlgoAmount.from_algo(100), min_funding_increment=AlgoAmount.from_algo(1)
+    )
+    algorand.set_signer(sender=new_account.address, signer=new_account.signer)
+    return new_account
+
+
+def _mock_algod(httpx_mock: HTTPXMock, *, last_round: int = 100, pending_info: dict[str, object] | None = None) -> None:
+    httpx_mock.add_response(
+        url=f"{MOCK_ALGOD_URL}/v2/transactions/params",
+        json={
+            "fee": 0,
+            "last-round": last_round,
+            "genesis-hash": base64.b64encode(bytes(32)).decode(),
+            "genesis-id": "testnet-v1.0",
+            "consensus-version": "future",
+            "min-fee": 1000,
+        },
+        is_reusable=True,
+        is_optional=True,
+    )
+    httpx_mock.add_response(
+        url=f"{MOCK_ALGOD_URL}/v2/status", json={"last-round": last_round}, is_reusable=True, is_optional=True
+    )
+    httpx_mock.add_response(
+        url=re.compile(rf"{MOCK_ALGOD_URL}/v2/status/wait-for-block-after/\d+"),
+        json={"last-round": last_round + 1},
+        is_reusable=True,
+        is_optional=True,
+    )
+    httpx_mock.add_response(
+        url=re.compile(rf"{MOCK_ALGOD_URL}/v2/transactions/pending/\w+\?format=json"),
+        json=pending_info or {"confirmed-round": last_round + 1, "pool-error": ""},
+        is_reusable=True,
+        is_optional=True,
+    )
+
+
+def test_send_async_with_mocked_algod(httpx_mock: HTTPXMock) -> None:
+    _mock_algod(httpx_mock)
+    httpx_mock.add_response(url=f"{MOCK_ALGOD_URL}/v2/transactions", method="POST", json={"txId": "ignored"})
+    algorand = AlgorandClient.from_config(AlgoClientNetworkConfig(server=MOCK_ALGOD_URL, token=""))
+    sender = algorand.account.random()
+
+    async def send() -> SendAtomicTransactionComposerResults:
+        composer = algorand.new_async_group()
+        for amount in (1, 2):
+            composer.add_payment(
+                PaymentParams(sender=sender.address, receiver=sender.address, amount=AlgoAmount.from_micro_algo(amount))
+            )
+        return await composer.send_async()
+
+    result = asyncio.run(send())
+
+    assert len(result.tx_ids) == 2
+    assert result.group_id
+    assert [c["confirmed-round"] for c in result.confirmations] == [101, 101]
+    sent_body = httpx_mock.get_request(url=f"{MOCK_ALGOD_URL}/v2/transactions", method="POST")
+    assert sent_body is not None
+    assert len(sent_body.content) > 0
+
+
+def test_send_async_raises_algod_errors(httpx_mock: HTTPXMock) -> None:
+    _mock_algod(httpx_mock)
+    httpx_mock.add_response(
+        url=f"{MOCK_ALGOD_URL}/v2/transactions", method="POST", status_code=400, json={"message": "overspend"}
+    )
+    algorand = AlgorandClient.from_config(AlgoClientNetworkConfig(server=MOCK_ALGOD_URL, token=""))
+    sender = algorand.account.random()
+
+    composer = algorand.new_async_group()
+    composer.add_payment(
+        PaymentParams(sender=sender.address, receiver=sender.address, amount=AlgoAmount.from_micro_algo(1))
+    )
+
+    with pytest.raises(algosdk.error.AlgodHTTPError, match="overspend"):
+        asyncio.run(composer.send_async())
+
+
+def test_send_async_logs_the_group_as_sent_once_confirmed(httpx_mock: HTTPXMock) -> None:
+    _mock_algod(httpx_mock, pending_info={"pool-error": "overspend"})
+    httpx_mock.add_response(url=f"{MOCK_ALGOD_URL}/v2/transactions", method="POST", json={"txId": "ignored"})
+    algorand = AlgorandClient.from_config(AlgoClientNetworkConfig(server=MOCK_ALGOD_URL, token=""))
+    sender = algorand.account.random()
+
+    composer = algorand.new_async_group()
+    composer.add_payment(
+        PaymentParams(sender=sender.address, receiver=sender.address, amount=AlgoAmount.from_micro_algo(1))
+    )
+
+    with (
+        patch.object(config.logger, "info") as log_info,
+        pytest.raises(algosdk.error.TransactionRejectedError, match="overspend"),
+    ):
+        asyncio.run(composer.send_async())
+
+    # Like `send()`, a group that's rejected while waiting for it isn't logged as sent
+    assert not any("Sent transaction ID" in str(c.args[0]) for c in log_info.call_args_list)
+
+
+def test_send_async_with_skip_waiting_returns_an_awaitable_handle(httpx_mock: HTTPXMock) -> None:
+    _mock_algod(httpx_mock)
+    httpx_mock.add_response(url=f"{MOCK_ALGOD_URL}/v2/transactions", method="POST", json={"txId": "ignored"})
+    algorand = AlgorandClient.from_config(AlgoClientNetworkConfig(server=MOCK_ALGOD_URL, token=""))
+    sender = algorand.account.random()
+
+    async def send() -> tuple[SendAtomicTransactionComposerResults, SendAtomicTransactionComposerResults]:
+        composer = algorand.new_async_group()
+        composer.add_payment(
+            PaymentParams(sender=sender.address, receiver=sender.address, amount=AlgoAmount.from_micro_algo(1))
+        )
+        result = await composer.send_async(skip_waiting=True)
+        assert result.pending is not None
+        return result, await result.pending
+
+    result, confirmed = asyncio.run(send())
+
+    assert result.confirmations == []
+    assert confirmed.tx_ids == result.tx_ids
+    assert [c["confirmed-round"] for c in confirmed.confirmations] == [101]
+
+
+def test_send_async_with_skip_waiting_handle_result_only_blocks_off_the_event_loop(httpx_mock: HTTPXMock) -> None:
+    _mock_algod(httpx_mock)
+    httpx_mock.add_response(url=f"{MOCK_ALGOD_URL}/v2/transactions", method="POST", json={"txId": "ignored"})
+    algorand = AlgorandClient.from_config(AlgoClientNetworkConfig(server=MOCK_ALGOD_URL, token=""))
+    sender = algorand.account.random()
+
+    async def send() -> tuple[SendAtomicTransactionComposerResults, SendAtomicTransactionComposerResults]:
+        composer = algorand.new_async_group()
+        composer.add_payment(
+            PaymentParams(sender=sender.address, receiver=sender.address, amount=AlgoAmount.from_micro_algo(1))
+        )
+        result = await composer.send_async(skip_waiting=True)
+        assert result.pending is not None
+        # Blocking the loop's thread would stop the task confirming the group
+        with pytest.raises(RuntimeError, match="await the pending handle instead"):
+            result.pending.result()
+        confirmed = await asyncio.to_thread(result.pending.result, 5)
+        assert result.pending.done()
+        assert result.pending.result().tx_ids == confirmed.tx_ids
+        return result, confirmed
+
+    result, confirmed = asyncio.run(send())
+
+    assert confirmed.tx_ids == result.tx_ids
+    assert [c["confirmed-round"] for c in confirmed.confirmations] == [101]
+
+
+def test_async_algod_is_usable_across_event_loops(httpx_mock: HTTPXMock) -> None:
+    _mock_algod(httpx_mock)
+    algorand = AlgorandClient.from_config(AlgoClientNetworkConfig(server=MOCK_ALGOD_URL, token=""))
+    async_algod = algorand.client.async_algod
+
+    async def status() -> httpx.AsyncClient:
+        assert await async_algod.status() == {"last-round": 100}
+        return async_algod.http_client
+
+    first = asyncio.run(status())
+    second = asyncio.run(status())
+    assert first is not second
+
+    async def status_and_close() -> httpx.AsyncClient:
+        http_client = await status()
+        await async_algod.close()
+        return http_client
+
+    assert asyncio.run(status_and_close()).is_closed
+
+
+def test_send_async(algorand: AlgorandClient, funded_account: SigningAccount) -> None:
+    async def send() -> SendAtomicTransactionComposerResults:
+        composer = algorand.new_async_group()
+        composer.add_payment(
+            PaymentParams(
+                sender=funded_account.address,
+                receiver=funded_account.address,
+                amount=AlgoAmount.from_algo(1),
+            )
+        )
+        return await composer.send_async()
+
+    response = asyncio.run(send())
+
+    assert len(response.tx_ids) == 1
+    assert response.confirmations[-1]["confirmed-round"] > 0
+
+
+def test_send_async_many_groups_concurrently(algorand: AlgorandClient, funded_account: SigningAccount) -> None:
+    async def send_all() -> list[SendAtomicTransactionComposerResults]:
+        composers = [algorand.new_async_group() for _ in range(5)]
+        for i, composer in enumerate(composers):
+            composer.add_payment(
+                PaymentParams(
+                    sender=funded_account.address,
+                    receiver=funded_account.address,
+                    amount=AlgoAmount.from_micro_algo(i),
+                )
+            )
+        return await asyncio.gather(*(c.send_async() for c in composers))
+
+    responses = asyncio.run(send_all())
+
+    assert len({r.tx_ids[0] for r in responses}) == 5
+    assert all(r.confirmations[0]["confirmed-round"] > 0 for r in responses)
+
+
+def test_send_async_method_call_returns(algorand: AlgorandClient, funded_account: SigningAccount) -> None:
+    artifacts = Path(__file__).parent.parent / "artifacts" / "hello_world"
+    create_result = (
+        algorand.new_group()
+        .add_app_create(
+            AppCreateParams(
+                sender=funded_account.address,
+                approval_program=(artifacts / "approval.teal").read_text(),
+                clear_state_program=(artifacts / "clear.teal").read_text(),
+                schema={"global_ints": 0, "global_byte_slices": 0, "local_ints": 0, "local_byte_slices": 0},
+            )
+        )
+        .send()
+    )
+    app_id = create_result.confirmations[0]["application-index"]
+
+    async def call() -> SendAtomicTransactionComposerResults:
+        composer = algorand.new_async_group()
+        composer.add_app_call_method_call(
+            AppCallMethodCallParams(
+                sender=funded_account.address,
+                app_id=app_id,
+                method=algosdk.abi.Method.from_signature("hello(string)string"),
+                args=["world"],
+            )
+        )
+        return await composer.send_async()
+
+    response = asyncio.run(call())
+
+    assert response.returns[-1].value == "Hello, world"
+
+
+def test_simulate_async(algorand: AlgorandClient, funded_account: SigningAccount) -> None:
+    async def simulate() -> SendAtomicTransactionComposerResults:
+        composer = algorand.new_async_group()
+        composer.add_payment(
+            PaymentParams(
+                sender=funded_account.address,
+                receiver=funded_account.address,
+                amount=AlgoAmount.from_algo(1),
+            )
+        )
+        return await composer.simulate_async(skip_signatures=True)
+
+    response = asyncio.run(simulate())
+
+    assert len(response.transactions) == 1
+    assert response.simulate_response
@@ -0,0 +1,92 @@
+import base64
+from collections.abc import Generator
+from pathlib import Path
+from typing import Any
+from unittest.mock import Mock, patch
+
+import algosdk
+import pytest
+from algosdk.transaction import OnComplete, SuggestedParams
+
+from algokit_utils.models.account import SigningAccount
+from algokit_utils.models.amount import AlgoAmount
+from algokit_utils.models.transaction import SendParams
+from algokit_utils.transactions.transaction_composer import AppCallParams, PaymentParams, TransactionComposer
+
+SP = SuggestedParams(fee=0, first=1, last=1001, gh=base64.b64encode(bytes(32)).decode(), min_fee=1000)
+
+
+@pytest.fixture
+def mock_config() -> Generator[Mock, None, None]:
+    with patch("algokit_utils.transactions.transaction_composer.config", new_callable=Mock) as mock_config:
+        mock_config.debug = True
+        mock_config.project_root = None
+        mock_config.trace_all = False
+        mock_config.populate_app_call_resource = True
+        yield mock_config
+
+
+@pytest.fixture
+def account() -> SigningAccount:
+    return SigningAccount(private_key=algosdk.account.generate_account()[0])
+
+
+def _failed_simulate_response(txn_type: str) -> dict[str, Any]:
+    return {
+        "version": 2,
+        "last-round": 1,
+        "exec-trace-config": {"enable": True, "stack-change": True, "scratch-change": True, "state-change": True},
+        "txn-groups": [
+            {
+                "failed-at": [0],
+                "failure-message": "transaction 0: logic eval error: assert failed",
+                "txn-results": [
+                    {"txn-result": {"txn": {"txn": {"type": txn_type}}, "pool-error": ""}, "exec-trace": {"pc": 1}}
+                ],
+            }
+        ],
+    }
+
+
+@pytest.mark.usefixtures("mock_config")
+def test_failed_execution_info_simulate_explains_the_send_error(account: SigningAccount) -> None:
+    algod = Mock()
+    algod.suggested_params.return_value = SP
+    algod.simulate_transactions.return_value = _failed_simulate_response("appl")
+    composer = TransactionComposer(algod=algod, get_signer=lambda _: account.signer)
+    composer.add_app_call(AppCallParams(sender=account.address, app_id=1, on_complete=OnComplete.NoOpOC))
+
+    with pytest.raises(Exception, match="Error resolving execution info via simulate") as e:
+        composer.send(SendParams(populate_app_call_resources=True))
+
+    assert algod.simulate_transactions.call_count == 1
+    assert algod.simulate_transactions.call_args.args[0].exec_trace_config.enable
+    assert e.value.traces == [  # type: ignore[attr-defined]
+        {
+            "trace": {"pc": 1},
+            "app_budget": None,
+            "app_budget_consumed": None,
+            "failure_message": "transaction 0: logic eval error: assert failed",
+        }
+    ]
+
+
+def test_trace_all_simulate_explains_the_send_error(mock_config: Mock, account: SigningAccount, tmp_path: Path) -> None:
+    mock_config.trace_all = True
+    mock_config.project_root = tmp_path
+    mock_config.trace_buffer_size_mb = 256
+    algod = Mock()
+    algod.suggested_params.return_value = SP
+    algod.simulate_transactions.return_value = _failed_simulate_response("pay")
+    algod.send_raw_transaction.side_effect = algosdk.error.AlgodHTTPError("overspend", 400)
+    composer = TransactionComposer(algod=algod, get_signer=lambda _: account.signer)
+    composer.add_payment(
+        PaymentParams(sender=account.address, receiver=account.address, amount=AlgoAmount.from_micro_algo(1))
+    )
+
+    with pytest.raises(Exception, match="Transaction failed: overspend") as e:
+        composer.send()
+
+    assert algod.simulate_transactions.call_count == 1
+    assert e.value.traces[0]["failure_message"] == "transaction 0: logic eval error: assert failed"  # type: ignore[attr-defined]
+    assert len(list((tmp_path / "debug_traces").iterdir())) == 1
@@ -0,0 +1,97 @@
+import base64
+from unittest.mock import Mock
+
+import algosdk
+import pytest
+from algosdk.atomic_transaction_composer import AtomicTransactionComposer, EmptySigner, TransactionWithSigner
+from algosdk.transaction import ApplicationCallTxn, SuggestedParams
+
+from algokit_utils.transactions.execution_info_cache import ExecutionInfoCache
+from algokit_utils.transactions.transaction_composer import AdditionalAtcContext, prepare_group_for_sending
+
+SENDER = algosdk.encoding.encode_address(bytes(32))
+ACCOUNT = algosdk.encoding.encode_address(bytes([1]) * 32)
+
+
+def _app_call(app_id: int = 1, first: int = 1, app_args: list[bytes] | None = None) -> ApplicationCallTxn:
+    sp = SuggestedParams(
+        fee=1000, first=first, last=first + 1000, gh=base64.b64encode(bytes(32)).decode(), flat_fee=True
+    )
+    return ApplicationCallTxn(SENDER, sp, app_id, 0, app_args=app_args)
+
+
+def _atc(txn: ApplicationCallTxn) -> AtomicTransactionComposer:
+    atc = AtomicTransactionComposer()
+    atc.add_transaction(TransactionWithSigner(txn, EmptySigner()))
+    return atc
+
+
+def test_fingerprint_ignores_validity_rounds() -> None:
+    assert ExecutionInfoCache.fingerprint([_app_call(first=1)]) == ExecutionInfoCache.fingerprint([_app_call(first=50)])
+    assert ExecutionInfoCache.fingerprint([_app_call()]) != ExecutionInfoCache.fingerprint([_app_call(app_id=2)])
+    assert ExecutionInfoCache.fingerprint([_app_call()]) != ExecutionInfoCache.fingerprint(
+        [_app_call(app_args=[b"arg"])]
+    )
+
+
+def test_entries_expire_after_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = [100.0]
+    monkeypatch.setattr("algokit_utils.transactions.execution_info_cache.time.monotonic", lambda: now[0])
+    cache = ExecutionInfoCache(ttl=10)
+    cache.set(b"key", {"txn-groups": []}, [_app_call()])
+
+    now[0] += 9
+    assert cache.get(b"key") == {"txn-groups": []}
+    now[0] += 1
+    assert cache.get(b"key") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_least_recently_used_entries_are_evicted() -> None:
+    cache = ExecutionInfoCache(max_size=2)
+    cache.set(b"a", {"a": 1}, [])
+    cache.set(b"b", {"b": 1}, [])
+    cache.get(b"a")
+    cache.set(b"c", {"c": 1}, [])
+
+    assert cache.get(b"b") is None
+    assert cache.get(b"a") == {"a": 1}
+    assert cache.get(b"c") == {"c": 1}
+
+
+def test_invalidate_by_app_id() -> None:
+    cache = ExecutionInfoCache()
+    cache.set(b"app1", {}, [_app_call(app_id=1)])
+    cache.set(b"app2", {}, [_app_call(app_id=2)])
+
+    cache.invalidate(app_id=1)
+    assert cache.get(b"app1") is None
+    assert cache.get(b"app2") == {}
+
+    cache.invalidate()
+    assert len(cache) == 0
+
+
+def test_prepare_group_for_sending_reuses_cached_simulate_response() -> None:
+    algod = Mock()
+    algod.simulate_transactions.return_value = {
+        "txn-groups": [
+            {
+                "txn-results": [
+                    {"txn-result": {"pool-error": ""}, "unnamed-resources-accessed": {"accounts": [ACCOUNT]}}
+                ],
+            }
+        ]
+    }
+    context = AdditionalAtcContext(execution_info_cache=ExecutionInfoCache())
+
+    prepared = [
+        prepare_group_for_sending(_atc(_app_call(first=first)), algod, True, additional_atc_context=context)  # noqa: FBT003
+        for first in (1, 2, 3)
+    ]
+
+    assert algod.simulate_transactions.call_count == 1
+    for atc in prepared:
+        txn = atc.build_group()[0].txn
+        assert isinstance(txn, ApplicationCallTxn)
+        assert txn.accounts == [ACCOUNT]
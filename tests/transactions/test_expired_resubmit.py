@@ -0,0 +1,90 @@
+import base64
+from unittest.mock import Mock, patch
+
+import algosdk
+import pytest
+from algosdk import error
+
+from algokit_utils.models.account import SigningAccount
+from algokit_utils.models.amount import AlgoAmount
+from algokit_utils.models.transaction import SendParams
+from algokit_utils.transactions.transaction_composer import PaymentParams, TransactionComposer
+
+TXN_DEAD = error.AlgodHTTPError("TransactionPool.Remember: txn dead: round 20 outside of 1--11", 400)
+
+
+def _suggested_params(first: int) -> algosdk.transaction.SuggestedParams:
+    return algosdk.transaction.SuggestedParams(
+        fee=0, first=first, last=first + 1000, gh=base64.b64encode(bytes(32)).decode(), min_fee=1000, flat_fee=False
+    )
+
+
+def _mock_algod(send_errors: list[Exception], last_round: int = 20) -> Mock:
+    algod = Mock()
+    algod.suggested_params.side_effect = [_suggested_params(1), _suggested_params(20)]
+    algod.status.return_value = {"last-round": last_round}
+    algod.send_raw_transaction.side_effect = [*send_errors, ""]
+    algod.pending_transaction_info.side_effect = lambda tx_id: {"pool-error": "", "confirmed-round": 21, "txid": tx_id}
+    return algod
+
+
+def _composer(algod: Mock) -> TransactionComposer:
+    account = SigningAccount(private_key=algosdk.account.generate_account()[0])
+    composer = TransactionComposer(algod=algod, get_signer=lambda _: account.signer, default_validity_window=10)
+    return composer.add_payment(
+        PaymentParams(sender=account.address, receiver=account.address, amount=AlgoAmount.from_micro_algo(1))
+    )
+
+
+def _submitted_first_valid_rounds(algod: Mock) -> list[int]:
+    return [
+        algosdk.encoding.msgpack_decode(c.args[0]).transaction.first_valid_round
+        for c in algod.send_raw_transaction.call_args_list
+    ]
+
+
+def test_rebuilds_and_resubmits_a_dead_group() -> None:
+    algod = _mock_algod([TXN_DEAD])
+    composer = _composer(algod)
+
+    result = composer.send(SendParams(max_resubmits_on_expiry=1))
+
+    assert _submitted_first_valid_rounds(algod) == [1, 20]
+    assert result.transactions[0].raw.first_valid_round == 20
+
+
+def test_stops_resubmitting_once_the_budget_is_spent() -> None:
+    algod = _mock_algod([TXN_DEAD, TXN_DEAD])
+
+    with pytest.raises(error.AlgodHTTPError, match="txn dead"):
+        _composer(algod).send(SendParams(max_resubmits_on_expiry=1))
+
+    assert algod.send_raw_transaction.call_count == 2
+
+
+def test_doesnt_resubmit_by_default() -> None:
+    algod = _mock_algod([TXN_DEAD])
+
+    with pytest.raises(error.AlgodHTTPError, match="txn dead"):
+        _composer(algod).send()
+
+    assert algod.send_raw_transaction.call_count == 1
+
+
+@pytest.mark.parametrize(("last_round", "resubmitted"), [(12, True), (11, False)])
+def test_only_resubmits_timed_out_groups_once_they_have_expired(last_round: int, *, resubmitted: bool) -> None:
+    algod = _mock_algod([], last_round=last_round)
+    algod.send_raw_transaction.side_effect = None
+    timeout = error.ConfirmationTimeoutError("Wait for transaction id timed out")
+
+    with patch(
+        "algokit_utils.transactions.transaction_composer.transaction.wait_for_confirmation",
+        side_effect=[timeout, {"confirmed-round": 21}],
+    ):
+        if resubmitted:
+            _composer(algod).send(SendParams(max_resubmits_on_expiry=1, max_rounds_to_wait=3))
+        else:
+            with pytest.raises(error.ConfirmationTimeoutError):
+                _composer(algod).send(SendParams(max_resubmits_on_expiry=1, max_rounds_to_wait=3))
+
+    assert algod.send_raw_transaction.call_count == (2 if resubmitted else 1)
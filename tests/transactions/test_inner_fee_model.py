@@ -0,0 +1,178 @@
+import base64
+from typing import Any
+from unittest.mock import Mock
+
+import algosdk
+import pytest
+from algosdk.atomic_transaction_composer import AtomicTransactionComposer, EmptySigner, TransactionWithSigner
+from algosdk.transaction import ApplicationCallTxn, OnComplete, SuggestedParams
+
+from algokit_utils.models.account import SigningAccount
+from algokit_utils.models.amount import AlgoAmount
+from algokit_utils.models.transaction import SendParams
+from algokit_utils.transactions.inner_fee_model import InnerFeeModel
+from algokit_utils.transactions.transaction_composer import (
+    AdditionalAtcContext,
+    AppCallParams,
+    TransactionComposer,
+    prepare_group_for_sending,
+)
+
+SENDER = algosdk.encoding.encode_address(bytes(32))
+SP = SuggestedParams(fee=0, first=1, last=1001, gh=base64.b64encode(bytes(32)).decode(), min_fee=1000)
+
+
+def _app_call(app_id: int = 1, app_args: list[bytes] | None = None) -> ApplicationCallTxn:
+    return ApplicationCallTxn(SENDER, SP, app_id, 0, app_args=app_args)
+
+
+def _atc(txn: ApplicationCallTxn) -> AtomicTransactionComposer:
+    atc = AtomicTransactionComposer()
+    atc.add_transaction(TransactionWithSigner(txn, EmptySigner()))
+    return atc
+
+
+def _inner_txns(count: int) -> list[dict[str, Any]]:
+    # Inner transactions without a fee, as they are when the app call covers their fees
+    return [{"txn": {"txn": {"type": "pay"}}} for _ in range(count)]
+
+
+def _simulate_response(inner_txn_count: int) -> dict[str, Any]:
+    inner_txns = _inner_txns(inner_txn_count)
+    return {"txn-groups": [{"txn-results": [{"txn-result": {"pool-error": "", "inner-txns": inner_txns}}]}]}
+
+
+def test_estimates_are_used_once_confident() -> None:
+    model = InnerFeeModel(min_observations=2)
+    txn = _app_call(app_args=[b"\x01\x02\x03\x04arg"])
+
+    model.observe(txn, 2000, 1000)
+    assert model.get(txn, 1000) is None
+    model.observe(_app_call(app_args=[b"\x01\x02\x03\x04other"]), 2000, 1000)
+    assert model.get(txn, 1000) == 2000
+
+    # A different method, app or minimum fee has nothing learned
+    assert model.get(_app_call(app_args=[b"\x05\x06\x07\x08"]), 1000) is None
+    assert model.get(_app_call(app_id=2, app_args=[b"\x01\x02\x03\x04"]), 1000) is None
+    assert model.get(txn, 2000) is None
+
+    # A changed observation starts learning again
+    model.observe(txn, 3000, 1000)
+    assert model.get(txn, 1000) is None
+
+
+def test_forget_and_invalidate() -> None:
+    model = InnerFeeModel(min_observations=1)
+    model.observe(_app_call(app_id=1), 1000, 1000)
+    model.observe(_app_call(app_id=2), 1000, 1000)
+
+    assert model.forget(_app_call(app_id=1))
+    assert not model.forget(_app_call(app_id=1))
+    model.invalidate(app_id=2)
+    assert len(model) == 0
+
+
+def test_prepare_group_for_sending_skips_simulate_once_confident() -> None:
+    algod = Mock()
+    algod.simulate_transactions.return_value = _simulate_response(inner_txn_count=2)
+    context = AdditionalAtcContext(
+        suggested_params=SP,
+        max_fees={0: AlgoAmount.from_micro_algo(5000)},
+        inner_fee_model=InnerFeeModel(min_observations=2),
+    )
+
+    fees = []
+    for _ in range(4):
+        atc = prepare_group_for_sending(_atc(_app_call()), algod, False, True, context)  # noqa: FBT003
+        fees.append(atc.build_group()[0].txn.fee)
+
+    assert algod.simulate_transactions.call_count == 2
+    assert fees == [3000] * 4
+
+
+@pytest.mark.parametrize("skip_waiting", [False, True])
+def test_send_falls_back_to_simulate_when_estimate_is_too_small(*, skip_waiting: bool) -> None:
+    account = SigningAccount(private_key=algosdk.account.generate_account()[0])
+    algod = Mock()
+    algod.suggested_params.return_value = SP
+    algod.status.return_value = {"last-round": 2}
+    algod.status_after_block.return_value = {"last-round": 2}
+    algod.simulate_transactions.return_value = _simulate_response(inner_txn_count=2)
+    algod.pending_transaction_info.side_effect = lambda tx_id: {
+        "pool-error": "",
+        "confirmed-round": 2,
+        "txid": tx_id,
+        "inner-txns": _inner_txns(2),
+    }
+    sent_fees = []
+
+    def send_raw_transaction(encoded: bytes) -> str:
+        fee = algosdk.encoding.msgpack_decode(encoded.decode()).transaction.fee
+        sent_fees.append(fee)
+        if fee < 3000:
+            raise algosdk.error.AlgodHTTPError("logic eval error: fee too small", 400)
+        return ""
+
+    algod.send_raw_transaction.side_effect = send_raw_transaction
+    model = InnerFeeModel(min_observations=1)
+    # The app used to issue one inner transaction
+    model.observe(_app_call(), 1000, 1000)
+    composer = TransactionComposer(algod=algod, get_signer=lambda _: account.signer, inner_fee_model=model)
+    composer.add_app_call(
+        AppCallParams(
+            sender=account.address,
+            app_id=1,
+            on_complete=OnComplete.NoOpOC,
+            max_fee=AlgoAmount.from_micro_algo(5000),
+        )
+    )
+
+    composer.send(
+        SendParams(cover_app_call_inner_transaction_fees=True, populate_app_call_resources=False),
+        skip_waiting=skip_waiting,
+    )
+
+    assert sent_fees == [2000, 3000]
+    assert algod.simulate_transactions.call_count == 1
+    assert model.get(_app_call(), 1000) == 2000
+
+
+def test_each_send_counts_as_one_observation() -> None:
+    account = SigningAccount(private_key=algosdk.account.generate_account()[0])
+    algod = Mock()
+    algod.suggested_params.return_value = SP
+    algod.status.return_value = {"last-round": 2}
+    algod.simulate_transactions.return_value = _simulate_response(inner_txn_count=2)
+    algod.send_raw_transaction.return_value = ""
+    algod.pending_transaction_info.side_effect = lambda tx_id: {
+        "pool-error": "",
+        "confirmed-round": 2,
+        "txid": tx_id,
+        "inner-txns": _inner_txns(2),
+    }
+    model = InnerFeeModel(min_observations=3)
+
+    for _ in range(4):
+        composer = TransactionComposer(algod=algod, get_signer=lambda _: account.signer, inner_fee_model=model)
+        composer.add_app_call(
+            AppCallParams(
+                sender=account.address,
+                app_id=1,
+                on_complete=OnComplete.NoOpOC,
+                max_fee=AlgoAmount.from_micro_algo(5000),
+            )
+        )
+        composer.send(SendParams(cover_app_call_inner_transaction_fees=True, populate_app_call_resources=False))
+
+    # The simulate and the confirmation of a send are a single observation
+    assert algod.simulate_transactions.call_count == 3
+    # Each send looks its estimates up once
+    assert (model.hits, model.misses) == (1, 3)
+    assert model.peek(_app_call(), 1000) == 2000
+    assert (model.hits, model.misses) == (1, 3)
+
+
+@pytest.mark.parametrize("min_observations", [0, -1])
+def test_min_observations_must_be_positive(min_observations: int) -> None:
+    with pytest.raises(ValueError, match="min_observations"):
+        InnerFeeModel(min_observations=min_observations)
@@ -0,0 +1,75 @@
+import base64
+from collections.abc import Generator
+from unittest.mock import Mock
+
+import algosdk
+import pytest
+
+from algokit_utils.config import config
+from algokit_utils.models.account import SigningAccount
+from algokit_utils.models.amount import AlgoAmount
+from algokit_utils.transactions.instrumentation import PhaseTiming, SendPhase
+from algokit_utils.transactions.transaction_composer import PaymentParams, TransactionComposer
+
+
+@pytest.fixture
+def algod() -> Mock:
+    algod = Mock()
+    algod.suggested_params.return_value = algosdk.transaction.SuggestedParams(
+        fee=0, first=1, last=1001, gh=base64.b64encode(bytes(32)).decode(), min_fee=1000, flat_fee=False
+    )
+    algod.status.return_value = {"last-round": 1}
+    algod.pending_transaction_info.side_effect = lambda tx_id: {"confirmed-round": 2, "txid": tx_id}
+    return algod
+
+
+def _send_payments(algod: Mock, count: int) -> None:
+    account = SigningAccount(private_key=algosdk.account.generate_account()[0])
+    composer = TransactionComposer(algod=algod, get_signer=lambda _: account.signer)
+    for _ in range(count):
+        composer.add_payment(
+            PaymentParams(sender=account.address, receiver=account.address, amount=AlgoAmount.from_micro_algo(1))
+        )
+    composer.send()
+
+
+@pytest.fixture(autouse=True)
+def _clear_phase_listener() -> Generator[None, None, None]:
+    config.clear_phase_listener()
+    yield
+    config.clear_phase_listener()
+
+
+def test_send_reports_each_phase(algod: Mock) -> None:
+    timings: list[PhaseTiming] = []
+    config.configure(phase_listener=timings.append)
+
+    _send_payments(algod, 2)
+
+    assert [t.phase for t in timings] == [
+        SendPhase.PARAM_FETCH,
+        SendPhase.BUILD,
+        SendPhase.SIGN,
+        SendPhase.SUBMIT,
+        SendPhase.CONFIRMATION_WAIT,
+        SendPhase.CONFIRMATION_FETCH,
+    ]
+    by_phase = {t.phase: t for t in timings}
+    assert by_phase[SendPhase.BUILD].group_size == 2
+    submitted = base64.b64decode(algod.send_raw_transaction.call_args.args[0])
+    assert by_phase[SendPhase.SUBMIT].size_bytes == len(submitted)
+    assert by_phase[SendPhase.CONFIRMATION_FETCH].count == 1
+    assert all(t.duration >= 0 and not t.failed for t in timings)
+
+    config.clear_phase_listener()
+    assert config.phase_listener is None
+    _send_payments(algod, 1)
+    assert len(timings) == 6
+
+
+def test_failing_phase_listener_does_not_break_sending(algod: Mock) -> None:
+    config.configure(phase_listener=Mock(side_effect=RuntimeError("boom")))
+
+    _send_payments(algod, 1)
+
+    assert algod.send_raw_transaction.call_count == 1
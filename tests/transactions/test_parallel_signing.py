@@ -0,0 +1,78 @@
+import base64
+from unittest.mock import Mock
+
+import algosdk
+from algosdk.atomic_transaction_composer import (
+    AccountTransactionSigner,
+    LogicSigTransactionSigner,
+    TransactionSigner,
+    TransactionWithSigner,
+)
+
+from algokit_utils.models.account import SigningAccount
+from algokit_utils.models.amount import AlgoAmount
+from algokit_utils.transactions.parallel_signing import ParallelSigner
+from algokit_utils.transactions.transaction_composer import PaymentParams, TransactionComposer
+
+SP = algosdk.transaction.SuggestedParams(
+    fee=1000, first=1, last=1001, gh=base64.b64encode(bytes(32)).decode(), flat_fee=True
+)
+
+
+def _group(
+    signers: list[tuple[str, TransactionSigner]],
+) -> list[TransactionWithSigner]:
+    txns = [algosdk.transaction.PaymentTxn(sender, SP, sender, i) for i, (sender, _) in enumerate(signers)]
+    algosdk.transaction.assign_group_id(txns)
+    return [TransactionWithSigner(txn, signer) for txn, (_, signer) in zip(txns, signers, strict=True)]
+
+
+def _encoded(stxns: list[algosdk.transaction.GenericSignedTransaction]) -> list[str]:
+    return [algosdk.encoding.msgpack_encode(stxn) for stxn in stxns]
+
+
+def test_signs_like_the_signers_across_processes() -> None:
+    keys = [algosdk.account.generate_account()[0] for _ in range(3)]
+    addresses = [algosdk.account.address_from_private_key(key) for key in keys]
+    logic_sig = algosdk.transaction.LogicSigAccount(base64.b64decode("CoEBQw=="))  # #pragma version 10; int 1
+    groups = [
+        _group([(addresses[i % 3], AccountTransactionSigner(keys[i % 3])) for i in range(n, n + 4)])
+        + _group([(logic_sig.address(), LogicSigTransactionSigner(logic_sig))])
+        for n in range(10)
+    ]
+    # Rekeyed: the first account's transactions are signed by the second account's key
+    groups.append(_group([(addresses[0], AccountTransactionSigner(keys[1]))]))
+
+    with ParallelSigner(max_workers=2, chunk_size=4) as signer:
+        signed = signer.sign_groups(groups)
+
+    expected = [[stxn for t in group for stxn in t.signer.sign_transactions([t.txn], [0])] for group in groups]
+    assert [_encoded(g) for g in signed] == [_encoded(g) for g in expected]
+    assert signed[-1][0].authorizing_address == addresses[1]  # type: ignore[union-attr]
+
+
+def test_sign_many_matches_signing_each_composer() -> None:
+    algod = Mock()
+    algod.suggested_params.return_value = SP
+    accounts = [SigningAccount(private_key=algosdk.account.generate_account()[0]) for _ in range(2)]
+    signers = {account.address: account.signer for account in accounts}
+
+    def composer(n: int) -> TransactionComposer:
+        composer = TransactionComposer(algod=algod, get_signer=lambda address: signers[address])
+        for account in accounts:
+            composer.add_payment(
+                PaymentParams(sender=account.address, receiver=account.address, amount=AlgoAmount.from_micro_algo(n))
+            )
+        return composer
+
+    with ParallelSigner(max_workers=2, chunk_size=2) as signer:
+        signed = TransactionComposer.sign_many([composer(n) for n in range(5)], parallel_signer=signer)
+
+    assert signed == [composer(n).sign() for n in range(5)]
+
+
+def test_signing_processes_are_spawned_rather_than_forked() -> None:
+    # Forking copies the state of background threads (e.g. the confirmation tracker) into children mid-operation
+    with ParallelSigner(max_workers=1) as signer:
+        executor = signer._get_executor()  # noqa: SLF001
+        assert executor._mp_context.get_start_method() == "spawn"  # type: ignore[union-attr]  # noqa: SLF001
@@ -0,0 +1,122 @@
+import base64
+import io
+from pathlib import Path
+from unittest.mock import Mock
+
+import algosdk
+import msgpack  # type: ignore[import-untyped]
+import pytest
+from algosdk import error
+
+from algokit_utils.models.account import SigningAccount
+from algokit_utils.models.amount import AlgoAmount
+from algokit_utils.transactions.signed_group_batch import (
+    SignedGroup,
+    read_signed_groups,
+    submit_signed_groups,
+    write_signed_groups,
+)
+from algokit_utils.transactions.transaction_composer import PaymentParams, TransactionComposer
+
+
+def _mock_algod(last_round: int = 5) -> Mock:
+    algod = Mock()
+    algod.suggested_params.return_value = algosdk.transaction.SuggestedParams(
+        fee=0, first=1, last=1001, gh=base64.b64encode(bytes(32)).decode(), min_fee=1000, flat_fee=False
+    )
+    algod.status.return_value = {"last-round": last_round}
+    return algod
+
+
+def _signed_group(algod: Mock, payments: int = 1, validity_window: int = 1000) -> SignedGroup:
+    account = SigningAccount(private_key=algosdk.account.generate_account()[0])
+    composer = TransactionComposer(
+        algod=algod, get_signer=lambda _: account.signer, default_validity_window=validity_window
+    )
+    for _ in range(payments):
+        composer.add_payment(
+            PaymentParams(sender=account.address, receiver=account.address, amount=AlgoAmount.from_micro_algo(1))
+        )
+    return composer.sign()
+
+
+def test_sign_encodes_the_group_as_submitted() -> None:
+    group = _signed_group(_mock_algod(), payments=2)
+
+    unpacker = msgpack.Unpacker(io.BytesIO(group.encoded), raw=False)
+    signed = [algosdk.encoding.msgpack_decode(base64.b64encode(msgpack.packb(s)).decode()) for s in unpacker]
+    assert [s.transaction.group for s in signed] == [signed[0].transaction.group] * 2
+    assert group.tx_id == signed[0].get_txid()
+    assert group.last_valid_round == 1001
+
+
+def test_batches_round_trip(tmp_path: Path) -> None:
+    algod = _mock_algod()
+    groups = [_signed_group(algod, payments=n) for n in (1, 2, 3)]
+
+    assert write_signed_groups(tmp_path / "batch.msgpack", iter(groups)) == 3
+    assert list(read_signed_groups(tmp_path / "batch.msgpack")) == groups
+
+
+def test_rejects_files_that_arent_batches() -> None:
+    with pytest.raises(ValueError, match="Not a signed transaction group batch"):
+        list(read_signed_groups(io.BytesIO(msgpack.packb({"format": "other"}))))
+
+
+def test_submits_the_encoded_groups_and_skips_expired_ones() -> None:
+    algod = _mock_algod(last_round=5)
+    valid, expired = _signed_group(algod), _signed_group(algod, validity_window=4)
+    batch = io.BytesIO()
+    write_signed_groups(batch, [valid, expired])
+    batch.seek(0)
+
+    result = submit_signed_groups(algod, batch)
+
+    assert (result.submitted, result.expired, result.failed) == ([valid.tx_id], [expired.tx_id], {})
+    algod.send_raw_transaction.assert_called_once_with(base64.b64encode(valid.encoded))
+
+
+def test_records_failures_when_not_stopping_on_error() -> None:
+    algod = _mock_algod()
+    groups = [_signed_group(algod), _signed_group(algod)]
+    rejected = error.AlgodHTTPError("overspend", 400)
+    algod.send_raw_transaction.side_effect = [rejected, ""]
+    batch = io.BytesIO()
+    write_signed_groups(batch, groups)
+    batch.seek(0)
+
+    result = submit_signed_groups(algod, batch, stop_on_error=False)
+
+    assert result.submitted == [groups[1].tx_id]
+    assert result.failed == {groups[0].tx_id: rejected}
+
+
+def test_refreshes_the_current_round_during_long_batches(monkeypatch: pytest.MonkeyPatch) -> None:
+    algod = _mock_algod(last_round=5)
+    groups = [_signed_group(algod, validity_window=10) for _ in range(3)]
+    # The chain moves past the groups' validity window part way through the batch
+    algod.status.side_effect = [{"last-round": 5}, {"last-round": 5}, {"last-round": 20}, {"last-round": 21}]
+    monkeypatch.setattr("algokit_utils.transactions.signed_group_batch._ROUND_REFRESH_SECONDS", 0)
+    batch = io.BytesIO()
+    write_signed_groups(batch, groups)
+    batch.seek(0)
+
+    result = submit_signed_groups(algod, batch)
+
+    assert result.submitted == [groups[0].tx_id]
+    assert result.expired == [groups[1].tx_id, groups[2].tx_id]
+
+
+def test_sign_transforms_errors() -> None:
+    account = SigningAccount(private_key=algosdk.account.generate_account()[0])
+    composer = TransactionComposer(
+        algod=_mock_algod(),
+        get_signer=lambda _: account.signer,
+        error_transformers=[lambda e: ValueError(f"transformed: {e}")],
+    )
+    composer.add_payment(
+        PaymentParams(sender=account.address, receiver="invalid", amount=AlgoAmount.from_micro_algo(1))
+    )
+
+    with pytest.raises(ValueError, match="transformed"):
+        composer.sign()
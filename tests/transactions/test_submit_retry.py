@@ -0,0 +1,131 @@
+import base64
+import urllib.error
+from typing import Any
+from unittest.mock import Mock
+
+import algosdk
+import httpx
+import pytest
+from algosdk import error
+
+from algokit_utils.models.account import SigningAccount
+from algokit_utils.models.amount import AlgoAmount
+from algokit_utils.models.transaction import SendParams
+from algokit_utils.transactions.submit_retry import SubmitRetryPolicy
+from algokit_utils.transactions.transaction_composer import PaymentParams, TransactionComposer
+
+NO_DELAY = SubmitRetryPolicy(initial_delay=0)
+
+
+def _mock_algod(send_errors: list[Exception], *, accepted_despite_error: bool = False) -> Mock:
+    """Mock algod whose first sends fail with the given errors, and which confirms a group once it has it."""
+    in_pool = {"value": False}
+    algod = Mock()
+    algod.suggested_params.return_value = algosdk.transaction.SuggestedParams(
+        fee=0, first=1, last=1001, gh=base64.b64encode(bytes(32)).decode(), min_fee=1000, flat_fee=False
+    )
+    algod.status.return_value = {"last-round": 1}
+
+    def send_raw_transaction(_: bytes) -> str:
+        if send_errors:
+            in_pool["value"] = accepted_despite_error
+            raise send_errors.pop(0)
+        in_pool["value"] = True
+        return ""
+
+    def pending_transaction_info(tx_id: str) -> dict[str, Any]:
+        if not in_pool["value"]:
+            raise error.AlgodHTTPError("not found", 404)
+        return {"pool-error": "", "confirmed-round": 2, "txid": tx_id}
+
+    algod.send_raw_transaction.side_effect = send_raw_transaction
+    algod.pending_transaction_info.side_effect = pending_transaction_info
+    return algod
+
+
+def _composer(algod: Mock, retry_policy: SubmitRetryPolicy | None) -> TransactionComposer:
+    account = SigningAccount(private_key=algosdk.account.generate_account()[0])
+    composer = TransactionComposer(algod=algod, get_signer=lambda _: account.signer, submit_retry_policy=retry_policy)
+    return composer.add_payment(
+        PaymentParams(sender=account.address, receiver=account.address, amount=AlgoAmount.from_micro_algo(1))
+    )
+
+
+@pytest.mark.parametrize(
+    ("e", "retryable"),
+    [
+        (error.AlgodHTTPError("bad gateway", 502), True),
+        (error.AlgodHTTPError("overspend", 400), False),
+        (urllib.error.URLError("connection refused"), True),
+        (ConnectionResetError(), True),
+        (TimeoutError(), True),
+        (httpx.ConnectError("connection refused"), True),
+        (ValueError("invalid"), False),
+    ],
+)
+def test_retryable_errors(e: Exception, *, retryable: bool) -> None:
+    assert SubmitRetryPolicy().is_retryable(e) is retryable
+
+
+def test_delay_backs_off_up_to_max_delay() -> None:
+    policy = SubmitRetryPolicy(initial_delay=1, backoff_factor=3, max_delay=5, jitter=0)
+
+    assert [policy.get_delay(attempt) for attempt in (1, 2, 3)] == [1, 3, 5]
+
+
+def test_resubmits_the_same_signed_group_after_a_transient_failure() -> None:
+    algod = _mock_algod([error.AlgodHTTPError("bad gateway", 502), ConnectionResetError()])
+
+    result = _composer(algod, NO_DELAY).send()
+
+    assert algod.send_raw_transaction.call_count == 3
+    assert len({c.args[0] for c in algod.send_raw_transaction.call_args_list}) == 1
+    assert result.confirmations[0]["confirmed-round"] == 2  # type: ignore[call-overload]
+
+
+def test_doesnt_resubmit_a_group_the_node_already_has() -> None:
+    algod = _mock_algod([TimeoutError()], accepted_despite_error=True)
+
+    _composer(algod, NO_DELAY).send()
+
+    assert algod.send_raw_transaction.call_count == 1
+
+
+@pytest.mark.parametrize(
+    ("send_errors", "retry_policy"),
+    [
+        ([error.AlgodHTTPError("overspend", 400)], NO_DELAY),
+        ([error.AlgodHTTPError("bad gateway", 502)], None),
+        ([error.AlgodHTTPError("bad gateway", 502)] * 2, SubmitRetryPolicy(max_attempts=2, initial_delay=0)),
+    ],
+)
+def test_raises_when_not_retried(send_errors: list[Exception], retry_policy: SubmitRetryPolicy | None) -> None:
+    algod = _mock_algod(list(send_errors))
+
+    with pytest.raises(error.AlgodHTTPError):
+        _composer(algod, retry_policy).send()
+
+    assert algod.send_raw_transaction.call_count == len(send_errors)
+
+
+def test_retried_waits_only_wait_for_the_remaining_rounds() -> None:
+    algod = _mock_algod([])
+    chain = {"round": 1, "calls": 0}
+    algod.status.side_effect = lambda: {"last-round": chain["round"]}
+    algod.pending_transaction_info.side_effect = lambda tx_id: {"pool-error": "", "confirmed-round": 0, "txid": tx_id}
+
+    def status_after_block(round_num: int) -> dict[str, Any]:
+        chain["calls"] += 1
+        if chain["calls"] == 3:
+            raise ConnectionResetError
+        chain["round"] = round_num
+        return {"last-round": chain["round"]}
+
+    algod.status_after_block.side_effect = status_after_block
+
+    with pytest.raises(error.ConfirmationTimeoutError):
+        _composer(algod, NO_DELAY).send(SendParams(max_rounds_to_wait=5))
+
+    # Two rounds before the failure and the remaining three after it, rather than five more
+    assert chain["round"] == 6
+    assert algod.status_after_block.call_count == 6
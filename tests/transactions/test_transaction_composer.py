@@ -1,11 +1,14 @@
 import base64
+import threading
 from collections.abc import Generator
+from dataclasses import replace
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 from unittest.mock import Mock, patch
 
 import algosdk
 import pytest
+from algosdk.atomic_transaction_composer import AccountTransactionSigner
 from algosdk.transaction import (
     ApplicationCallTxn,
     AssetConfigTxn,
@@ -14,6 +17,7 @@ from algosdk.transaction import (
 )
 
 from algokit_utils.algorand import AlgorandClient
+from algokit_utils.clients.confirmation_tracker import ConfirmationTracker
 from algokit_utils.models.account import MultisigMetadata, SigningAccount
 from algokit_utils.models.amount import AlgoAmount
 from algokit_utils.transactions.transaction_composer import (
@@ -22,9 +26,11 @@ from algokit_utils.transactions.transaction_composer import (
     AssetConfigParams,
     AssetCreateParams,
     AssetTransferParams,
+    MethodCallTemplate,
     PaymentParams,
     SendAtomicTransactionComposerResults,
     TransactionComposer,
+    prepare_group_for_sending,
 )
 
 if TYPE_CHECKING:
@@ -431,6 +437,370 @@ def test_transaction_group_is_sent(algorand: AlgorandClient, funded_account: Sig
     )
 
 
+def test_group_confirmations_are_fetched_once_per_transaction() -> None:
+    account = SigningAccount(private_key=algosdk.account.generate_account()[0])
+    algod = Mock()
+    algod.status.return_value = {"last-round": 1}
+    fetch_threads: set[str] = set()
+
+    def pending_transaction_info(tx_id: str) -> dict[str, Any]:
+        fetch_threads.add(threading.current_thread().name)
+        return {"confirmed-round": 2, "txid": tx_id}
+
+    algod.pending_transaction_info.side_effect = pending_transaction_info
+    composer = TransactionComposer(
+        algod=algod,
+        get_signer=lambda _: account.signer,
+        get_suggested_params=lambda: algosdk.transaction.SuggestedParams(
+            fee=0, first=1, last=1001, gh=base64.b64encode(bytes(32)).decode(), min_fee=1000, flat_fee=False
+        ),
+    )
+    for amount in range(16):
+        composer.add_payment(
+            PaymentParams(sender=account.address, receiver=account.address, amount=AlgoAmount.from_micro_algo(amount))
+        )
+
+    response = composer.send()
+
+    assert algod.pending_transaction_info.call_count == 16
+    assert [c["txid"] for c in response.confirmations] == response.tx_ids
+    # The remaining confirmations are fetched on a bounded pool shared between sends
+    fetch_threads.discard(threading.current_thread().name)
+    assert fetch_threads
+    assert all(name.startswith("algokit-confirmation-fetch") for name in fetch_threads)
+    assert len(fetch_threads) <= 8
+
+
+def test_send_fetches_suggested_params_once() -> None:
+    account = SigningAccount(private_key=algosdk.account.generate_account()[0])
+    algod = Mock()
+    algod.suggested_params.return_value = algosdk.transaction.SuggestedParams(
+        fee=0, first=1, last=1001, gh=base64.b64encode(bytes(32)).decode(), min_fee=1000, flat_fee=False
+    )
+    algod.status.return_value = {"last-round": 1}
+    algod.pending_transaction_info.side_effect = lambda tx_id: {"confirmed-round": 2, "txid": tx_id}
+    composer = TransactionComposer(algod=algod, get_signer=lambda _: account.signer)
+    composer.add_payment(
+        PaymentParams(sender=account.address, receiver=account.address, amount=AlgoAmount.from_micro_algo(1))
+    )
+
+    assert composer.count() == 1
+    composer.send()
+
+    assert algod.suggested_params.call_count == 1
+
+
+def test_send_waits_through_the_confirmation_tracker() -> None:
+    account = SigningAccount(private_key=algosdk.account.generate_account()[0])
+    chain = {"round": 1}
+    algod = Mock()
+    algod.suggested_params.return_value = algosdk.transaction.SuggestedParams(
+        fee=0, first=1, last=1001, gh=base64.b64encode(bytes(32)).decode(), min_fee=1000, flat_fee=False
+    )
+    algod.status.side_effect = lambda: {"last-round": chain["round"]}
+
+    def status_after_block(round_num: int) -> dict[str, Any]:
+        chain["round"] = round_num + 1
+        return {"last-round": chain["round"]}
+
+    algod.status_after_block.side_effect = status_after_block
+    algod.pending_transaction_info.side_effect = lambda tx_id: {
+        "pool-error": "",
+        "confirmed-round": 2 if chain["round"] >= 2 else 0,
+        "txid": tx_id,
+    }
+    payment = PaymentParams(sender=account.address, receiver=account.address, amount=AlgoAmount.from_micro_algo(1))
+
+    with (
+        ConfirmationTracker(algod) as tracker,
+        patch("algokit_utils.transactions.transaction_composer.transaction.wait_for_confirmation") as wait,
+    ):
+        composer = TransactionComposer(algod=algod, get_signer=lambda _: account.signer, confirmation_tracker=tracker)
+        result = composer.add_payment(payment).add_payment(payment).send()
+
+    wait.assert_not_called()
+    assert algod.status_after_block.call_count == 1
+    assert [c["confirmed-round"] for c in result.confirmations] == [2, 2]
+
+
+def test_send_computes_each_transaction_id_once() -> None:
+    account = SigningAccount(private_key=algosdk.account.generate_account()[0])
+    algod = Mock()
+    algod.suggested_params.return_value = algosdk.transaction.SuggestedParams(
+        fee=0, first=1, last=1001, gh=base64.b64encode(bytes(32)).decode(), min_fee=1000, flat_fee=False
+    )
+    algod.status.return_value = {"last-round": 2}
+    algod.pending_transaction_info.side_effect = lambda tx_id: {"pool-error": "", "confirmed-round": 2, "txid": tx_id}
+    payment = PaymentParams(sender=account.address, receiver=account.address, amount=AlgoAmount.from_micro_algo(1))
+    composer = TransactionComposer(algod=algod, get_signer=lambda _: account.signer)
+    composer.add_payment(payment).add_payment(payment).add_payment(payment)
+
+    with patch.object(PaymentTxn, "get_txid", autospec=True, side_effect=PaymentTxn.get_txid) as get_txid:
+        result = composer.send()
+        assert [t.tx_id for t in result.transactions] == result.tx_ids
+
+    assert get_txid.call_count == 3
+
+
+def test_send_with_skip_waiting_returns_a_pending_handle() -> None:
+    account = SigningAccount(private_key=algosdk.account.generate_account()[0])
+    algod = Mock()
+    algod.suggested_params.return_value = algosdk.transaction.SuggestedParams(
+        fee=0, first=1, last=1001, gh=base64.b64encode(bytes(32)).decode(), min_fee=1000, flat_fee=False
+    )
+    algod.status.return_value = {"last-round": 2}
+    algod.status_after_block.return_value = {"last-round": 2}
+    algod.pending_transaction_info.side_effect = lambda tx_id: {"pool-error": "", "confirmed-round": 2, "txid": tx_id}
+    composer = TransactionComposer(algod=algod, get_signer=lambda _: account.signer)
+    composer.add_payment(
+        PaymentParams(sender=account.address, receiver=account.address, amount=AlgoAmount.from_micro_algo(1))
+    )
+
+    result = composer.send(skip_waiting=True)
+
+    assert algod.send_raw_transaction.call_count == 1
+    assert result.confirmations == []
+    assert result.pending is not None
+    confirmed = result.pending.result(timeout=10)
+    assert confirmed.tx_ids == result.tx_ids
+    assert [c["confirmed-round"] for c in confirmed.confirmations] == [2]
+    # Without a tracker the composer doesn't start its own, it polls for the group instead
+    algod.get_block_txids.assert_not_called()
+
+
+def test_built_transactions_are_reused_until_the_composer_changes() -> None:
+    account = SigningAccount(private_key=algosdk.account.generate_account()[0])
+    get_suggested_params = Mock(
+        return_value=algosdk.transaction.SuggestedParams(
+            fee=0, first=1, last=1001, gh=base64.b64encode(bytes(32)).decode(), min_fee=1000, flat_fee=False
+        )
+    )
+    composer = TransactionComposer(
+        algod=Mock(), get_signer=lambda _: account.signer, get_suggested_params=get_suggested_params
+    )
+    payment = PaymentParams(sender=account.address, receiver=account.address, amount=AlgoAmount.from_micro_algo(1))
+    composer.add_payment(payment)
+
+    with patch.object(composer, "_build_payment", wraps=composer._build_payment) as build_payment:  # noqa: SLF001
+        assert composer.count() == 1
+        first = composer.build_transactions().transactions
+        assert build_payment.call_count == 1
+
+        composer.add_payment(payment)
+        assert composer.count() == 2
+        assert build_payment.call_count == 2
+
+        # Grouping returned transactions doesn't affect later builds
+        second = composer.build_transactions().transactions
+        algosdk.transaction.assign_group_id(second)
+        assert first[0] is not second[0]
+        assert first[0].get_txid() == composer.build_transactions().transactions[0].get_txid()
+
+        built = composer.build().transactions
+        assert [t.txn.get_txid() for t in built] == [t.get_txid() for t in second]
+        # The group to sign reuses the built transactions and only attaches their signers
+        assert build_payment.call_count == 2
+        assert all(isinstance(t.signer, AccountTransactionSigner) for t in built)
+        assert get_suggested_params.call_count == 1
+
+        composer.rebuild()
+        assert get_suggested_params.call_count == 2
+        assert build_payment.call_count == 4
+
+
+def test_suggested_params_are_refetched_for_long_lived_composers() -> None:
+    account = SigningAccount(private_key=algosdk.account.generate_account()[0])
+    rounds = iter(range(1, 100))
+    get_suggested_params = Mock(
+        side_effect=lambda: algosdk.transaction.SuggestedParams(
+            fee=0, first=next(rounds), last=1001, gh=base64.b64encode(bytes(32)).decode(), min_fee=1000
+        )
+    )
+    composer = TransactionComposer(
+        algod=Mock(), get_signer=lambda _: account.signer, get_suggested_params=get_suggested_params
+    )
+    payment = PaymentParams(sender=account.address, receiver=account.address, amount=AlgoAmount.from_micro_algo(1))
+    clock = [1000.0]
+
+    with patch("algokit_utils.transactions.transaction_composer.time.monotonic", lambda: clock[0]):
+        composer.add_payment(payment)
+        assert composer.count() == 1
+        clock[0] += 1
+        composer.add_payment(payment)
+        assert composer.count() == 2
+        assert get_suggested_params.call_count == 1
+
+        # Several rounds later the whole group is built with fresh params
+        clock[0] += 10
+        composer.add_payment(payment)
+        built = composer.build().transactions
+        assert [t.txn.first_valid_round for t in built] == [2, 2, 2]
+
+        # Once built the group is kept until it's rebuilt
+        clock[0] += 10
+        assert composer.build().transactions[0].txn.first_valid_round == 2
+        assert get_suggested_params.call_count == 2
+
+
+def test_simulate_many_splits_batched_results_per_composer() -> None:
+    account = SigningAccount(private_key=algosdk.account.generate_account()[0])
+    algod = Mock()
+    algod.simulate_transactions.side_effect = lambda request: {
+        "version": 2,
+        "last-round": 1,
+        "txn-groups": [
+            {"txn-results": [{"txn-result": {"txn": {"txn": {"amt": txn.transaction.amt}}}} for txn in group.txns]}
+            for group in request.txn_groups
+        ],
+    }
+    composers = []
+    for amount in range(5):
+        composer = TransactionComposer(
+            algod=algod,
+            get_signer=lambda _: account.signer,
+            get_suggested_params=lambda: algosdk.transaction.SuggestedParams(
+                fee=0, first=1, last=1001, gh=base64.b64encode(bytes(32)).decode(), min_fee=1000, flat_fee=False
+            ),
+        )
+        for _ in range(amount + 1):
+            composer.add_payment(
+                PaymentParams(
+                    sender=account.address, receiver=account.address, amount=AlgoAmount.from_micro_algo(amount)
+                )
+            )
+        composers.append(composer)
+
+    results = TransactionComposer.simulate_many(composers, skip_signatures=True, max_groups_per_request=2)
+
+    assert algod.simulate_transactions.call_count == 3
+    for amount, (composer, result) in enumerate(zip(composers, results, strict=True)):
+        assert len(result.confirmations) == amount + 1
+        assert all(c["txn"]["txn"]["amt"] == amount for c in result.confirmations)
+        expected = composer.build_transactions().transactions
+        if len(expected) > 1:
+            algosdk.transaction.assign_group_id(expected)
+        assert result.tx_ids == [t.get_txid() for t in expected]
+
+
+@pytest.mark.parametrize(
+    ("signature", "args"),
+    [
+        ("add(uint64,string,byte[])uint64", [1, "two", b"three"]),
+        (f"many({','.join(['uint64'] * 16)})void", list(range(16))),
+    ],
+)
+def test_method_call_template_matches_regular_method_call(signature: str, args: list[Any]) -> None:
+    account = SigningAccount(private_key=algosdk.account.generate_account()[0])
+    signer = account.signer
+    method = algosdk.abi.Method.from_signature(signature)
+    params = AppCallMethodCallParams(
+        sender=account.address,
+        app_id=123,
+        method=method,
+        account_references=[account.address],
+        box_references=[b"box"],
+        note=b"note",
+        static_fee=AlgoAmount.from_micro_algo(2000),
+    )
+
+    def new_composer() -> TransactionComposer:
+        return TransactionComposer(
+            algod=Mock(),
+            get_signer=lambda _: signer,
+            get_suggested_params=lambda: algosdk.transaction.SuggestedParams(
+                fee=0, first=1, last=1001, gh=base64.b64encode(bytes(32)).decode(), min_fee=1000, flat_fee=False
+            ),
+        )
+
+    regular = new_composer().add_app_call_method_call(replace(params, args=args)).build()
+    templated = new_composer().add_method_call_template(MethodCallTemplate(params), args).build()
+
+    assert algosdk.encoding.msgpack_encode(templated.transactions[0].txn) == algosdk.encoding.msgpack_encode(
+        regular.transactions[0].txn
+    )
+    assert templated.transactions[0].signer is signer
+    assert templated.method_calls == {0: method}
+
+
+def test_method_call_template_validates_args() -> None:
+    sender = algosdk.account.generate_account()[1]
+    template = MethodCallTemplate(
+        AppCallMethodCallParams(sender=sender, app_id=1, method=algosdk.abi.Method.from_signature("f(uint64)void"))
+    )
+    with pytest.raises(ValueError, match="takes 1 arguments, but 2 were given"):
+        template.encode_args([1, 2])
+
+    with pytest.raises(ValueError, match="only support ABI value arguments"):
+        MethodCallTemplate(
+            AppCallMethodCallParams(
+                sender=sender, app_id=1, method=algosdk.abi.Method.from_signature("f(account,pay)void")
+            )
+        )
+
+
+def test_submit_pipelines_independent_groups(algorand: AlgorandClient, funded_account: SigningAccount) -> None:
+    pending = [
+        algorand.new_group()
+        .add_payment(PaymentParams(**_get_test_transaction(funded_account, amount=AlgoAmount.from_micro_algo(i))))
+        .submit()
+        for i in range(10)
+    ]
+
+    results = [p.result() for p in pending]
+
+    assert len({r.tx_ids[0] for r in results}) == 10
+    assert all(r.confirmations[0]["confirmed-round"] > 0 for r in results)
+    assert all(p.done() for p in pending)
+
+
+def test_group_resources_respect_reference_limits() -> None:
+    sender = algosdk.account.generate_account()[1]
+    sp = algosdk.transaction.SuggestedParams(
+        fee=1000, first=1, last=1001, gh=base64.b64encode(bytes(32)).decode(), flat_fee=True
+    )
+    atc = algosdk.atomic_transaction_composer.AtomicTransactionComposer()
+    # The first app call only has a single free reference slot
+    atc.add_transaction(
+        algosdk.atomic_transaction_composer.TransactionWithSigner(
+            ApplicationCallTxn(sender, sp, 1, 0, foreign_assets=list(range(100, 107))),
+            algosdk.atomic_transaction_composer.EmptySigner(),
+        )
+    )
+    atc.add_transaction(
+        algosdk.atomic_transaction_composer.TransactionWithSigner(
+            ApplicationCallTxn(sender, sp, 2, 0), algosdk.atomic_transaction_composer.EmptySigner()
+        )
+    )
+    holder = algosdk.account.generate_account()[1]
+    account = algosdk.account.generate_account()[1]
+    algod = Mock()
+    algod.simulate_transactions.return_value = {
+        "txn-groups": [
+            {
+                "txn-results": [{"txn-result": {}}, {"txn-result": {}}],
+                "unnamed-resources-accessed": {
+                    "asset-holdings": [{"account": holder, "asset": 200}],
+                    "accounts": [account],
+                    "boxes": [{"app": 3, "name": base64.b64encode(b"box").decode()}],
+                },
+            }
+        ]
+    }
+
+    first, second = (
+        t.txn for t in prepare_group_for_sending(atc, algod, populate_app_call_resources=True).build_group()
+    )
+
+    assert isinstance(first, ApplicationCallTxn)
+    assert isinstance(second, ApplicationCallTxn)
+    # The asset holding and box both need two slots, so they go to the second app call
+    assert first.accounts == [account]
+    assert second.accounts == [holder]
+    assert second.foreign_assets == [200]
+    assert second.foreign_apps == [3]
+    assert [box.app_index for box in second.boxes] == [1]
+
+
 def test_multisig_single_account(algorand: AlgorandClient, funded_account: SigningAccount) -> None:
     multisig = algorand.account.multisig(
         metadata=MultisigMetadata(